@@ -1,6 +1,10 @@
 import asyncio
+import io
+import os
+import stat
 
 import aiohttp.http_exceptions
+import aiohttp.payload
 import botocore.retryhandler
 import wrapt
 
@@ -32,3 +36,111 @@ class _IOBaseWrapper(wrapt.ObjectProxy):
     def close(self):
         # this stream should not be closed by aiohttp, like 1.x
         pass
+
+
+_FILE_CHUNK_SIZE = 1024 * 1024
+
+
+def _is_file_body(body):
+    """Whether ``body`` is a binary file object for a regular file."""
+    if isinstance(body, io.TextIOBase):
+        return False
+    try:
+        return stat.S_ISREG(os.fstat(body.fileno()).st_mode)
+    except (AttributeError, OSError, ValueError):
+        # io.UnsupportedOperation is an OSError and ValueError
+        return False
+
+
+def _pread_full(fd, size, offset):
+    chunks = []
+    while size:
+        chunk = os.pread(fd, size, offset)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        size -= len(chunk)
+        offset += len(chunk)
+    return b''.join(chunks)
+
+
+class _FileChunkReader:
+    """Reads a file in chunks in the default executor, one chunk ahead.
+
+    Positional reads are used so the file position is left alone and a read
+    still running in the executor can simply be abandoned.
+    """
+
+    def __init__(self, fileobj, chunk_size, offset, size=None):
+        self._fd = fileobj.fileno()
+        self._chunk_size = chunk_size
+        self._offset = offset
+        self._end = None if size is None else offset + size
+        self._pending = None
+
+    def _start_read(self, loop):
+        size = self._chunk_size
+        if self._end is not None:
+            size = min(size, self._end - self._offset)
+        if size <= 0:
+            return None
+        future = loop.run_in_executor(
+            None, _pread_full, self._fd, size, self._offset
+        )
+        self._offset += size
+        return future
+
+    async def read(self):
+        loop = asyncio.get_running_loop()
+        if self._pending is None:
+            self._pending = self._start_read(loop)
+            if self._pending is None:
+                return b''
+        chunk = await self._pending
+        self._pending = self._start_read(loop) if chunk else None
+        return chunk
+
+
+class _FilePayload(aiohttp.payload.Payload):
+    """aiohttp payload for a file body which never reads on the event loop.
+
+    When ``sendfile`` is true and the connection is plain TCP the file is
+    sent with ``loop.sendfile``, otherwise it is read in the default executor
+    with read-ahead.  Like ``_IOBaseWrapper``, the file isn't closed.
+    """
+
+    def __init__(self, value, sendfile=False):
+        self._offset = value.tell()
+        size = os.fstat(value.fileno()).st_size - self._offset
+        super().__init__(value)
+        self._size = max(size, 0)
+        self._sendfile = sendfile
+
+    async def write(self, writer):
+        transport = writer.transport
+        if (
+            self._sendfile
+            and transport is not None
+            and transport.get_extra_info('sslcontext') is None
+        ):
+            loop = asyncio.get_running_loop()
+            try:
+                await loop.sendfile(
+                    transport,
+                    self._value,
+                    self._offset,
+                    self._size,
+                    fallback=False,
+                )
+                return
+            except (NotImplementedError, asyncio.SendfileNotAvailableError):
+                pass
+
+        reader = _FileChunkReader(
+            self._value, _FILE_CHUNK_SIZE, self._offset, self._size
+        )
+        while True:
+            chunk = await reader.read()
+            if not chunk:
+                break
+            await writer.write(chunk)
@@ -1,5 +1,8 @@
+import functools
 import inspect
 
+from botocore.hooks import EventAliaser
+
 try:
     from contextlib import (  # noqa: F401 lgtm[py/unused-import]
         asynccontextmanager,
@@ -23,3 +26,44 @@ async def async_any(items):
             return True
 
     return False
+
+
+# Events emitted for every operation call.  Their names only depend on the
+# service and operation so they're built once instead of on every request.
+_OPERATION_EVENTS = (
+    'provide-client-params',
+    'before-parameter-build',
+    'before-call',
+    'request-created',
+    'choose-signer',
+    'before-sign',
+    'before-send',
+    'request-timing',
+    'response-received',
+    'needs-retry',
+    'after-call',
+    'after-call-error',
+)
+
+
+@functools.lru_cache(maxsize=None)
+def operation_event_names(service_id, operation_name):
+    """Return the per-operation event names keyed by event type.
+
+    ``service_id`` is a :class:`botocore.model.ServiceId`; it is hyphenized
+    once per (service, operation) pair.  The handler lists for these names
+    are cached by the emitter itself and invalidated on (un)registration.
+    """
+    hyphenized = service_id.hyphenize()
+    return {
+        event: f'{event}.{hyphenized}.{operation_name}'
+        for event in _OPERATION_EVENTS
+    }
+
+
+def event_handlers(emitter, event_name):
+    """The handlers ``emitter`` calls for ``event_name``, in order."""
+    if isinstance(emitter, EventAliaser):
+        event_name = emitter._alias_event_name(event_name)
+        emitter = emitter._emitter
+    return tuple(emitter._handlers.prefix_search(event_name))
@@ -0,0 +1,65 @@
+import logging
+
+logger = logging.getLogger(__name__)
+
+# the values accepted by AioConfig(json_backend=...), 'auto' picks the first
+# of FAST_JSON_BACKENDS which is installed
+JSON_BACKENDS = ('json', 'orjson', 'ujson', 'auto')
+FAST_JSON_BACKENDS = ('orjson', 'ujson')
+
+
+class JSONBackend:
+    """A third party JSON codec used instead of the stdlib json module.
+
+    ``loads`` takes the raw UTF-8 body and ``dumps`` returns UTF-8 bytes.
+    Callers fall back to the stdlib when either raises, e.g. for integers
+    which don't fit in 64 bits.
+    """
+
+    def __init__(self, name, loads, dumps):
+        self.name = name
+        self.loads = loads
+        self.dumps = dumps
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.name!r})'
+
+
+def _load_orjson():
+    import orjson
+
+    return JSONBackend('orjson', orjson.loads, orjson.dumps)
+
+
+def _load_ujson():
+    import ujson
+
+    def dumps(obj):
+        return ujson.dumps(obj, escape_forward_slashes=False).encode('utf-8')
+
+    return JSONBackend('ujson', ujson.loads, dumps)
+
+
+_LOADERS = {
+    'orjson': _load_orjson,
+    'ujson': _load_ujson,
+}
+
+
+def get_json_backend(name):
+    """Return the :class:`JSONBackend` for a ``json_backend`` config value.
+
+    Returns None, meaning the stdlib json module, for ``None``, ``'json'``
+    or when the requested codec isn't installed.
+    """
+    if name is None or name == 'json':
+        return None
+
+    candidates = FAST_JSON_BACKENDS if name == 'auto' else (name,)
+    for candidate in candidates:
+        try:
+            return _LOADERS[candidate]()
+        except ImportError:
+            logger.debug('JSON backend %s is not installed', candidate)
+
+    return None
@@ -1,15 +1,20 @@
 import copy
 
 import botocore.parsers
-import botocore.serialize
 from botocore.args import ClientArgsCreator
 
+from ._json import get_json_backend
 from .config import AioConfig
 from .endpoint import AioEndpointCreator
+from .serialize import create_serializer
 from .signers import AioRequestSigner
 
 
 class AioClientArgsCreator(ClientArgsCreator):
+    def __init__(self, *args, transport_registry=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._transport_registry = transport_registry
+
     # NOTE: we override this so we can pull out the custom AioConfig params and
     #       use an AioEndpointCreator
     def get_client_args(
@@ -61,11 +66,14 @@ class AioClientArgsCreator(ClientArgsCreator):
         # aiobotocore addition
         if isinstance(client_config, AioConfig):
             connector_args = client_config.connector_args
+            aio_options = client_config._aio_user_provided_options
         else:
             connector_args = None
+            aio_options = {}
 
-        new_config = AioConfig(connector_args, **config_kwargs)
+        new_config = AioConfig(connector_args, **aio_options, **config_kwargs)
         endpoint_creator = AioEndpointCreator(event_emitter)
+        json_backend = get_json_backend(new_config.json_backend)
 
         endpoint = endpoint_creator.create_endpoint(
             service_model,
@@ -80,10 +88,16 @@ class AioClientArgsCreator(ClientArgsCreator):
             client_cert=new_config.client_cert,
             proxies_config=new_config.proxies_config,
             connector_args=new_config.connector_args,
+            request_timing=new_config.request_timing,
+            parse_offload_threshold=new_config.parse_offload_threshold,
+            parse_executor=new_config.parse_executor,
+            json_backend=json_backend,
+            streaming_xml_parse=new_config.streaming_xml_parse,
+            transport_registry=self._transport_registry,
         )
 
-        serializer = botocore.serialize.create_serializer(
-            protocol, parameter_validation
+        serializer = create_serializer(
+            protocol, parameter_validation, json_backend=json_backend
         )
         response_parser = botocore.parsers.create_parser(protocol)
         return {
@@ -98,3 +112,15 @@ class AioClientArgsCreator(ClientArgsCreator):
             'partition': partition,
             'exceptions_factory': self._exceptions_factory,
         }
+
+    def _compute_socket_options(self, scoped_config, client_config=None):
+        socket_options = super()._compute_socket_options(
+            scoped_config, client_config
+        )
+        # aiobotocore addition: allow extra options such as SO_RCVBUF
+        if (
+            isinstance(client_config, AioConfig)
+            and client_config.socket_options
+        ):
+            socket_options.extend(client_config.socket_options)
+        return socket_options
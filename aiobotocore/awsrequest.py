@@ -5,6 +5,10 @@ from botocore.awsrequest import AWSResponse
 class AioAWSResponse(AWSResponse):
     # Unlike AWSResponse, these return awaitables
 
+    # latency phases of the request, set by AIOHTTPSession when request
+    # timing is enabled
+    timing = None
+
     async def _content_prop(self):
         """Content of the response as bytes."""
 
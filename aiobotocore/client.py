@@ -1,3 +1,5 @@
+import collections
+
 from botocore.awsrequest import prepare_request_dict
 from botocore.client import (
     BaseClient,
@@ -17,6 +19,7 @@ from botocore.utils import get_service_module_name
 from botocore.waiter import xform_name
 
 from . import waiter
+from ._helpers import event_handlers, operation_event_names
 from .args import AioClientArgsCreator
 from .discovery import AioEndpointDiscoveryHandler, AioEndpointDiscoveryManager
 from .httpchecksum import apply_request_checksum
@@ -26,8 +29,38 @@ from .utils import AioS3RegionRedirector
 
 history_recorder = get_global_history_recorder()
 
+# Process wide caches used by client creators with ``cache_models`` set.
+# Service models are keyed by what determines their content and client
+# classes by their service model and the handlers customizing the class.
+# The latter is bounded as sessions registering their own handlers get
+# classes of their own.
+_service_models = {}
+_client_classes = collections.OrderedDict()
+_MAX_CLIENT_CLASSES = 256
+
+
+def _service_model_key(loader, service_name, api_version):
+    return (
+        service_name,
+        api_version,
+        tuple(loader.search_paths),
+        tuple(loader.extras_types),
+    )
+
+
+def is_service_model_cached(loader, service_name, api_version=None):
+    key = _service_model_key(loader, service_name, api_version)
+    return key in _service_models
+
 
 class AioClientCreator(ClientCreator):
+    def __init__(
+        self, *args, transport_registry=None, cache_models=False, **kwargs
+    ):
+        super().__init__(*args, **kwargs)
+        self._transport_registry = transport_registry
+        self._cache_models = cache_models
+
     async def create_client(
         self,
         service_name,
@@ -91,7 +124,41 @@ class AioClientCreator(ClientCreator):
         )
         return service_client
 
+    def _load_service_model(self, service_name, api_version=None):
+        if not self._cache_models:
+            return super()._load_service_model(service_name, api_version)
+        key = _service_model_key(self._loader, service_name, api_version)
+        service_model = _service_models.get(key)
+        if service_model is None:
+            service_model = super()._load_service_model(
+                service_name, api_version
+            )
+            _service_models[key] = service_model
+        return service_model
+
     async def _create_client_class(self, service_name, service_model):
+        if not self._cache_models:
+            return await self._build_client_class(service_name, service_model)
+        service_id = service_model.service_id.hyphenize()
+        handlers = event_handlers(
+            self._event_emitter, 'creating-client-class.%s' % service_id
+        )
+        key = (service_model, handlers)
+        try:
+            cls = _client_classes.get(key)
+        except TypeError:
+            # unhashable handlers, the class can't be shared
+            return await self._build_client_class(service_name, service_model)
+        if cls is None:
+            cls = await self._build_client_class(service_name, service_model)
+            _client_classes[key] = cls
+            if len(_client_classes) > _MAX_CLIENT_CLASSES:
+                _client_classes.popitem(last=False)
+        else:
+            _client_classes.move_to_end(key)
+        return cls
+
+    async def _build_client_class(self, service_name, service_model):
         class_attributes = self._create_methods(service_model)
         py_name_to_operation_name = self._create_name_mapping(service_model)
         class_attributes['_PY_TO_OP_NAME'] = py_name_to_operation_name
@@ -258,6 +325,7 @@ class AioClientCreator(ClientCreator):
             self._loader,
             self._exceptions_factory,
             config_store=self._config_store,
+            transport_registry=self._transport_registry,
         )
         return args_creator.get_client_args(
             service_model,
@@ -323,11 +391,11 @@ class AioBaseClient(BaseClient):
         )
         resolve_checksum_context(request_dict, operation_model, api_params)
 
-        service_id = self._service_model.service_id.hyphenize()
+        event_names = operation_event_names(
+            self._service_model.service_id, operation_name
+        )
         handler, event_response = await self.meta.events.emit_until_response(
-            'before-call.{service_id}.{operation_name}'.format(
-                service_id=service_id, operation_name=operation_name
-            ),
+            event_names['before-call'],
             model=operation_model,
             params=request_dict,
             request_signer=self._request_signer,
@@ -343,9 +411,7 @@ class AioBaseClient(BaseClient):
             )
 
         await self.meta.events.emit(
-            'after-call.{service_id}.{operation_name}'.format(
-                service_id=service_id, operation_name=operation_name
-            ),
+            event_names['after-call'],
             http_response=http,
             parsed=parsed_response,
             model=operation_model,
@@ -367,11 +433,11 @@ class AioBaseClient(BaseClient):
                 operation_model, request_dict
             )
         except Exception as e:
+            event_names = operation_event_names(
+                self._service_model.service_id, operation_model.name
+            )
             await self.meta.events.emit(
-                'after-call-error.{service_id}.{operation_name}'.format(
-                    service_id=self._service_model.service_id.hyphenize(),
-                    operation_name=operation_model.name,
-                ),
+                event_names['after-call-error'],
                 exception=e,
                 context=request_context,
             )
@@ -404,9 +470,11 @@ class AioBaseClient(BaseClient):
         # Emit an event that allows users to modify the parameters at the
         # beginning of the method. It allows handlers to modify existing
         # parameters or return a new set of parameters to use.
-        service_id = self._service_model.service_id.hyphenize()
+        event_names = operation_event_names(
+            self._service_model.service_id, operation_name
+        )
         responses = await self.meta.events.emit(
-            f'provide-client-params.{service_id}.{operation_name}',
+            event_names['provide-client-params'],
             params=api_params,
             model=operation_model,
             context=context,
@@ -414,7 +482,7 @@ class AioBaseClient(BaseClient):
         api_params = first_non_none_response(responses, default=api_params)
 
         await self.meta.events.emit(
-            f'before-parameter-build.{service_id}.{operation_name}',
+            event_names['before-parameter-build'],
             params=api_params,
             model=operation_model,
             context=context,
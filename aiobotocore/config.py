@@ -1,18 +1,86 @@
 import copy
+from concurrent.futures import ThreadPoolExecutor
 
 import botocore.client
 from botocore.exceptions import ParamValidationError
 
+from ._json import JSON_BACKENDS
+
 
 class AioConfig(botocore.client.Config):
-    def __init__(self, connector_args=None, **kwargs):
+    def __init__(
+        self,
+        connector_args=None,
+        socket_options=None,
+        request_timing=None,
+        parse_offload_threshold=None,
+        parse_executor=None,
+        json_backend=None,
+        streaming_xml_parse=None,
+        checksum_offload_threshold=None,
+        **kwargs,
+    ):
         super().__init__(**kwargs)
 
+        # aiobotocore specific options that were explicitly set, so that
+        # merge() can carry them over like botocore does for its own options
+        self._aio_user_provided_options = {
+            k: v
+            for k, v in (
+                ('socket_options', socket_options),
+                ('request_timing', request_timing),
+                ('parse_offload_threshold', parse_offload_threshold),
+                ('parse_executor', parse_executor),
+                ('json_backend', json_backend),
+                ('streaming_xml_parse', streaming_xml_parse),
+                ('checksum_offload_threshold', checksum_offload_threshold),
+            )
+            if v is not None
+        }
+
         self._validate_connector_args(connector_args)
         self.connector_args = copy.copy(connector_args)
         if not self.connector_args:
             self.connector_args = dict()
 
+        # extra (level, optname, value) options applied to every socket the
+        # connector opens, on top of the ones botocore computes
+        self._validate_socket_options(socket_options)
+        self.socket_options = copy.copy(socket_options)
+
+        # record per-request latency phases, see AIOHTTPSession.send
+        self.request_timing = bool(request_timing)
+
+        # response bodies of at least this many bytes are parsed in
+        # parse_executor, a thread pool (the loop's default executor when
+        # None), instead of on the event loop; None disables offloading
+        self._validate_parse_offload(parse_offload_threshold, parse_executor)
+        self.parse_offload_threshold = parse_offload_threshold
+        self.parse_executor = parse_executor
+
+        # codec for json/rest-json bodies: 'json' (stdlib, the default),
+        # 'orjson', 'ujson' or 'auto' for whichever of those is installed.
+        # The stdlib is used when the requested codec isn't installed
+        if json_backend is not None and json_backend not in JSON_BACKENDS:
+            raise ParamValidationError(
+                report=f'json_backend must be one of {JSON_BACKENDS}'
+            )
+        self.json_backend = json_backend
+
+        # parse rest-xml list responses (e.g. S3 ListObjectsV2) while the
+        # body is being received instead of buffering it first; the raw body
+        # is only kept when response-received handlers or the history
+        # recorder need it
+        self.streaming_xml_parse = bool(streaming_xml_parse)
+
+        # chunks of streaming response bodies of at least this many bytes
+        # have their checksum (ChecksumMode='ENABLED') computed in the loop's
+        # default executor; None hashes every chunk on the event loop
+        self._validate_threshold(
+            'checksum_offload_threshold', checksum_offload_threshold
+        )
+        self.checksum_offload_threshold = checksum_offload_threshold
+
         if 'keepalive_timeout' not in self.connector_args:
             # AWS has a 20 second idle timeout:
             # https://forums.aws.amazon.com/message.jspa?messageID=215367
@@ -24,8 +92,61 @@ class AioConfig(botocore.client.Config):
         # Adapted from parent class
         config_options = copy.copy(self._user_provided_options)
         config_options.update(other_config._user_provided_options)
+        config_options.update(self._aio_user_provided_options)
+        config_options.update(
+            getattr(other_config, '_aio_user_provided_options', {})
+        )
         return AioConfig(self.connector_args, **config_options)
 
+    @staticmethod
+    def _validate_socket_options(socket_options):
+        if socket_options is None:
+            return
+
+        if not isinstance(socket_options, (list, tuple)):
+            raise ParamValidationError(
+                report='socket_options must be a list of tuples'
+            )
+
+        for option in socket_options:
+            if (
+                not isinstance(option, tuple)
+                or len(option) != 3
+                or not all(isinstance(v, int) for v in option[:2])
+                or not isinstance(option[2], (int, bytes))
+            ):
+                raise ParamValidationError(
+                    report=f'invalid socket_option: {option}, must be a '
+                    f'(level, optname, value) tuple'
+                )
+
+    @staticmethod
+    def _validate_threshold(name, threshold):
+        if threshold is not None and (
+            not isinstance(threshold, int)
+            or isinstance(threshold, bool)
+            or threshold < 0
+        ):
+            raise ParamValidationError(
+                report=f'{name} must be a non-negative int'
+            )
+
+    @classmethod
+    def _validate_parse_offload(cls, parse_offload_threshold, parse_executor):
+        cls._validate_threshold(
+            'parse_offload_threshold', parse_offload_threshold
+        )
+
+        # the parser and the response dict, whose context holds the client's
+        # objects, are passed as they are so they can't go to a process pool
+        if parse_executor is not None and not isinstance(
+            parse_executor, ThreadPoolExecutor
+        ):
+            raise ParamValidationError(
+                report='parse_executor must be a '
+                'concurrent.futures.ThreadPoolExecutor'
+            )
+
     @staticmethod
     def _validate_connector_args(connector_args):
         if connector_args is None:
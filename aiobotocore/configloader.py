@@ -0,0 +1,39 @@
+import asyncio
+import copy
+import hashlib
+import os
+
+# (parser, path) -> (digest of the contents, parsed)
+_parsed_files = {}
+
+
+def _parse_file(parser, config_filename):
+    path = os.path.expanduser(os.path.expandvars(config_filename))
+    try:
+        with open(path, 'rb') as f:
+            # the modification time and size can't tell apart rewrites of
+            # the same size within the resolution of the file system
+            digest = hashlib.sha256(f.read()).digest()
+    except OSError:
+        # the parser raises ConfigNotFound for us
+        return parser(config_filename)
+
+    key = (parser, path)
+    cached = _parsed_files.get(key)
+    if cached is None or cached[0] != digest:
+        cached = (digest, parser(config_filename))
+        _parsed_files[key] = cached
+    # callers are free to modify the result
+    return copy.deepcopy(cached[1])
+
+
+async def parse_config_file(parser, config_filename):
+    """Parse a config file with ``parser`` in the loop's default executor.
+
+    The parsed contents are cached for the process and reused while the
+    file's contents are unchanged, so that sessions created later only pay
+    for reading and hashing the file.
+    """
+    return await asyncio.get_running_loop().run_in_executor(
+        None, _parse_file, parser, config_filename
+    )
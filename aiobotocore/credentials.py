@@ -3,6 +3,7 @@ import datetime
 import json
 import logging
 import os
+import random
 import subprocess
 from copy import deepcopy
 from hashlib import sha1
@@ -53,15 +54,19 @@ from botocore.credentials import (
 from dateutil.tz import tzutc
 
 from aiobotocore.config import AioConfig
+from aiobotocore.configloader import parse_config_file
 from aiobotocore.utils import (
     AioContainerMetadataFetcher,
     AioInstanceMetadataFetcher,
+    AioJSONFileCache,
 )
 
 logger = logging.getLogger(__name__)
 
 
-def create_credential_resolver(session, cache=None, region_name=None):
+def create_credential_resolver(
+    session, cache=None, region_name=None, concurrent=False
+):
     """Create a default credential resolver.
     This creates a pre-configured credential resolver
     that includes the default lookup chain for
@@ -148,7 +153,9 @@ def create_credential_resolver(session, cache=None, region_name=None):
             ' because profile name was explicitly set.'
         )
 
-    resolver = AioCredentialResolver(providers=providers)
+    resolver = AioCredentialResolver(
+        providers=providers, concurrent=concurrent
+    )
     return resolver
 
 
@@ -249,6 +256,7 @@ class AioRefreshableCredentials(RefreshableCredentials):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._refresh_lock = asyncio.Lock()
+        self._background_refresher = None
 
     # Redeclaring the properties so it doesn't call refresh
     # Have to redeclare setter as we're overriding the getter
@@ -295,6 +303,13 @@ class AioRefreshableCredentials(RefreshableCredentials):
         if not self.refresh_needed(self._advisory_refresh_timeout):
             return
 
+        if self._background_refresher is not None and not self.refresh_needed(
+            self._mandatory_refresh_timeout
+        ):
+            # advisory refreshes are left to the background refresher so
+            # requests never wait on them
+            return
+
         # By this point we need a refresh but its not critical
         if not self._refresh_lock.locked():
             async with self._refresh_lock:
@@ -348,6 +363,12 @@ class AioRefreshableCredentials(RefreshableCredentials):
             logger.warning(msg)
             raise RuntimeError(msg)
 
+    async def _refresh_ahead(self, refresh_in):
+        async with self._refresh_lock:
+            # a mandatory refresh may have happened while we waited
+            if self.refresh_needed(refresh_in):
+                await self._protected_refresh(is_mandatory=False)
+
     async def get_frozen_credentials(self):
         await self._refresh()
         return self._frozen_credentials
@@ -362,6 +383,7 @@ class AioDeferredRefreshableCredentials(AioRefreshableCredentials):
         self._expiry_time = None
         self._time_fetcher = time_fetcher
         self._refresh_lock = asyncio.Lock()
+        self._background_refresher = None
         self.method = method
         self._frozen_credentials = None
 
@@ -371,6 +393,72 @@ class AioDeferredRefreshableCredentials(AioRefreshableCredentials):
         return super().refresh_needed(refresh_in)
 
 
+class AioCredentialRefresher:
+    """Refreshes AioRefreshableCredentials from a background task.
+
+    Credentials are refreshed up to ``jitter`` seconds before their advisory
+    refresh window opens, so that requests signing with them never wait on
+    the refresh.  Refreshes are at least ``retry_interval`` seconds apart,
+    and one that fails or does not extend the expiry is retried after that
+    interval; requests only fall back to refreshing the credentials
+    themselves once the mandatory refresh window is reached.
+    """
+
+    def __init__(self, credentials, jitter=60, retry_interval=30):
+        self._credentials = credentials
+        self._jitter = jitter
+        self._retry_interval = retry_interval
+        self._task = None
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+            self._credentials._background_refresher = self
+
+    def stop(self):
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            self._credentials._background_refresher = None
+        return task
+
+    async def close(self):
+        task = self.stop()
+        if task is not None:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _run(self):
+        while True:
+            refresh_in = self._refresh_in()
+            await asyncio.sleep(self._seconds_until(refresh_in))
+            try:
+                await self._credentials._refresh_ahead(refresh_in)
+            except Exception:
+                # _protected_refresh only raises here when the refreshed
+                # credentials are already expired
+                logger.warning(
+                    "Background credential refresh failed.", exc_info=True
+                )
+            # refreshes that failed or did not extend the expiry are retried
+            await asyncio.sleep(self._retry_interval)
+
+    def _refresh_in(self):
+        return self._credentials._advisory_refresh_timeout + random.uniform(
+            0, self._jitter
+        )
+
+    def _seconds_until(self, refresh_in):
+        credentials = self._credentials
+        if credentials._expiry_time is None or credentials.refresh_needed(
+            refresh_in
+        ):
+            return 0
+        return credentials._seconds_remaining() - refresh_in
+
+
 class AioCachedCredentialFetcher(CachedCredentialFetcher):
     async def _get_credentials(self):
         raise NotImplementedError('_get_credentials()')
@@ -384,12 +472,15 @@ class AioCachedCredentialFetcher(CachedCredentialFetcher):
         This will check the cache for up-to-date credentials, calling assume
         role if none are available.
         """
-        response = self._load_from_cache()
-        if response is None:
-            response = await self._get_credentials()
-            self._write_to_cache(response)
+        if isinstance(self._cache, AioJSONFileCache):
+            response = await self._get_shared_cached_response()
         else:
-            logger.debug("Credentials for role retrieved from cache.")
+            response = self._load_from_cache()
+            if response is None:
+                response = await self._get_credentials()
+                self._write_to_cache(response)
+            else:
+                logger.debug("Credentials for role retrieved from cache.")
 
         creds = response['Credentials']
         expiration = _serialize_if_needed(creds['Expiration'], iso=True)
@@ -400,6 +491,29 @@ class AioCachedCredentialFetcher(CachedCredentialFetcher):
             'expiry_time': expiration,
         }
 
+    async def _get_shared_cached_response(self):
+        # only one of the tasks and processes sharing the cache refreshes
+        # expired credentials, the others wait for and reuse its response
+        response = await self._load_from_shared_cache()
+        if response is None:
+            async with self._cache.lock(self._cache_key):
+                response = await self._load_from_shared_cache()
+                if response is None:
+                    response = await self._get_credentials()
+                    await self._cache.store(self._cache_key, response)
+                    return response
+        logger.debug("Credentials for role retrieved from cache.")
+        return response
+
+    async def _load_from_shared_cache(self):
+        response = await self._cache.load(self._cache_key)
+        if response is not None and self._is_expired(response):
+            logger.debug(
+                "Credentials were found in cache, but they are expired."
+            )
+            return None
+        return response
+
 
 class AioBaseAssumeRoleCredentialFetcher(
     BaseAssumeRoleCredentialFetcher, AioCachedCredentialFetcher
@@ -586,7 +700,7 @@ class AioOriginalEC2Provider(OriginalEC2Provider):
             full_path = os.path.expanduser(
                 self._environ['AWS_CREDENTIAL_FILE']
             )
-            creds = self._parser(full_path)
+            creds = await parse_config_file(self._parser, full_path)
             if self.ACCESS_KEY in creds:
                 logger.info('Found credentials in AWS_CREDENTIAL_FILE.')
                 access_key = creds[self.ACCESS_KEY]
@@ -602,7 +716,9 @@ class AioOriginalEC2Provider(OriginalEC2Provider):
 class AioSharedCredentialProvider(SharedCredentialProvider):
     async def load(self):
         try:
-            available_creds = self._ini_parser(self._creds_filename)
+            available_creds = await parse_config_file(
+                self._ini_parser, self._creds_filename
+            )
         except ConfigNotFound:
             return None
         if self._profile_name in available_creds:
@@ -624,7 +740,9 @@ class AioSharedCredentialProvider(SharedCredentialProvider):
 class AioConfigProvider(ConfigProvider):
     async def load(self):
         try:
-            full_config = self._config_parser(self._config_filename)
+            full_config = await parse_config_file(
+                self._config_parser, self._config_filename
+            )
         except ConfigNotFound:
             return None
         if self._profile_name in full_config['profiles']:
@@ -653,7 +771,7 @@ class AioBotoProvider(BotoProvider):
             potential_locations = self.DEFAULT_CONFIG_FILENAMES
         for filename in potential_locations:
             try:
-                config = self._ini_parser(filename)
+                config = await parse_config_file(self._ini_parser, filename)
             except ConfigNotFound:
                 # Move on to the next potential config file name.
                 continue
@@ -940,11 +1058,20 @@ class AioContainerProvider(ContainerProvider):
 
 
 class AioCredentialResolver(CredentialResolver):
+    def __init__(self, providers, concurrent=False):
+        super().__init__(providers)
+        # when set, the providers fetching credentials over the network are
+        # started up front instead of when the chain reaches them
+        self._concurrent = concurrent
+
     async def load_credentials(self):
         """
         Goes through the credentials chain, returning the first ``Credentials``
         that could be loaded.
         """
+        if self._concurrent:
+            return await self._load_credentials_concurrently()
+
         # First provider to return a non-None response wins.
         for provider in self.providers:
             logger.debug("Looking for credentials via: %s", provider.METHOD)
@@ -960,6 +1087,34 @@ class AioCredentialResolver(CredentialResolver):
         # -js
         return None
 
+    async def _load_credentials_concurrently(self):
+        loop = asyncio.get_running_loop()
+        tasks = {
+            provider: loop.create_task(provider.load())
+            for provider in self.providers
+            if isinstance(
+                provider, (AioContainerProvider, AioInstanceMetadataProvider)
+            )
+        }
+        try:
+            # the chain is still walked in order, so precedence is kept
+            for provider in self.providers:
+                logger.debug(
+                    "Looking for credentials via: %s", provider.METHOD
+                )
+                if provider in tasks:
+                    creds = await tasks[provider]
+                else:
+                    creds = await provider.load()
+                if creds is not None:
+                    return creds
+            return None
+        finally:
+            for task in tasks.values():
+                task.cancel()
+            # the failures of providers that lost are not reported
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+
 
 class AioSSOCredentialFetcher(AioCachedCredentialFetcher):
     _UTC_DATE_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
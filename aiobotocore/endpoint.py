@@ -13,10 +13,12 @@ from botocore.endpoint import (
     logger,
 )
 from botocore.hooks import first_non_none_response
+from botocore.parsers import ResponseParserError
 from urllib3.response import HTTPHeaderDict
 
+from aiobotocore._helpers import event_handlers, operation_event_names
 from aiobotocore.httpchecksum import handle_checksum_body
-from aiobotocore.httpsession import AIOHTTPSession
+from aiobotocore.httpsession import AIOHTTPSession, translate_body_read_error
 from aiobotocore.response import StreamingBody
 
 
@@ -65,6 +67,21 @@ async def convert_to_response_dict(http_response, operation_model):
 
 
 class AioEndpoint(Endpoint):
+    def __init__(
+        self,
+        *args,
+        parse_offload_threshold=None,
+        parse_executor=None,
+        json_backend=None,
+        streaming_xml_parse=False,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self._parse_offload_threshold = parse_offload_threshold
+        self._parse_executor = parse_executor
+        self._json_backend = json_backend
+        self._streaming_xml_parse = streaming_xml_parse
+
     async def close(self):
         await self.http_session.close()
 
@@ -75,14 +92,14 @@ class AioEndpoint(Endpoint):
                 [
                     operation_model.has_streaming_output,
                     operation_model.has_event_stream_output,
+                    self._stream_xml_payload(operation_model) is not None,
                 ]
             )
-            service_id = operation_model.service_model.service_id.hyphenize()
-            event_name = 'request-created.{service_id}.{op_name}'.format(
-                service_id=service_id, op_name=operation_model.name
+            event_names = operation_event_names(
+                operation_model.service_model.service_id, operation_model.name
             )
             await self._event_emitter.emit(
-                event_name,
+                event_names['request-created'],
                 request=request,
                 operation_name=operation_model.name,
             )
@@ -151,9 +168,11 @@ class AioEndpoint(Endpoint):
             kwargs_to_emit['response_dict'] = await convert_to_response_dict(
                 http_response, operation_model
             )
-        service_id = operation_model.service_model.service_id.hyphenize()
+        event_names = operation_event_names(
+            operation_model.service_model.service_id, operation_model.name
+        )
         await self._event_emitter.emit(
-            f"response-received.{service_id}.{operation_model.name}",
+            event_names['response-received'],
             **kwargs_to_emit,
         )
         return success_response, exception
@@ -171,10 +190,11 @@ class AioEndpoint(Endpoint):
                     'body': request.body,
                 },
             )
-            service_id = operation_model.service_model.service_id.hyphenize()
-            event_name = f"before-send.{service_id}.{operation_model.name}"
+            event_names = operation_event_names(
+                operation_model.service_model.service_id, operation_model.name
+            )
             responses = await self._event_emitter.emit(
-                event_name, request=request
+                event_names['before-send'], request=request
             )
             http_response = first_non_none_response(responses)
             if http_response is None:
@@ -187,10 +207,40 @@ class AioEndpoint(Endpoint):
             )
             return (None, e)
 
+        protocol = operation_model.metadata['protocol']
+        parser = self._configure_parser(
+            self._response_parser_factory.create_parser(protocol)
+        )
+
+        xml_payload = None
+        if request.stream_output and http_response.status_code < 300:
+            xml_payload = self._stream_xml_payload(operation_model, parser)
+        if xml_payload is not None:
+            try:
+                await self._feed_xml_payload(
+                    request, http_response, xml_payload, operation_model
+                )
+            except ResponseParserError:
+                raise
+            except Exception as e:
+                # the body is read as part of sending in the buffered case,
+                # so let the retry handlers see errors reading it here too
+                logger.debug(
+                    "Exception received when reading HTTP response.",
+                    exc_info=True,
+                )
+                return (None, e)
+
         # This returns the http_response and the parsed_data.
         response_dict = await convert_to_response_dict(
             http_response, operation_model
         )
+        if xml_payload is not None:
+            response_dict['body'] = xml_payload
+        # aiobotocore addition: latency phases when request timing is enabled
+        timing = getattr(http_response, 'timing', None)
+        if timing is not None:
+            response_dict['context']['timing'] = timing
         await handle_checksum_body(
             http_response,
             response_dict,
@@ -204,10 +254,11 @@ class AioEndpoint(Endpoint):
         ] = operation_model.has_streaming_output
         history_recorder.record('HTTP_RESPONSE', http_response_record_dict)
 
-        protocol = operation_model.metadata['protocol']
-        parser = self._response_parser_factory.create_parser(protocol)
-
-        if asyncio.iscoroutinefunction(parser.parse):
+        if self._should_offload_parse(response_dict):
+            parsed_response = await self._parse_in_executor(
+                parser, protocol, response_dict, operation_model.output_shape
+            )
+        elif asyncio.iscoroutinefunction(parser.parse):
             parsed_response = await parser.parse(
                 response_dict, operation_model.output_shape
             )
@@ -224,8 +275,99 @@ class AioEndpoint(Endpoint):
                 parser,
             )
         history_recorder.record('PARSED_RESPONSE', parsed_response)
+
+        if timing is not None:
+            if 'ResponseMetadata' in parsed_response:
+                parsed_response['ResponseMetadata']['Timing'] = timing
+            await self._event_emitter.emit(
+                event_names['request-timing'],
+                timing=timing,
+                request=request,
+                http_response=http_response,
+                context=context,
+            )
         return (http_response, parsed_response), None
 
+    def _stream_xml_payload(self, operation_model, parser=None):
+        # returns an XMLPayloadStream if the response of this operation
+        # should be parsed while it's received, see
+        # AioConfig(streaming_xml_parse=...)
+        if (
+            not self._streaming_xml_parse
+            or operation_model.metadata['protocol'] != 'rest-xml'
+            or operation_model.has_streaming_output
+            or operation_model.has_event_stream_output
+            or operation_model.http_checksum.get('responseAlgorithms')
+        ):
+            return None
+
+        if parser is None:
+            parser = self._configure_parser(
+                self._response_parser_factory.create_parser('rest-xml')
+            )
+        stream_payload = getattr(parser, 'stream_payload', None)
+        if stream_payload is None:
+            return None
+        return stream_payload(operation_model.output_shape)
+
+    async def _feed_xml_payload(
+        self, request, http_response, xml_payload, operation_model
+    ):
+        # the raw body is only kept for response-received handlers and the
+        # history recorder, which see it as when the response is buffered
+        event_names = operation_event_names(
+            operation_model.service_model.service_id, operation_model.name
+        )
+        chunks = None
+        if history_recorder._enabled or event_handlers(
+            self._event_emitter, event_names['response-received']
+        ):
+            chunks = []
+        body = http_response.raw.content.iter_any().__aiter__()
+        while True:
+            try:
+                chunk = await body.__anext__()
+            except StopAsyncIteration:
+                break
+            except Exception as e:
+                # raised like the errors reading a buffered body in send
+                raise translate_body_read_error(e, request) from e
+            if chunks is not None:
+                chunks.append(chunk)
+            xml_payload.feed(chunk)
+        xml_payload.close()
+        http_response._content = b'' if chunks is None else b''.join(chunks)
+
+    def _configure_parser(self, parser):
+        if self._json_backend is not None and hasattr(parser, 'json_backend'):
+            parser.json_backend = self._json_backend
+        return parser
+
+    def _should_offload_parse(self, response_dict):
+        # streaming bodies (including event streams) aren't parsed here, only
+        # their headers
+        body = response_dict['body']
+        return (
+            self._parse_offload_threshold is not None
+            and isinstance(body, bytes)
+            and len(body) >= self._parse_offload_threshold
+        )
+
+    async def _parse_in_executor(self, parser, protocol, response_dict, shape):
+        if asyncio.iscoroutinefunction(parser.parse):
+            # async parsers only await on event streams, which never have a
+            # bytes body, so the equivalent botocore parser can be used
+            create_sync_parser = getattr(
+                self._response_parser_factory, 'create_sync_parser', None
+            )
+            if create_sync_parser is None:
+                return await parser.parse(response_dict, shape)
+            parser = self._configure_parser(create_sync_parser(protocol))
+
+        return await asyncio.get_running_loop().run_in_executor(
+            self._parse_executor, parser.parse, response_dict, shape
+        )
+
     async def _add_modeled_error_fields(
         self,
         response_dict,
@@ -257,10 +399,11 @@ class AioEndpoint(Endpoint):
         response=None,
         caught_exception=None,
     ):
-        service_id = operation_model.service_model.service_id.hyphenize()
-        event_name = f"needs-retry.{service_id}.{operation_model.name}"
+        event_names = operation_event_names(
+            operation_model.service_model.service_id, operation_model.name
+        )
         responses = await self._event_emitter.emit(
-            event_name,
+            event_names['needs-retry'],
             response=response,
             endpoint=self,
             operation=operation_model,
@@ -301,6 +444,12 @@ class AioEndpointCreator(EndpointCreator):
         client_cert=None,
         proxies_config=None,
         connector_args=None,
+        request_timing=False,
+        parse_offload_threshold=None,
+        parse_executor=None,
+        json_backend=None,
+        streaming_xml_parse=False,
+        transport_registry=None,
     ):
         if not is_valid_endpoint_url(
             endpoint_url
@@ -321,6 +470,8 @@ class AioEndpointCreator(EndpointCreator):
             client_cert=client_cert,
             proxies_config=proxies_config,
             connector_args=connector_args,
+            request_timing=request_timing,
+            transport_registry=transport_registry,
         )
 
         return AioEndpoint(
@@ -329,4 +480,8 @@ class AioEndpointCreator(EndpointCreator):
             event_emitter=self._event_emitter,
             response_parser_factory=response_parser_factory,
             http_session=http_session,
+            parse_offload_threshold=parse_offload_threshold,
+            parse_executor=parse_executor,
+            json_backend=json_backend,
+            streaming_xml_parse=streaming_xml_parse,
         )
@@ -1,3 +1,6 @@
+import asyncio
+import logging
+
 from botocore.handlers import check_for_200_error as boto_check_for_200_error
 from botocore.handlers import (
     inject_presigned_url_ec2 as boto_inject_presigned_url_ec2,
@@ -19,7 +22,6 @@ from botocore.signers import (
     add_generate_presigned_url as boto_add_generate_presigned_url,
 )
 
-from ._helpers import resolve_awaitable
 from .handlers import (
     check_for_200_error,
     inject_presigned_url_ec2,
@@ -43,6 +45,15 @@ _HANDLER_MAPPING = {
 }
 
 
+def _classify_handlers(handlers):
+    # Pair each handler with whether it's a coroutine function so _emit only
+    # awaits where needed.  The result is stored in the emitter's lookup
+    # cache, which botocore resets whenever a handler is (un)registered.
+    return tuple(
+        (handler, asyncio.iscoroutinefunction(handler)) for handler in handlers
+    )
+
+
 class AioHierarchicalEmitter(HierarchicalEmitter):
     async def _emit(self, event_name, kwargs, stop_on_response=False):
         responses = []
@@ -50,7 +61,9 @@ class AioHierarchicalEmitter(HierarchicalEmitter):
         # to least specific, each time stripping off a dot.
         handlers_to_call = self._lookup_cache.get(event_name)
         if handlers_to_call is None:
-            handlers_to_call = self._handlers.prefix_search(event_name)
+            handlers_to_call = _classify_handlers(
+                self._handlers.prefix_search(event_name)
+            )
             self._lookup_cache[event_name] = handlers_to_call
         elif not handlers_to_call:
             # Short circuit and return an empty response is we have
@@ -59,11 +72,19 @@ class AioHierarchicalEmitter(HierarchicalEmitter):
             return []
         kwargs['event_name'] = event_name
         responses = []
-        for handler in handlers_to_call:
-            logger.debug('Event %s: calling handler %s', event_name, handler)
+        log_calls = logger.isEnabledFor(logging.DEBUG)
+        for handler, is_coroutine in handlers_to_call:
+            if log_calls:
+                logger.debug(
+                    'Event %s: calling handler %s', event_name, handler
+                )
 
-            # Await the handler if its a coroutine.
-            response = await resolve_awaitable(handler(**kwargs))
+            response = handler(**kwargs)
+            if is_coroutine:
+                response = await response
+            elif hasattr(response, '__await__'):
+                # sync callables returning awaitables, e.g. partials or mocks
+                response = await response
             responses.append((handler, response))
             if stop_on_response and response is not None:
                 return responses
@@ -1,3 +1,4 @@
+import asyncio
 import io
 
 from botocore.httpchecksum import (
@@ -5,23 +6,39 @@ from botocore.httpchecksum import (
     AwsChunkedWrapper,
     FlexibleChecksumError,
     _apply_request_header_checksum,
-    _handle_streaming_response,
     base64,
     conditionally_calculate_md5,
     determine_content_length,
     logger,
 )
 
+from aiobotocore._endpoint_helpers import _FileChunkReader, _is_file_body
 from aiobotocore._helpers import resolve_awaitable
+from aiobotocore.response import StreamingBody
 
 
 class AioAwsChunkedWrapper(AwsChunkedWrapper):
+    def _reset(self):
+        super()._reset()
+        # recreated from the position of the stream after a seek
+        self._file_reader = None
+
+    async def _read_raw(self):
+        if self._file_reader is None and _is_file_body(self._raw):
+            # files are read in the executor rather than on the event loop
+            self._file_reader = _FileChunkReader(
+                self._raw, self._chunk_size, self._raw.tell()
+            )
+        if self._file_reader is not None:
+            return await self._file_reader.read()
+        return await resolve_awaitable(self._raw.read(self._chunk_size))
+
     async def _make_chunk(self):
         # NOTE: Chunk size is not deterministic as read could return less. This
         # means we cannot know the content length of the encoded aws-chunked
         # stream ahead of time without ensuring a consistent chunk size
 
-        raw_chunk = await resolve_awaitable(self._raw.read(self._chunk_size))
+        raw_chunk = await self._read_raw()
         hex_len = hex(len(raw_chunk))[2:].encode("ascii")
         self._complete = not raw_chunk
 
@@ -44,6 +61,67 @@ class AioAwsChunkedWrapper(AwsChunkedWrapper):
         raise StopAsyncIteration()
 
 
+class AioStreamingChecksumBody(StreamingBody):
+    """A StreamingBody validating the checksum of its content.
+
+    The checksum is updated with each chunk that is read, whether through
+    ``read``, ``readinto`` or the iterators built on them, and is checked
+    once the end of the stream is reached.  Chunks of at least
+    ``offload_threshold`` bytes are hashed in the loop's default executor
+    instead of on the event loop.
+    """
+
+    def __init__(
+        self,
+        raw_stream,
+        content_length,
+        checksum,
+        expected,
+        offload_threshold=None,
+    ):
+        super().__init__(raw_stream, content_length)
+        self._self_checksum = checksum
+        self._self_expected = expected
+        self._self_offload_threshold = offload_threshold
+
+    async def read(self, amt=None):
+        chunk = await super().read(amt=amt)
+        await self._update_checksum(chunk)
+        if amt is None or (not chunk and amt > 0):
+            self._validate_checksum()
+        return chunk
+
+    async def readinto(self, buffer):
+        view = memoryview(buffer).cast('B')
+        filled = await super().readinto(view)
+        await self._update_checksum(view[:filled])
+        if filled < len(view):
+            self._validate_checksum()
+        return filled
+
+    async def _update_checksum(self, chunk):
+        if (
+            self._self_offload_threshold is not None
+            and len(chunk) >= self._self_offload_threshold
+        ):
+            # the checksum implementations release the GIL on large inputs
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._self_checksum.update, chunk
+            )
+        else:
+            self._self_checksum.update(chunk)
+
+    def _validate_checksum(self):
+        if self._self_checksum.digest() != base64.b64decode(
+            self._self_expected
+        ):
+            error_msg = (
+                f"Expected checksum {self._self_expected} did not match "
+                f"calculated checksum: {self._self_checksum.b64digest()}"
+            )
+            raise FlexibleChecksumError(error_msg=error_msg)
+
+
 async def handle_checksum_body(
     http_response, response, context, operation_model
 ):
@@ -68,7 +146,14 @@ async def handle_checksum_body(
 
         if operation_model.has_streaming_output:
             response["body"] = _handle_streaming_response(
-                http_response, response, algorithm
+                http_response,
+                response,
+                algorithm,
+                getattr(
+                    context.get("client_config"),
+                    "checksum_offload_threshold",
+                    None,
+                ),
             )
         else:
             response["body"] = await _handle_bytes_response(
@@ -87,6 +172,20 @@ async def handle_checksum_body(
     )
 
 
+def _handle_streaming_response(
+    http_response, response, algorithm, offload_threshold=None
+):
+    checksum_cls = _CHECKSUM_CLS.get(algorithm)
+    header_name = "x-amz-checksum-%s" % algorithm
+    return AioStreamingChecksumBody(
+        http_response.raw,
+        response["headers"].get("content-length"),
+        checksum_cls(),
+        response["headers"][header_name],
+        offload_threshold,
+    )
+
+
 async def _handle_bytes_response(http_response, response, algorithm):
     body = await http_response.content
     header_name = "x-amz-checksum-%s" % algorithm
@@ -1,7 +1,9 @@
 import asyncio
+import inspect
 import io
 import os
 import socket
+import time
 from typing import Dict, Optional
 
 import aiohttp  # lgtm [py/import-and-import-from]
@@ -15,6 +17,7 @@ from aiohttp import (
     ServerTimeoutError,
 )
 from aiohttp.client import URL
+from aiohttp.helpers import ceil_timeout
 from botocore.httpsession import (
     MAX_POOL_CONNECTIONS,
     ConnectionClosedError,
@@ -39,7 +42,266 @@ from botocore.httpsession import (
 from multidict import CIMultiDict
 
 import aiobotocore.awsrequest
-from aiobotocore._endpoint_helpers import _IOBaseWrapper, _text
+from aiobotocore._endpoint_helpers import (
+    _FilePayload,
+    _IOBaseWrapper,
+    _is_file_body,
+    _text,
+)
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+# Newer aiohttp versions create their sockets with a socket factory.  Before
+# 3.10, the connector connects through loop.create_connection, which also
+# accepts a connected socket.  In between, the options can only be set once
+# connected.
+_AIOHTTP_VERSION = tuple(
+    int(part) for part in aiohttp.__version__.split('.')[:2]
+)
+_HAS_SOCKET_FACTORY = (
+    'socket_factory'
+    in inspect.signature(aiohttp.TCPConnector.__init__).parameters
+)
+_CONNECTS_WITH_CREATE_CONNECTION = _AIOHTTP_VERSION < (3, 10)
+
+
+class _SocketOptionsTCPConnector(aiohttp.TCPConnector):
+    """TCPConnector which applies socket options to every new connection.
+
+    The options are set before connecting, so the ones which only matter
+    during the handshake, like ``SO_RCVBUF`` sizing the TCP window scale,
+    take effect.  On aiohttp versions from 3.10 without a socket factory,
+    whose connector doesn't accept a connected socket either, they are set
+    right after connecting and those options have no effect on the
+    handshake.
+    """
+
+    def __init__(self, *args, socket_options=None, **kwargs):
+        self._socket_options = socket_options or []
+        if _HAS_SOCKET_FACTORY and self._socket_options:
+            kwargs['socket_factory'] = self._create_socket
+        super().__init__(*args, **kwargs)
+
+    def _create_socket(self, addr_info):
+        family, type_, proto = addr_info[:3]
+        sock = socket.socket(family, type_, proto)
+        try:
+            sock.setblocking(False)
+            for option in self._socket_options:
+                sock.setsockopt(*option)
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+    async def _wrap_create_connection(self, *args, **kwargs):
+        if _HAS_SOCKET_FACTORY or not self._socket_options:
+            return await super()._wrap_create_connection(*args, **kwargs)
+        if _CONNECTS_WITH_CREATE_CONNECTION and 'sock' not in kwargs:
+            return await self._create_connection_with_options(*args, **kwargs)
+
+        transport, protocol = await super()._wrap_create_connection(
+            *args, **kwargs
+        )
+        sock = transport.get_extra_info('socket')
+        if sock is not None:
+            try:
+                for option in self._socket_options:
+                    sock.setsockopt(*option)
+            except OSError:
+                transport.close()
+                raise
+        return transport, protocol
+
+    async def _create_connection_with_options(
+        self,
+        protocol_factory,
+        host,
+        port,
+        *,
+        req,
+        timeout,
+        client_error=ClientConnectorError,
+        family=0,
+        proto=0,
+        flags=0,
+        local_addr=None,
+        **kwargs,
+    ):
+        # connects the socket like loop.create_connection would, with the
+        # errors aiohttp raises for it, and lets aiohttp do the rest.  The
+        # sock_connect timeout applies to the connect and the TLS handshake
+        # separately.
+        try:
+            async with ceil_timeout(timeout.sock_connect):
+                sock = await self._connect_socket(
+                    host, port, family, proto, flags, local_addr
+                )
+        except OSError as exc:
+            if exc.errno is None and isinstance(exc, asyncio.TimeoutError):
+                raise
+            raise client_error(req.connection_key, exc) from exc
+        return await super()._wrap_create_connection(
+            protocol_factory,
+            req=req,
+            timeout=timeout,
+            client_error=client_error,
+            sock=sock,
+            **kwargs,
+        )
+
+    async def _connect_socket(
+        self, host, port, family, proto, flags, local_addr
+    ):
+        # the host is resolved already, with an unspecified family for IPs
+        infos = await self._loop.getaddrinfo(
+            host,
+            port,
+            family=family,
+            type=socket.SOCK_STREAM,
+            proto=proto,
+            flags=flags,
+        )
+        error = None
+        for info in infos:
+            sock = None
+            try:
+                sock = self._create_socket(info)
+                if local_addr is not None:
+                    sock.bind(local_addr)
+                await self._loop.sock_connect(sock, info[4])
+                return sock
+            except OSError as exc:
+                error = exc
+            except BaseException:
+                if sock is not None:
+                    sock.close()
+                raise
+            if sock is not None:
+                sock.close()
+        raise error
+
+
+# aiohttp trace signals -> the timestamp recorded in the request's marks
+_TIMING_SIGNALS = {
+    'on_connection_queued_start': 'queued_start',
+    'on_connection_queued_end': 'queued_end',
+    'on_connection_create_start': 'connect_start',
+    'on_connection_create_end': 'connect_end',
+    'on_connection_reuseconn': 'connection_reused',
+    'on_dns_resolvehost_start': 'dns_start',
+    'on_dns_resolvehost_end': 'dns_end',
+    'on_request_end': 'headers_received',
+}
+
+
+def _timing_marker(mark):
+    async def on_signal(session, trace_config_ctx, params):
+        marks = trace_config_ctx.trace_request_ctx
+        if marks is not None:
+            marks[mark] = time.monotonic()
+
+    return on_signal
+
+
+def _create_timing_trace_config():
+    trace_config = aiohttp.TraceConfig()
+    for signal_name, mark in _TIMING_SIGNALS.items():
+        getattr(trace_config, signal_name).append(_timing_marker(mark))
+    return trace_config
+
+
+def _timing_phases(marks, finished):
+    """Turn the recorded timestamps of a request into phase durations.
+
+    All durations are in seconds.  ``connect`` covers the TCP connect and
+    the TLS handshake (aiohttp doesn't signal them separately) but not the
+    DNS lookup, and ``body`` is only present if the body was read in
+    ``send`` (ie. not for streaming responses).
+    """
+
+    def span(start, end):
+        if start in marks and end in marks:
+            return marks[end] - marks[start]
+        return 0.0
+
+    dns = span('dns_start', 'dns_end')
+    connection_ready = max(
+        marks.get(mark, marks['request_start'])
+        for mark in ('queued_end', 'connect_end', 'connection_reused')
+    )
+    headers_received = marks.get('headers_received', finished)
+
+    phases = {
+        'dns': dns,
+        'connection_queued': span('queued_start', 'queued_end'),
+        'connect': max(span('connect_start', 'connect_end') - dns, 0.0),
+        'time_to_first_byte': headers_received - connection_ready,
+        'total': finished - marks['request_start'],
+        'connection_reused': 'connection_reused' in marks,
+    }
+    if 'body_read' in marks:
+        phases['body'] = marks['body_read'] - headers_received
+    return phases
+
+
+class SharedTransportRegistry:
+    """Reference counted aiohttp sessions shared between clients.
+
+    Sessions are keyed by their transport settings (verify, client cert,
+    proxies and connector args) so that clients talking to the same hosts
+    share keep-alive connections, TLS sessions and the DNS cache.  A shared
+    session is closed once the last client using it exits.
+    """
+
+    def __init__(self):
+        self._transports: Dict[tuple, list] = {}
+
+    async def acquire(self, key, create_session):
+        transport = self._transports.get(key)
+        if transport is None:
+            transport = self._transports[key] = [create_session(), 0]
+        transport[1] += 1
+        return transport[0]
+
+    async def release(self, key):
+        transport = self._transports[key]
+        transport[1] -= 1
+        if transport[1] == 0:
+            del self._transports[key]
+            await transport[0].close()
+
+    def __contains__(self, key):
+        return key in self._transports
+
+    def __len__(self):
+        return len(self._transports)
+
+
+def translate_body_read_error(error, request):
+    """The exception ``send`` raises for ``error`` while reading a body.
+
+    For response bodies read after ``send`` has returned, so that retry
+    handlers see the same exceptions as for buffered responses.
+    """
+    if isinstance(
+        error, (ServerDisconnectedError, aiohttp.ClientPayloadError)
+    ):
+        return ConnectionClosedError(
+            error=error, request=request, endpoint_url=request.url
+        )
+    if isinstance(error, asyncio.TimeoutError):
+        return ReadTimeoutError(endpoint_url=request.url, error=error)
+    if isinstance(error, ClientConnectionError):
+        return EndpointConnectionError(endpoint_url=request.url, error=error)
+    return HTTPClientError(error=error)
 
 
 class AIOHTTPSession:
@@ -53,8 +315,9 @@ class AIOHTTPSession:
         client_cert=None,
         proxies_config=None,
         connector_args=None,
+        request_timing=False,
+        transport_registry=None,
     ):
-        # TODO: handle socket_options
         self._session: Optional[aiohttp.ClientSession] = None
         self._verify = verify
         self._proxy_config = ProxyConfiguration(
@@ -93,47 +356,106 @@ class AIOHTTPSession:
         # it also pools by host so we don't need a manager, and can pass proxy via
         # request so don't need proxy manager
 
-        ssl_context = None
-        if bool(verify):
-            if proxies:
-                proxies_settings = self._proxy_config.settings
-                ssl_context = self._setup_proxy_ssl_context(proxies_settings)
-                # TODO: add support for
-                #    proxies_settings.get('proxy_use_forwarding_for_https')
-            else:
-                ssl_context = self._get_ssl_context()
-
-                # inline self._setup_ssl_cert
-                ca_certs = get_cert_path(verify)
-                if ca_certs:
-                    ssl_context.load_verify_locations(ca_certs, None, None)
-
-        self._create_connector = lambda: aiohttp.TCPConnector(
-            limit=max_pool_connections,
-            verify_ssl=bool(verify),
-            ssl=ssl_context,
-            **self._connector_args
+        # created when the session is entered, as loading the CA bundle
+        # reads it from disk
+        self._proxies = proxies
+        self._ssl_context = None
+
+        self._create_connector = lambda limit=max_pool_connections: (
+            _SocketOptionsTCPConnector(
+                limit=limit,
+                verify_ssl=bool(verify),
+                ssl=self._ssl_context,
+                socket_options=self._socket_options,
+                **self._connector_args,
+            )
         )
         self._connector = None
+        self._request_timing = request_timing
+
+        # When a registry is given the connector is shared with every other
+        # session using the same transport settings, and this session's
+        # max_pool_connections is enforced as a sub-limit in send()
+        self._transport_registry = transport_registry
+        self._transport_key = (
+            _freeze(verify),
+            self._cert_file,
+            self._key_file,
+            _freeze(proxies),
+            _freeze(proxies_config),
+            _freeze(self._connector_args),
+            _freeze(self._socket_options),
+            request_timing,
+        )
+        self._pool_slots: Optional[asyncio.Semaphore] = None
 
-    async def __aenter__(self):
-        assert not self._session and not self._connector
+    def _create_session(self, connector):
+        trace_configs = None
+        if self._request_timing:
+            trace_configs = [_create_timing_trace_config()]
 
-        self._connector = self._create_connector()
-
-        self._session = aiohttp.ClientSession(
-            connector=self._connector,
+        return aiohttp.ClientSession(
+            connector=connector,
             timeout=self._timeout,
             skip_auto_headers={'CONTENT-TYPE'},
             auto_decompress=False,
+            trace_configs=trace_configs,
         )
+
+    def _create_shared_session(self):
+        # the shared connector is only bounded by the per-session sub-limits
+        return self._create_session(self._create_connector(limit=0))
+
+    async def __aenter__(self):
+        assert not self._session and not self._connector
+
+        if bool(self._verify) and self._ssl_context is None:
+            if (
+                self._transport_registry is None
+                or self._transport_key not in self._transport_registry
+            ):
+                self._ssl_context = (
+                    await asyncio.get_running_loop().run_in_executor(
+                        None, self._create_ssl_context
+                    )
+                )
+
+        if self._transport_registry is not None:
+            self._session = await self._transport_registry.acquire(
+                self._transport_key, self._create_shared_session
+            )
+            self._connector = self._session.connector
+            self._pool_slots = asyncio.Semaphore(self._max_pool_connections)
+            return self
+
+        self._connector = self._create_connector()
+        self._session = self._create_session(self._connector)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         if self._session:
-            await self._session.__aexit__(exc_type, exc_val, exc_tb)
+            if self._transport_registry is not None:
+                await self._transport_registry.release(self._transport_key)
+            else:
+                await self._session.__aexit__(exc_type, exc_val, exc_tb)
             self._session = None
             self._connector = None
+            self._pool_slots = None
+
+    def _create_ssl_context(self):
+        if self._proxies:
+            proxies_settings = self._proxy_config.settings
+            return self._setup_proxy_ssl_context(proxies_settings)
+            # TODO: add support for
+            #    proxies_settings.get('proxy_use_forwarding_for_https')
+
+        ssl_context = self._get_ssl_context()
+
+        # inline self._setup_ssl_cert
+        ca_certs = get_cert_path(self._verify)
+        if ca_certs:
+            ssl_context.load_verify_locations(ca_certs, None, None)
+        return ssl_context
 
     def _get_ssl_context(self):
         ssl_context = create_urllib3_context()
@@ -171,6 +493,26 @@ class AIOHTTPSession:
         await self.__aexit__(None, None, None)
 
     async def send(self, request):
+        if self._pool_slots is None:
+            return await self._send(request)
+
+        await self._pool_slots.acquire()
+        try:
+            http_response = await self._send(request)
+        except BaseException:
+            self._pool_slots.release()
+            raise
+
+        # Streamed responses hold on to their connection after we return,
+        # so only give the slot back once aiohttp releases it
+        connection = http_response.raw.connection
+        if connection is not None:
+            connection.add_callback(self._pool_slots.release)
+        else:
+            self._pool_slots.release()
+        return http_response
+
+    async def _send(self, request):
         try:
             proxy_url = self._proxy_config.proxy_url_for(request.url)
             proxy_headers = self._proxy_config.proxy_headers_for(request.url)
@@ -201,9 +543,17 @@ class AIOHTTPSession:
                 headers_.pop('Transfer-Encoding', '')
                 chunked = True
 
-            if isinstance(data, io.IOBase):
+            if _is_file_body(data):
+                # sent from the executor, or with sendfile when the length
+                # is known and the connection isn't TLS
+                data = _FilePayload(data, sendfile=not chunked)
+            elif isinstance(data, io.IOBase):
                 data = _IOBaseWrapper(data)
 
+            timing_marks = None
+            if self._request_timing:
+                timing_marks = {'request_start': time.monotonic()}
+
             url = URL(url, encoded=True)
             response = await self._session.request(
                 request.method,
@@ -213,6 +563,8 @@ class AIOHTTPSession:
                 data=data,
                 proxy=proxy_url,
                 proxy_headers=proxy_headers,
+                timeout=self._timeout,
+                trace_request_ctx=timing_marks,
             )
 
             http_response = aiobotocore.awsrequest.AioAWSResponse(
@@ -224,6 +576,13 @@ class AIOHTTPSession:
                 # this way instead of using preload_content because
                 # preload_content will never buffer chunked responses
                 await http_response.content
+                if timing_marks is not None:
+                    timing_marks['body_read'] = time.monotonic()
+
+            if timing_marks is not None:
+                http_response.timing = _timing_phases(
+                    timing_marks, time.monotonic()
+                )
 
             return http_response
         except ClientSSLError as e:
@@ -1,3 +1,5 @@
+import asyncio
+
 import aioitertools
 import jmespath
 from botocore.exceptions import PaginationError
@@ -6,10 +8,64 @@ from botocore.utils import merge_dicts, set_value_from_jmespath
 
 
 class AioPageIterator(PageIterator):
+    def __init__(self, *args, prefetch=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._prefetch = prefetch
+
     def __aiter__(self):
         return self.__anext__()
 
     async def __anext__(self):
+        if self._prefetch:
+            pages = self._prefetch_pages(self._prefetch)
+        else:
+            pages = self._iter_pages()
+        async for page in pages:
+            yield page
+
+    async def _prefetch_pages(self, prefetch):
+        # Pages are requested by a background task which runs at most
+        # `prefetch` pages ahead of the consumer.  Each request depends on
+        # the previous page's token so they are still made one at a time.
+        pages = self._iter_pages()
+        slots = asyncio.Semaphore(prefetch)
+        queue = asyncio.Queue()
+
+        async def producer():
+            try:
+                while True:
+                    await slots.acquire()
+                    try:
+                        page = await pages.__anext__()
+                    except StopAsyncIteration:
+                        break
+                    queue.put_nowait((page, None))
+            except Exception as e:
+                queue.put_nowait((None, e))
+            else:
+                queue.put_nowait((None, None))
+            finally:
+                await pages.aclose()
+
+        task = asyncio.ensure_future(producer())
+        try:
+            while True:
+                page, error = await queue.get()
+                if error is not None:
+                    raise error
+                if page is None:
+                    break
+                slots.release()
+                yield page
+        finally:
+            if not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+
+    async def _iter_pages(self):
         current_kwargs = self._op_kwargs
         previous_next_token = None
         next_token = {key: None for key in self._input_token}
@@ -160,6 +216,46 @@ class AioPageIterator(PageIterator):
 class AioPaginator(Paginator):
     PAGE_ITERATOR_CLS = AioPageIterator
 
+    def paginate(self, **kwargs):
+        """Create paginator object for an operation.
+
+        This returns an iterable object.  Iterating over
+        this object will yield a single page of a response
+        at a time.
+
+        Besides botocore's options, ``PaginationConfig`` accepts
+        ``Prefetch``: the number of pages to request in the background
+        while the consumer is processing the current one.
+
+        """
+        page_params = self._extract_paging_params(kwargs)
+        return self.PAGE_ITERATOR_CLS(
+            self._method,
+            self._input_token,
+            self._output_token,
+            self._more_results,
+            self._result_keys,
+            self._non_aggregate_keys,
+            self._limit_key,
+            page_params['MaxItems'],
+            page_params['StartingToken'],
+            page_params['PageSize'],
+            kwargs,
+            prefetch=page_params['Prefetch'],
+        )
+
+    def _extract_paging_params(self, kwargs):
+        prefetch = kwargs.get('PaginationConfig', {}).get('Prefetch')
+        page_params = super()._extract_paging_params(kwargs)
+        if prefetch is not None:
+            prefetch = int(prefetch)
+            if prefetch < 0:
+                raise PaginationError(
+                    message="Prefetch must be a non-negative integer."
+                )
+        page_params['Prefetch'] = prefetch
+        return page_params
+
 
 class ResultKeyIterator:
     """Iterates over the results of paginated responses.
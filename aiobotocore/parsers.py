@@ -1,3 +1,4 @@
+from botocore.compat import ETree, XMLParseError
 from botocore.parsers import (
     LOG,
     EC2QueryParser,
@@ -19,6 +20,15 @@ class AioResponseParserFactory(ResponseParserFactory):
         parser_cls = PROTOCOL_PARSERS[protocol_name]
         return parser_cls(**self._defaults)
 
+    def create_sync_parser(self, protocol_name):
+        # a parser for the protocol which never awaits.  Only suitable for
+        # responses without an event stream, see
+        # AioEndpoint._parse_in_executor
+        parser_cls = SYNC_PROTOCOL_PARSERS.get(
+            protocol_name, PROTOCOL_PARSERS[protocol_name]
+        )
+        return parser_cls(**self._defaults)
+
 
 def create_parser(protocol):
     return AioResponseParserFactory().create_parser(protocol)
@@ -38,7 +48,22 @@ class AioEC2QueryParser(EC2QueryParser):
         return AioEventStream(response['body'], shape, parser, name)
 
 
-class AioJSONParser(JSONParser):
+class _JSONBackendParserMixin:
+    # set per client by AioEndpoint from AioConfig(json_backend=...)
+    json_backend = None
+
+    def _parse_body_as_json(self, body_contents):
+        if self.json_backend is not None and body_contents:
+            try:
+                return self.json_backend.loads(body_contents)
+            except ValueError:
+                # invalid JSON or values the codec can't represent, leave it
+                # to botocore
+                pass
+        return super()._parse_body_as_json(body_contents)
+
+
+class AioJSONParser(_JSONBackendParserMixin, JSONParser):
     async def _do_parse(self, response, shape):
         parsed = {}
         if shape is not None:
@@ -105,19 +130,135 @@ class AioJSONParser(JSONParser):
         return parsed
 
 
-class AioRestJSONParser(RestJSONParser):
+class AioRestJSONParser(_JSONBackendParserMixin, RestJSONParser):
     def _create_event_stream(self, response, shape):
         parser = self._event_stream_parser
         name = response['context'].get('operation_name')
         return AioEventStream(response['body'], shape, parser, name)
 
 
+class XMLPayloadStream:
+    """Incrementally parses a rest-xml payload while its bytes arrive.
+
+    Items of the payload's top level flattened lists of structures, e.g.
+    ``Contents`` of ``ListObjectsV2``, are parsed as soon as their element
+    is complete and dropped from the tree, so the full element tree is
+    never built.  See :meth:`AioRestXMLParser.stream_payload`.
+    """
+
+    def __init__(self, parser, shape, list_members):
+        self._parser = parser
+        self._shape = shape
+        self._list_members = list_members
+        self._xml_parser = ETree.XMLPullParser(events=('start', 'end'))
+        self._root = None
+        self._depth = 0
+        self._items = {}
+
+    def feed(self, data):
+        try:
+            self._xml_parser.feed(data)
+        except XMLParseError as e:
+            raise ResponseParserError(
+                "Unable to parse response (%s), "
+                "invalid XML received. Further retries may succeed" % e
+            )
+        self._handle_events()
+
+    def close(self):
+        if self._root is None:
+            # empty body, same as RestXMLParser._initial_body_parse
+            self._root = ETree.Element('')
+            return
+        try:
+            self._xml_parser.close()
+        except XMLParseError as e:
+            raise ResponseParserError(
+                "Unable to parse response (%s), "
+                "invalid XML received. Further retries may succeed" % e
+            )
+        self._handle_events()
+
+    def parse(self):
+        parsed = self._parser._parse_shape(self._shape, self._root)
+        parsed.update(self._items)
+        return parsed
+
+    def _handle_events(self):
+        for event, element in self._xml_parser.read_events():
+            if event == 'start':
+                if self._root is None:
+                    self._root = element
+                self._depth += 1
+                continue
+
+            self._depth -= 1
+            if self._depth != 1:
+                continue
+            list_member = self._list_members.get(
+                self._parser._node_tag(element)
+            )
+            if list_member is not None:
+                member_name, item_shape = list_member
+                self._items.setdefault(member_name, []).append(
+                    self._parser._parse_shape(item_shape, element)
+                )
+                self._root.remove(element)
+
+
 class AioRestXMLParser(RestXMLParser):
     def _create_event_stream(self, response, shape):
         parser = self._event_stream_parser
         name = response['context'].get('operation_name')
         return AioEventStream(response['body'], shape, parser, name)
 
+    def stream_payload(self, shape):
+        """Return an :class:`XMLPayloadStream` for the output ``shape``.
+
+        Returns None if the payload has no top level flattened list of
+        structures to parse incrementally.
+        """
+        payload_shape = self._payload_shape(shape)
+        if payload_shape is None or payload_shape.type_name != 'structure':
+            return None
+
+        list_members = {}
+        for member_name, member_shape in payload_shape.members.items():
+            if (
+                member_shape.type_name == 'list'
+                and member_shape.serialization.get('flattened')
+                and member_shape.member.type_name == 'structure'
+                and 'location' not in member_shape.serialization
+            ):
+                xml_name = self._member_key_name(member_shape, member_name)
+                list_members[xml_name] = (member_name, member_shape.member)
+        if not list_members:
+            return None
+
+        return XMLPayloadStream(self, payload_shape, list_members)
+
+    @staticmethod
+    def _payload_shape(shape):
+        if shape is None or 'payload' not in shape.serialization:
+            return shape
+        return shape.members[shape.serialization['payload']]
+
+    def _parse_payload(self, response, shape, member_shapes, final_parsed):
+        body = response['body']
+        if not isinstance(body, XMLPayloadStream):
+            return super()._parse_payload(
+                response, shape, member_shapes, final_parsed
+            )
+
+        if 'payload' in shape.serialization:
+            final_parsed[shape.serialization['payload']] = body.parse()
+        else:
+            final_parsed.update(body.parse())
+
+
+class _SyncJSONParser(_JSONBackendParserMixin, JSONParser):
+    pass
+
 
 PROTOCOL_PARSERS = {
     'ec2': AioEC2QueryParser,
@@ -126,3 +267,8 @@ PROTOCOL_PARSERS = {
     'rest-json': AioRestJSONParser,
     'rest-xml': AioRestXMLParser,
 }
+
+# parsers for protocols whose PROTOCOL_PARSERS entry has an async parse
+SYNC_PROTOCOL_PARSERS = {
+    'json': _SyncJSONParser,
+}
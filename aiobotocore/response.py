@@ -1,8 +1,10 @@
 import asyncio
+import zlib
 
 import aiohttp
 import aiohttp.client_exceptions
 import wrapt
+from botocore.exceptions import BotoCoreError, MissingDependencyException
 from botocore.response import (
     IncompleteReadError,
     ReadTimeoutError,
@@ -16,6 +18,10 @@ class AioReadTimeoutError(ReadTimeoutError, asyncio.TimeoutError):
     pass
 
 
+class UnsupportedContentEncodingError(BotoCoreError):
+    fmt = 'Unsupported Content-Encoding: {content_encoding}'
+
+
 class StreamingBody(wrapt.ObjectProxy):
     """Wrapper class for an http response body.
 
@@ -29,6 +35,7 @@ class StreamingBody(wrapt.ObjectProxy):
     """
 
     _DEFAULT_CHUNK_SIZE = 1024
+    _DEFAULT_LINE_CHUNK_SIZE = 64 * 1024
 
     def __init__(self, raw_stream: aiohttp.StreamReader, content_length: str):
         super().__init__(raw_stream)
@@ -52,11 +59,55 @@ class StreamingBody(wrapt.ObjectProxy):
 
         If the amt argument is omitted, read all data.
         """
+        chunk = await self._read_raw(amt if amt is not None else -1)
+        self._self_amount_read += len(chunk)
+        if amt is None or (not chunk and amt > 0):
+            # If the server sends empty contents or
+            # we ask to read all of the contents, then we know
+            # we need to verify the content length.
+            self._verify_content_length()
+        return chunk
+
+    async def readinto(self, buffer):
+        """Read bytes into a pre-allocated, writable bytes-like object.
+
+        The buffer is filled unless the end of the stream is reached first.
+        Returns the number of bytes read, 0 meaning the end of the stream.
+        """
+        view = memoryview(buffer).cast('B')
+        size = len(view)
+        filled = 0
+        while filled < size:
+            # aiohttp hands out its received chunks without copying them
+            # unless they are split, so they are only copied into the view
+            chunk = await self._read_raw(size - filled)
+            if not chunk:
+                break
+            view[filled : filled + len(chunk)] = chunk
+            filled += len(chunk)
+
+        self._self_amount_read += filled
+        if filled < size:
+            self._verify_content_length()
+        return filled
+
+    async def iter_chunks_into(self, buffer):
+        """Return an iterator filling ``buffer`` from the raw stream.
+
+        Each chunk is yielded as a memoryview of the filled part of
+        ``buffer``, which is overwritten by the next chunk.
+        """
+        view = memoryview(buffer).cast('B')
+        while True:
+            filled = await self.readinto(view)
+            if not filled:
+                break
+            yield view[:filled]
+
+    async def _read_raw(self, amt):
         # botocore to aiohttp mapping
         try:
-            chunk = await self.__wrapped__.content.read(
-                amt if amt is not None else -1
-            )
+            return await self.__wrapped__.content.read(amt)
         except asyncio.TimeoutError as e:
             raise AioReadTimeoutError(
                 endpoint_url=self.__wrapped__.url, error=e
@@ -64,14 +115,6 @@ class StreamingBody(wrapt.ObjectProxy):
         except aiohttp.client_exceptions.ClientConnectionError as e:
             raise ResponseStreamingError(error=e)
 
-        self._self_amount_read += len(chunk)
-        if amt is None or (not chunk and amt > 0):
-            # If the server sends empty contents or
-            # we ask to read all of the contents, then we know
-            # we need to verify the content length.
-            self._verify_content_length()
-        return chunk
-
     async def readlines(self):
         # assuming this is not an iterator
         lines = [line async for line in self.iter_lines()]
@@ -90,20 +133,43 @@ class StreamingBody(wrapt.ObjectProxy):
 
     anext = __anext__
 
-    async def iter_lines(self, chunk_size=_DEFAULT_CHUNK_SIZE, keepends=False):
+    async def iter_lines(
+        self, chunk_size=_DEFAULT_LINE_CHUNK_SIZE, keepends=False
+    ):
         """Return an iterator to yield lines from the raw stream.
 
         This is achieved by reading chunk of bytes (of size chunk_size) at a
         time from the raw stream, and then yielding lines from there.
         """
-        pending = b''
+        # the unterminated last line, in pieces so that a long line is only
+        # joined once
+        pending = []
         async for chunk in self.iter_chunks(chunk_size):
-            lines = (pending + chunk).splitlines(True)
-            for line in lines[:-1]:
-                yield line.splitlines(keepends)[0]
-            pending = lines[-1]
-        if pending:
-            yield pending.splitlines(keepends)[0]
+            if b'\n' not in chunk and b'\r' not in chunk:
+                pending.append(chunk)
+                continue
+            if pending:
+                pending.append(chunk)
+                chunk = b''.join(pending)
+
+            lines = chunk.splitlines(keepends)
+            if chunk.endswith(b'\n'):
+                pending = []
+            else:
+                # a trailing \r may be the start of a \r\n, so the line it
+                # ends is held back too
+                end = len(chunk) - 1
+                start = (
+                    max(chunk.rfind(b'\n', 0, end), chunk.rfind(b'\r', 0, end))
+                    + 1
+                )
+                pending = [chunk[start:]]
+                lines.pop()
+            for line in lines:
+                yield line
+        # a held back \r may be followed by a last unterminated line
+        for line in b''.join(pending).splitlines(keepends):
+            yield line
 
     async def iter_chunks(self, chunk_size=_DEFAULT_CHUNK_SIZE):
         """Return an iterator to yield chunks of chunk_size bytes from the raw
@@ -131,6 +197,206 @@ class StreamingBody(wrapt.ObjectProxy):
     def tell(self):
         return self._self_amount_read
 
+    def decompressed(self, content_encoding=None, chunk_size=64 * 1024):
+        """Return a reader decompressing the content as it is read.
+
+        The content is decoded according to ``content_encoding``, by default
+        the Content-Encoding header of the response: ``gzip``, ``deflate``,
+        ``zstd`` (with the ``zstandard`` package) or ``identity``.  The
+        compressed bytes are read from this body ``chunk_size`` at a time,
+        so ``tell()`` and the content length validation keep applying to
+        them.
+        """
+        if content_encoding is None:
+            headers = getattr(self.__wrapped__, 'headers', None) or {}
+            content_encoding = headers.get('Content-Encoding', 'identity')
+        return DecompressingStreamingBody(self, content_encoding, chunk_size)
+
+
+class _ZlibDecoder:
+    errors = (zlib.error,)
+
+    def __init__(self, wbits):
+        self._wbits = wbits
+        self._decompressor = zlib.decompressobj(wbits)
+        self._input = b''
+        self._started = False
+
+    def feed(self, data):
+        self._input = self._input + data if self._input else data
+
+    def decompress(self, max_length):
+        chunks = []
+        size = 0
+        while self._input and (not max_length or size < max_length):
+            if self._decompressor.eof:
+                # gzip members may be concatenated
+                self._decompressor = zlib.decompressobj(self._wbits)
+            try:
+                chunk = self._decompressor.decompress(
+                    self._input, max_length - size if max_length else 0
+                )
+            except zlib.error:
+                if self._started or self._wbits != zlib.MAX_WBITS:
+                    raise
+                # some servers send raw deflate data without the zlib header
+                self._wbits = -zlib.MAX_WBITS
+                self._decompressor = zlib.decompressobj(self._wbits)
+                continue
+            self._started = True
+            if self._decompressor.eof:
+                self._input = self._decompressor.unused_data
+            else:
+                self._input = self._decompressor.unconsumed_tail
+            chunks.append(chunk)
+            size += len(chunk)
+        return b''.join(chunks)
+
+    def flush(self):
+        chunk = self._decompressor.flush()
+        if self._started and not self._decompressor.eof:
+            raise zlib.error('compressed stream is truncated')
+        return chunk
+
+
+class _ZstdDecoder:
+    # zstandard can't bound the output of a decompress call, so each
+    # compressed chunk is decompressed whole
+    def __init__(self):
+        try:
+            import zstandard
+        except ImportError:
+            raise MissingDependencyException(
+                msg='zstd content requires the zstandard package'
+            )
+        self.errors = (zstandard.ZstdError,)
+        self._error_cls = zstandard.ZstdError
+        self._new_decompressor = zstandard.ZstdDecompressor().decompressobj
+        self._decompressor = self._new_decompressor()
+        self._input = b''
+        self._started = False
+
+    def feed(self, data):
+        self._input = self._input + data if self._input else data
+
+    def decompress(self, max_length):
+        chunks = []
+        while self._input:
+            if self._decompressor.eof:
+                # as are zstd frames
+                self._decompressor = self._new_decompressor()
+            data, self._input = self._input, b''
+            chunks.append(self._decompressor.decompress(data))
+            self._started = True
+            if self._decompressor.eof:
+                self._input = self._decompressor.unused_data
+        return b''.join(chunks)
+
+    def flush(self):
+        if self._started and not self._decompressor.eof:
+            raise self._error_cls('compressed stream is truncated')
+        return b''
+
+
+class _IdentityDecoder:
+    errors = ()
+
+    def __init__(self):
+        self._input = b''
+
+    def feed(self, data):
+        self._input = self._input + data if self._input else data
+
+    def decompress(self, max_length):
+        if not max_length or max_length >= len(self._input):
+            chunk, self._input = self._input, b''
+        else:
+            chunk = self._input[:max_length]
+            self._input = self._input[max_length:]
+        return chunk
+
+    def flush(self):
+        return b''
+
+
+_DECODERS = {
+    'gzip': lambda: _ZlibDecoder(16 + zlib.MAX_WBITS),
+    'x-gzip': lambda: _ZlibDecoder(16 + zlib.MAX_WBITS),
+    'deflate': lambda: _ZlibDecoder(zlib.MAX_WBITS),
+    'zstd': _ZstdDecoder,
+    'identity': _IdentityDecoder,
+}
+
+
+class DecompressingStreamingBody:
+    """Decompresses a StreamingBody as it is read.
+
+    See :meth:`StreamingBody.decompressed`.  At most one chunk of compressed
+    bytes is held at a time and ``read(amt)`` returns at most ``amt``
+    decompressed bytes.
+    """
+
+    def __init__(self, body, content_encoding, chunk_size=64 * 1024):
+        decoder_cls = _DECODERS.get(content_encoding.strip().lower())
+        if decoder_cls is None:
+            raise UnsupportedContentEncodingError(
+                content_encoding=content_encoding
+            )
+        self._body = body
+        self._decoder = decoder_cls()
+        self._chunk_size = chunk_size
+        self._eof = False
+
+    async def read(self, amt=None):
+        """Read at most amt decompressed bytes from the stream.
+
+        If the amt argument is omitted, read all data.
+        """
+        if amt is None:
+            return b''.join([chunk async for chunk in self.iter_chunks(0)])
+        if amt <= 0:
+            return b''
+        return await self._read_chunk(amt)
+
+    def __aiter__(self):
+        return self.iter_chunks()
+
+    async def iter_chunks(self, chunk_size=StreamingBody._DEFAULT_CHUNK_SIZE):
+        """Return an iterator to yield chunks of at most chunk_size
+        decompressed bytes, or of whatever a compressed chunk holds for 0.
+        """
+        while True:
+            chunk = await self._read_chunk(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+    # these only rely on iter_chunks
+    iter_lines = StreamingBody.iter_lines
+    readlines = StreamingBody.readlines
+
+    async def _read_chunk(self, max_length):
+        try:
+            while True:
+                chunk = self._decoder.decompress(max_length)
+                if chunk or self._eof:
+                    return chunk
+                data = await self._body.read(self._chunk_size)
+                if data:
+                    self._decoder.feed(data)
+                else:
+                    self._eof = True
+                    return self._decoder.flush()
+        except self._decoder.errors as e:
+            raise ResponseStreamingError(error=e)
+
+    def tell(self):
+        """The number of compressed bytes read."""
+        return self._body.tell()
+
+    def close(self):
+        self._body.close()
+
 
 async def get_response(operation_model, http_response):
     protocol = operation_model.metadata['protocol']
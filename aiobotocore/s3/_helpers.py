@@ -0,0 +1,121 @@
+import asyncio
+import logging
+import random
+
+from botocore.exceptions import (
+    ChecksumError,
+    ClientError,
+    ConnectionError,
+    HTTPClientError,
+    IncompleteReadError,
+    ParamValidationError,
+)
+
+logger = logging.getLogger(__name__)
+
+MB = 1024**2
+GB = 1024**3
+# S3's limits on the number of parts of a multipart upload and their size.
+# The largest part is also the largest object copy_object copies, which the
+# copier relies on by copying objects of a single part with it.
+MAX_PARTS = 10000
+MIN_PART_SIZE = 5 * MB
+MAX_PART_SIZE = 5 * GB
+
+_RETRYABLE_EXCEPTIONS = (
+    HTTPClientError,
+    ConnectionError,
+    ChecksumError,
+    IncompleteReadError,
+)
+_RETRYABLE_ERROR_CODES = {
+    'InternalError',
+    'RequestTimeout',
+    'ServiceUnavailable',
+    'SlowDown',
+}
+
+
+def is_retryable_error(error):
+    if isinstance(error, _RETRYABLE_EXCEPTIONS):
+        return True
+    if isinstance(error, ClientError):
+        code = error.response.get('Error', {}).get('Code')
+        status = error.response.get('ResponseMetadata', {}).get(
+            'HTTPStatusCode', 0
+        )
+        return code in _RETRYABLE_ERROR_CODES or status >= 500
+    return False
+
+
+async def retry_part(coro_factory, max_attempts, description):
+    """Awaits ``coro_factory()``, retrying retryable errors.
+
+    This is on top of the client's own retries: a part whose request
+    exhausted them, or whose body failed validation, is tried again without
+    failing the whole transfer.
+    """
+    attempt = 1
+    while True:
+        try:
+            return await coro_factory()
+        except Exception as e:
+            if attempt >= max_attempts or not is_retryable_error(e):
+                raise
+            delay = random.uniform(0, min(20, 0.1 * 2**attempt))
+            logger.debug(
+                'Retrying %s after error (attempt %s): %r',
+                description,
+                attempt,
+                e,
+            )
+            attempt += 1
+            await asyncio.sleep(delay)
+
+
+def validate_part_size(part_size):
+    """Raises ParamValidationError unless S3 accepts parts of ``part_size``.
+
+    The last part of an upload may be smaller, but S3 only tells parts
+    below the minimum apart when the upload is completed.
+    """
+    if not MIN_PART_SIZE <= part_size <= MAX_PART_SIZE:
+        raise ParamValidationError(
+            report=f'part_size must be between {MIN_PART_SIZE} and '
+            f'{MAX_PART_SIZE} bytes, not {part_size}'
+        )
+
+
+def part_size_for(size, part_size):
+    """``part_size``, raised as needed to split ``size`` bytes into at most
+    ``MAX_PARTS`` parts."""
+    part_size = max(part_size, -(-size // MAX_PARTS))
+    if part_size > MAX_PART_SIZE:
+        raise ParamValidationError(
+            report=f'The source size {size} is above the S3 limit of '
+            f'{MAX_PARTS} parts of {MAX_PART_SIZE} bytes'
+        )
+    return part_size
+
+
+def operation_args(client, operation_name, kwargs):
+    """The items of ``kwargs`` accepted by ``operation_name``."""
+    members = client.meta.service_model.operation_model(
+        operation_name
+    ).input_shape.members
+    return {k: v for k, v in kwargs.items() if k in members}
+
+
+async def abort_multipart_upload(client, upload, extra_args):
+    """Aborts ``upload``, logging rather than raising failures."""
+    try:
+        await client.abort_multipart_upload(
+            **operation_args(client, 'AbortMultipartUpload', extra_args),
+            **upload,
+        )
+    except Exception:
+        logger.warning(
+            'Failed to abort multipart upload %s',
+            upload['UploadId'],
+            exc_info=True,
+        )
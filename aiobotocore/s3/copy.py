@@ -0,0 +1,233 @@
+import asyncio
+from urllib.parse import urlencode
+
+from botocore.exceptions import ParamValidationError
+
+from ._helpers import (
+    MB,
+    abort_multipart_upload,
+    operation_args,
+    part_size_for,
+    retry_part,
+    validate_part_size,
+)
+
+# head_object fields which are copied to the new object, as copy_object
+# does with the default MetadataDirective of COPY
+_METADATA_FIELDS = (
+    'CacheControl',
+    'ContentDisposition',
+    'ContentEncoding',
+    'ContentLanguage',
+    'ContentType',
+    'Expires',
+    'Metadata',
+    'WebsiteRedirectLocation',
+)
+
+# copy_object parameters describing the source, and the head_object
+# parameters they correspond to
+_SOURCE_ARGS = {
+    'CopySourceSSECustomerAlgorithm': 'SSECustomerAlgorithm',
+    'CopySourceSSECustomerKey': 'SSECustomerKey',
+    'CopySourceSSECustomerKeyMD5': 'SSECustomerKeyMD5',
+    'ExpectedSourceBucketOwner': 'ExpectedBucketOwner',
+    'RequestPayer': 'RequestPayer',
+}
+
+
+def _parse_copy_source(copy_source):
+    if isinstance(copy_source, dict):
+        if 'Bucket' not in copy_source or 'Key' not in copy_source:
+            raise ParamValidationError(
+                report='CopySource must have a Bucket and a Key'
+            )
+        return dict(copy_source)
+    bucket, _, key = copy_source.lstrip('/').partition('/')
+    if not key:
+        raise ParamValidationError(
+            report=f'Invalid CopySource: {copy_source!r}'
+        )
+    return {'Bucket': bucket, 'Key': key}
+
+
+class MultipartCopier:
+    """Copies S3 objects with concurrent ``upload_part_copy`` ranges.
+
+    ``copy_object`` is limited to 5 GB and copies the object in a single
+    request.  The copier plans ``part_size`` ranges from a ``head_object``
+    of the source and copies them with ``upload_part_copy``, at most
+    ``max_concurrency`` at a time::
+
+        copier = MultipartCopier(client, max_concurrency=32)
+        await copier.copy(
+            {'Bucket': 'source', 'Key': 'key'}, Bucket='target', Key='key'
+        )
+
+    Like ``copy_object``, the metadata and tags of the source are kept
+    unless ``MetadataDirective`` or ``TaggingDirective`` is ``REPLACE``.
+    The parts are pinned to the ETag (and ``VersionId``) of the
+    ``head_object`` response.  A part failing with a retryable error is
+    retried up to ``max_part_attempts`` times, on top of the client's own
+    retries.  If the copy fails or is cancelled the upload is aborted.
+    Objects which fit in a single part are copied with ``copy_object``.
+
+    :param source_client: Client for the ``head_object`` and
+        ``get_object_tagging`` of the source, when it is in another region
+        or account than ``client``.
+    :param part_size: Size of the copied ranges, from 5 MiB to 5 GiB.  It is
+        raised when needed to stay within S3's limit of 10000 parts.
+    """
+
+    def __init__(
+        self,
+        client,
+        *,
+        source_client=None,
+        part_size=64 * MB,
+        max_concurrency=10,
+        max_part_attempts=3,
+    ):
+        # part_size is also the largest object copied with copy_object
+        validate_part_size(part_size)
+        if max_concurrency < 1:
+            raise ParamValidationError(
+                report='max_concurrency must be at least 1'
+            )
+        self._client = client
+        self._source_client = source_client or client
+        self._part_size = part_size
+        self._max_concurrency = max_concurrency
+        self._max_part_attempts = max_part_attempts
+
+    async def copy(self, CopySource, Bucket, Key, **extra_args):
+        """Copies ``CopySource`` to ``Bucket`` and ``Key``.
+
+        :param CopySource: A dict with the ``Bucket``, ``Key`` and
+            optionally ``VersionId`` of the source, or a ``bucket/key``
+            string.
+        :param extra_args: ``copy_object`` parameters, e.g.
+            ``StorageClass`` or ``CopySourceSSECustomerKey``.
+        :return: The ``complete_multipart_upload`` or ``copy_object``
+            response.
+        """
+        unknown = set(extra_args) - set(
+            operation_args(self._client, 'CopyObject', extra_args)
+        )
+        if unknown:
+            raise ParamValidationError(
+                report=f'Unsupported copy parameters: {sorted(unknown)}'
+            )
+        source = _parse_copy_source(CopySource)
+
+        head_args = {
+            head_name: extra_args[name]
+            for name, head_name in _SOURCE_ARGS.items()
+            if name in extra_args
+        }
+        head = await self._source_client.head_object(**source, **head_args)
+        size = head['ContentLength']
+        if 'VersionId' in head:
+            source['VersionId'] = head['VersionId']
+        extra_args.setdefault('CopySourceIfMatch', head['ETag'])
+
+        part_size = part_size_for(size, self._part_size)
+        if size <= part_size:
+            return await retry_part(
+                lambda: self._client.copy_object(
+                    CopySource=source, Bucket=Bucket, Key=Key, **extra_args
+                ),
+                self._max_part_attempts,
+                f'copy of {Bucket}/{Key}',
+            )
+
+        create_args = operation_args(
+            self._client, 'CreateMultipartUpload', extra_args
+        )
+        if extra_args.get('MetadataDirective') != 'REPLACE':
+            for name in _METADATA_FIELDS:
+                if name in head:
+                    create_args[name] = head[name]
+        if extra_args.get('TaggingDirective') != 'REPLACE':
+            create_args.pop('Tagging', None)
+            tagging = await self._source_client.get_object_tagging(
+                **source,
+                **operation_args(
+                    self._source_client, 'GetObjectTagging', head_args
+                ),
+            )
+            if tagging['TagSet']:
+                create_args['Tagging'] = urlencode(
+                    [(tag['Key'], tag['Value']) for tag in tagging['TagSet']]
+                )
+
+        response = await self._client.create_multipart_upload(
+            Bucket=Bucket, Key=Key, **create_args
+        )
+        upload = dict(Bucket=Bucket, Key=Key, UploadId=response['UploadId'])
+        ranges = [
+            (start, min(start + part_size, size) - 1)
+            for start in range(0, size, part_size)
+        ]
+        try:
+            parts = await self._copy_parts(
+                source,
+                ranges,
+                upload,
+                create_args.get('ChecksumAlgorithm'),
+                operation_args(self._client, 'UploadPartCopy', extra_args),
+            )
+            return await self._client.complete_multipart_upload(
+                MultipartUpload={'Parts': parts},
+                **operation_args(
+                    self._client, 'CompleteMultipartUpload', extra_args
+                ),
+                **upload,
+            )
+        except BaseException:
+            await abort_multipart_upload(self._client, upload, extra_args)
+            raise
+
+    async def _copy_parts(self, source, ranges, upload, algorithm, part_args):
+        concurrency = asyncio.Semaphore(self._max_concurrency)
+
+        async def copy_part(part_number, start, end):
+            async with concurrency:
+                return await retry_part(
+                    lambda: self._copy_part(
+                        source, part_number, start, end, upload, part_args
+                    ),
+                    self._max_part_attempts,
+                    f'part {part_number} of {upload["UploadId"]}',
+                )
+
+        tasks = [
+            asyncio.ensure_future(copy_part(part_number, start, end))
+            for part_number, (start, end) in enumerate(ranges, 1)
+        ]
+        try:
+            results = await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        parts = []
+        for part_number, result in enumerate(results, 1):
+            part = {'ETag': result['ETag'], 'PartNumber': part_number}
+            if algorithm:
+                checksum_name = f'Checksum{algorithm.upper()}'
+                if checksum_name in result:
+                    part[checksum_name] = result[checksum_name]
+            parts.append(part)
+        return parts
+
+    async def _copy_part(self, source, part_number, start, end, upload, args):
+        response = await self._client.upload_part_copy(
+            CopySource=source,
+            CopySourceRange=f'bytes={start}-{end}',
+            PartNumber=part_number,
+            **args,
+            **upload,
+        )
+        return response['CopyPartResult']
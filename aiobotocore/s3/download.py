@@ -0,0 +1,226 @@
+import asyncio
+import os
+import uuid
+from collections import deque
+
+from botocore.exceptions import (
+    BotoCoreError,
+    IncompleteReadError,
+    ParamValidationError,
+)
+
+from ._helpers import MB, operation_args, retry_part
+
+
+class ObjectChangedError(BotoCoreError):
+    """The object was overwritten while it was being downloaded."""
+
+    fmt = (
+        'Object {bucket}/{key} changed during the download: its ETag was '
+        '{expected} and is now {actual}'
+    )
+
+
+class RangedDownloader:
+    """Downloads objects from S3 with concurrent ranged GETs.
+
+    After a ``head_object``, the object is fetched in ``part_size`` ranges
+    with ``get_object``, at most ``max_concurrency`` at a time, over the
+    client's connection pool.  It is either written to a file with
+    positional writes, or streamed in order::
+
+        downloader = RangedDownloader(client, max_concurrency=16)
+        await downloader.download_file('bucket', 'key', '/tmp/data.bin')
+
+        async for chunk in downloader.iter_chunks('bucket', 'key'):
+            ...
+
+    All the ranges are requested with the ``IfMatch`` ETag (and the
+    ``VersionId``, when versioned) of the ``head_object`` response so they
+    are from the same version of the object, and their lengths are
+    checked.  A range failing with a retryable error is retried up to
+    ``max_part_attempts`` times, on top of the client's own retries.  An
+    object that fits in a single part is fetched without a ``Range``, so
+    ``ChecksumMode`` validation applies to it.
+    """
+
+    def __init__(
+        self,
+        client,
+        *,
+        part_size=8 * MB,
+        max_concurrency=10,
+        max_part_attempts=3,
+    ):
+        if part_size < 1:
+            raise ParamValidationError(report='part_size must be positive')
+        if max_concurrency < 1:
+            raise ParamValidationError(
+                report='max_concurrency must be at least 1'
+            )
+        self._client = client
+        self._part_size = part_size
+        self._max_concurrency = max_concurrency
+        self._max_part_attempts = max_part_attempts
+
+    async def download_file(self, Bucket, Key, Filename, **extra_args):
+        """Downloads ``Bucket`` and ``Key`` to the file ``Filename``.
+
+        The object is written to a temporary file next to ``Filename``
+        which is renamed once complete.
+
+        :param extra_args: ``get_object`` parameters, e.g. ``VersionId`` or
+            ``SSECustomerKey``.
+        :return: The ``head_object`` response.
+        """
+        head, ranges, get_args = await self._plan(Bucket, Key, extra_args)
+        loop = asyncio.get_running_loop()
+        temp_name = f'{Filename}.{uuid.uuid4().hex[:8]}'
+        fd = await loop.run_in_executor(
+            None, _open_preallocated, temp_name, head['ContentLength']
+        )
+        concurrency = asyncio.Semaphore(self._max_concurrency)
+        writes = []
+
+        async def download_range(start, end):
+            async with concurrency:
+                data = await self._get_range(Bucket, Key, get_args, start, end)
+                writes.append(
+                    loop.run_in_executor(None, _pwrite_full, fd, data, start)
+                )
+                # a write can't be interrupted so it isn't cancelled
+                await asyncio.shield(writes[-1])
+
+        tasks = [
+            asyncio.ensure_future(download_range(start, end))
+            for start, end in ranges
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            await _cancel(tasks)
+            await asyncio.gather(*writes, return_exceptions=True)
+            os.close(fd)
+            os.unlink(temp_name)
+            raise
+        await loop.run_in_executor(
+            None, _close_and_replace, fd, temp_name, Filename
+        )
+        return head
+
+    async def iter_chunks(self, Bucket, Key, **extra_args):
+        """Yields the content of ``Bucket`` and ``Key`` in order.
+
+        Up to ``max_concurrency`` ranges are fetched ahead of the one being
+        consumed and held until their turn comes.
+
+        :param extra_args: ``get_object`` parameters, e.g. ``VersionId`` or
+            ``SSECustomerKey``.
+        """
+        _, ranges, get_args = await self._plan(Bucket, Key, extra_args)
+        ranges = deque(ranges)
+        window = deque()
+
+        def fill():
+            while ranges and len(window) < self._max_concurrency:
+                start, end = ranges.popleft()
+                window.append(
+                    asyncio.ensure_future(
+                        self._get_range(Bucket, Key, get_args, start, end)
+                    )
+                )
+
+        try:
+            fill()
+            while window:
+                data = await window.popleft()
+                fill()
+                yield data
+        finally:
+            await _cancel(window)
+
+    async def _plan(self, bucket, key, extra_args):
+        get_args = operation_args(self._client, 'GetObject', extra_args)
+        unknown = set(extra_args) - set(get_args)
+        unknown.update(k for k in ('Range', 'PartNumber') if k in extra_args)
+        if unknown:
+            raise ParamValidationError(
+                report=f'Unsupported download parameters: {sorted(unknown)}'
+            )
+
+        head = await self._client.head_object(
+            Bucket=bucket,
+            Key=key,
+            **operation_args(self._client, 'HeadObject', extra_args),
+        )
+        get_args['IfMatch'] = head['ETag']
+        if 'VersionId' in head:
+            get_args['VersionId'] = head['VersionId']
+
+        size = head['ContentLength']
+        if size <= self._part_size:
+            ranges = [(0, None)] if size else []
+        else:
+            ranges = [
+                (start, min(start + self._part_size, size) - 1)
+                for start in range(0, size, self._part_size)
+            ]
+        return head, ranges, get_args
+
+    async def _get_range(self, bucket, key, get_args, start, end):
+        kwargs = dict(get_args, Bucket=bucket, Key=key)
+        if end is not None:
+            kwargs['Range'] = f'bytes={start}-{end}'
+
+        async def get():
+            response = await self._client.get_object(**kwargs)
+            body = response['Body']
+            try:
+                data = await body.read()
+            finally:
+                body.close()
+            if response['ETag'] != get_args['IfMatch']:
+                raise ObjectChangedError(
+                    bucket=bucket,
+                    key=key,
+                    expected=get_args['IfMatch'],
+                    actual=response['ETag'],
+                )
+            if end is not None and len(data) != end - start + 1:
+                raise IncompleteReadError(
+                    actual_bytes=len(data), expected_bytes=end - start + 1
+                )
+            return data
+
+        return await retry_part(
+            get, self._max_part_attempts, f'bytes {start}-{end} of {key}'
+        )
+
+
+async def _cancel(tasks):
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _open_preallocated(filename, size):
+    fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        os.ftruncate(fd, size)
+    except BaseException:
+        os.close(fd)
+        raise
+    return fd
+
+
+def _pwrite_full(fd, data, offset):
+    view = memoryview(data)
+    while view:
+        written = os.pwrite(fd, view, offset)
+        view = view[written:]
+        offset += written
+
+
+def _close_and_replace(fd, temp_name, filename):
+    os.close(fd)
+    os.replace(temp_name, filename)
@@ -0,0 +1,280 @@
+import asyncio
+from collections import deque
+
+from botocore.exceptions import ParamValidationError
+
+
+class _Partition:
+    """A key range listed by one ``list_objects_v2`` pagination.
+
+    Keys are in ``Prefix``, after ``start_after`` and up to and including
+    ``end``.  None means unbounded.
+    """
+
+    def __init__(self, prefix, start_after=None, end=None):
+        self.prefix = prefix
+        self.start_after = start_after
+        self.end = end
+        self.pages = None
+
+
+_DONE = object()
+
+
+class PartitionedObjectLister:
+    """Lists the objects of an S3 prefix with concurrent paginations.
+
+    The key space under ``Prefix`` is split into partitions which are each
+    listed with their own ``list_objects_v2`` paginator, at most
+    ``max_concurrency`` at a time.  Iterating over the lister yields the
+    object dicts (the ``Contents`` entries) of all partitions::
+
+        lister = PartitionedObjectLister(client, Bucket='bucket')
+        async for obj in lister:
+            print(obj['Key'])
+
+    By default the partitions are the common prefixes found by listing
+    ``Prefix`` with ``delimiter``, ``split_depth`` levels deep.  The levels
+    are listed one page at a time while the partitions found so far are
+    listed, and the objects directly under a level are passed on from its
+    pages rather than collected first.  A flat key space has no common
+    prefixes to split at and is then listed by a single pagination; give
+    ``split_points``, sorted keys to split at, for those.  Each of their
+    partitions is listed with ``StartAfter``.
+
+    :param client: An S3 client.
+    :param ordered: Yield objects in key order.  Partitions are then
+        consumed one after the other while later ones are listed into a
+        buffer of at most ``buffer_pages`` pages each.  Otherwise objects
+        are yielded as soon as any partition returns them.
+    :param page_size: ``PageSize`` for the partition paginators.
+    :param prefetch: ``Prefetch`` for the partition paginators.
+    :param list_kwargs: Additional ``list_objects_v2`` parameters, e.g.
+        ``StartAfter`` or ``RequestPayer``.
+    """
+
+    def __init__(
+        self,
+        client,
+        Bucket,
+        Prefix='',
+        *,
+        delimiter='/',
+        split_depth=1,
+        split_points=None,
+        max_concurrency=10,
+        ordered=False,
+        page_size=None,
+        prefetch=1,
+        buffer_pages=2,
+        **list_kwargs,
+    ):
+        if 'Delimiter' in list_kwargs or 'ContinuationToken' in list_kwargs:
+            raise ParamValidationError(
+                report='Delimiter and ContinuationToken are not supported '
+                'by PartitionedObjectLister'
+            )
+        if max_concurrency < 1:
+            raise ParamValidationError(
+                report='max_concurrency must be at least 1'
+            )
+        if split_points is not None and list(split_points) != sorted(
+            split_points
+        ):
+            raise ParamValidationError(report='split_points must be sorted')
+
+        self._client = client
+        self._bucket = Bucket
+        self._prefix = Prefix
+        self._delimiter = delimiter
+        self._split_depth = split_depth
+        self._split_points = split_points
+        self._max_concurrency = max_concurrency
+        self._ordered = ordered
+        self._buffer_pages = buffer_pages
+        self._start_after = list_kwargs.pop('StartAfter', None)
+        self._list_kwargs = list_kwargs
+        self._pagination_config = {'Prefetch': prefetch}
+        if page_size is not None:
+            self._pagination_config['PageSize'] = page_size
+
+    def __aiter__(self):
+        return self._iter_objects()
+
+    async def _iter_objects(self):
+        # Partitions are queued for the workers as the planner finds them.
+        # In order, the planner's output holds the objects found while
+        # splitting and the partitions, each listed into a buffer of its
+        # own.  Otherwise all pages go to the output, whose producers are
+        # counted to know when the listing is complete.
+        output = asyncio.Queue(self._buffer_pages * self._max_concurrency)
+        pending = asyncio.Queue(self._max_concurrency)
+        slots = asyncio.Semaphore(self._max_concurrency)
+        producers = 1
+
+        async def emit(segment):
+            nonlocal producers
+            if not isinstance(segment, _Partition):
+                await output.put(segment)
+            elif self._ordered:
+                # partitions are started in key order so the one being
+                # consumed is always being listed and the buffers can't
+                # deadlock
+                segment.pages = asyncio.Queue(self._buffer_pages)
+                await pending.put(segment)
+                await output.put(segment)
+            else:
+                segment.pages = output
+                producers += 1
+                await pending.put(segment)
+
+        tasks = [asyncio.ensure_future(self._planner(emit, output, slots))]
+        tasks.extend(
+            asyncio.ensure_future(self._worker(pending, slots))
+            for _ in range(self._max_concurrency)
+        )
+        try:
+            if self._ordered:
+                async for segment in self._drain(output, 1):
+                    if isinstance(segment, _Partition):
+                        async for page in self._drain(segment.pages, 1):
+                            for obj in page:
+                                yield obj
+                    else:
+                        for obj in segment:
+                            yield obj
+            else:
+                done = 0
+                while done < producers:
+                    page = await output.get()
+                    if page is _DONE:
+                        done += 1
+                    elif isinstance(page, Exception):
+                        raise page
+                    else:
+                        for obj in page:
+                            yield obj
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    @staticmethod
+    async def _drain(queue, producers):
+        while producers:
+            item = await queue.get()
+            if item is _DONE:
+                producers -= 1
+            elif isinstance(item, Exception):
+                raise item
+            else:
+                yield item
+
+    async def _worker(self, pending, slots):
+        while True:
+            partition = await pending.get()
+            try:
+                async with slots:
+                    await self._list_partition(partition)
+            except Exception as e:
+                await partition.pages.put(e)
+            await partition.pages.put(_DONE)
+
+    async def _list_partition(self, partition):
+        kwargs = dict(self._list_kwargs, Bucket=self._bucket)
+        kwargs['Prefix'] = partition.prefix
+        if partition.start_after is not None:
+            kwargs['StartAfter'] = partition.start_after
+
+        paginator = self._client.get_paginator('list_objects_v2')
+        pages = paginator.paginate(
+            PaginationConfig=self._pagination_config, **kwargs
+        ).__aiter__()
+        try:
+            async for page in pages:
+                contents = page.get('Contents', [])
+                end = partition.end
+                if end is not None and contents and contents[-1]['Key'] > end:
+                    await partition.pages.put(
+                        [o for o in contents if o['Key'] <= end]
+                    )
+                    break
+                if contents:
+                    await partition.pages.put(contents)
+        finally:
+            # stops the paginator's prefetching when the end is reached or
+            # the listing is cancelled
+            await pages.aclose()
+
+    async def _planner(self, emit, output, slots):
+        try:
+            if self._split_points is not None:
+                for partition in self._plan_split_points():
+                    await emit(partition)
+            else:
+                await self._plan_level(
+                    self._prefix, self._split_depth, emit, slots
+                )
+        except Exception as e:
+            await output.put(e)
+        await output.put(_DONE)
+
+    async def _plan_level(self, prefix, depth, emit, slots):
+        # Passes the objects directly under the level and the partitions of
+        # its common prefixes to emit in key order, while the level is
+        # listed.
+        if depth < 1:
+            start_after = self._start_after
+            if start_after is not None and not start_after.startswith(prefix):
+                # StartAfter only affects the partition it falls in
+                start_after = None
+            await emit(_Partition(prefix, start_after=start_after))
+            return
+
+        kwargs = dict(self._list_kwargs, Bucket=self._bucket)
+        kwargs.update(Prefix=prefix, Delimiter=self._delimiter)
+        if self._start_after is not None:
+            kwargs['StartAfter'] = self._start_after
+        # pages are requested while holding a slot, so not in the background
+        pagination_config = {
+            k: v for k, v in self._pagination_config.items() if k != 'Prefetch'
+        }
+        paginator = self._client.get_paginator('list_objects_v2')
+        pages = paginator.paginate(
+            PaginationConfig=pagination_config, **kwargs
+        ).__aiter__()
+        try:
+            while True:
+                # a request of the planner takes one of the slots of the
+                # partitions, which aren't blocked on it while it waits
+                async with slots:
+                    try:
+                        page = await pages.__anext__()
+                    except StopAsyncIteration:
+                        break
+                objects = deque(page.get('Contents', []))
+                for child in page.get('CommonPrefixes', []):
+                    child = child['Prefix']
+                    before = []
+                    while objects and objects[0]['Key'] < child:
+                        before.append(objects.popleft())
+                    if before:
+                        await emit(before)
+                    await self._plan_level(child, depth - 1, emit, slots)
+                if objects:
+                    await emit(list(objects))
+        finally:
+            await pages.aclose()
+
+    def _plan_split_points(self):
+        bounds = [self._start_after]
+        bounds.extend(
+            point
+            for point in self._split_points
+            if self._start_after is None or point > self._start_after
+        )
+        bounds.append(None)
+        return [
+            _Partition(self._prefix, start_after=start, end=end)
+            for start, end in zip(bounds, bounds[1:])
+        ]
@@ -0,0 +1,335 @@
+import asyncio
+import os
+
+from botocore.exceptions import ParamValidationError
+
+from ._helpers import (
+    MAX_PART_SIZE,
+    MAX_PARTS,
+    MB,
+    abort_multipart_upload,
+    operation_args,
+    part_size_for,
+    retry_part,
+    validate_part_size,
+)
+
+# parts of sources of unknown size double in size every this many parts, so
+# that S3's 10000 parts hold about 1000 times more than at a fixed size
+_PART_SIZE_DOUBLING_INTERVAL = 1000
+
+
+class _PartReader:
+    """Reads an upload source in parts without blocking the event loop.
+
+    The source can be bytes, a file path, a file object with a sync or
+    async ``read`` method, or an async iterable of bytes.  Sync reads are
+    made in the default executor.
+    """
+
+    def __init__(self, source):
+        self.size = None
+        self._source = source
+        self._fd = None
+        self._offset = 0
+        self._buffer = bytearray()
+        self._iterator = None
+
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            self._source = memoryview(source)
+            self.size = len(self._source)
+        elif isinstance(source, (str, os.PathLike)):
+            self._fd = os.open(source, os.O_RDONLY)
+            self.size = os.fstat(self._fd).st_size
+        elif hasattr(source, 'read'):
+            pass
+        elif hasattr(source, '__aiter__'):
+            self._iterator = source.__aiter__()
+        else:
+            raise ParamValidationError(
+                report=f'Unsupported upload source: {type(source)}'
+            )
+
+    async def read(self, size):
+        """Reads ``size`` bytes, fewer only at the end of the source."""
+        loop = asyncio.get_running_loop()
+        if isinstance(self._source, memoryview):
+            chunk = self._source[self._offset : self._offset + size]
+            self._offset += len(chunk)
+            return bytes(chunk)
+        if self._fd is not None:
+            chunk = await loop.run_in_executor(
+                None, _pread_full, self._fd, size, self._offset
+            )
+            self._offset += len(chunk)
+            return chunk
+        if self._iterator is not None:
+            return await self._read_iterator(size)
+
+        read = self._source.read
+        if asyncio.iscoroutinefunction(read):
+            return await _read_full_async(read, size)
+        return await loop.run_in_executor(None, _read_full, read, size)
+
+    async def _read_iterator(self, size):
+        while len(self._buffer) < size:
+            try:
+                self._buffer += await self._iterator.__anext__()
+            except StopAsyncIteration:
+                break
+        chunk = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return chunk
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+def _pread_full(fd, size, offset):
+    chunks = []
+    while size:
+        chunk = os.pread(fd, size, offset)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        size -= len(chunk)
+        offset += len(chunk)
+    return b''.join(chunks)
+
+
+def _read_full(read, size):
+    chunks = []
+    while size:
+        chunk = read(size)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b''.join(chunks)
+
+
+async def _read_full_async(read, size):
+    chunks = []
+    while size:
+        chunk = await read(size)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b''.join(chunks)
+
+
+class MultipartUploader:
+    """Uploads objects to S3 with concurrent multipart uploads.
+
+    The source is read in ``part_size`` parts which are uploaded with
+    ``upload_part``, at most ``max_concurrency`` at a time, over the
+    client's connection pool.  Sources which fit in a single part are
+    uploaded with ``put_object`` instead::
+
+        uploader = MultipartUploader(client, max_concurrency=16)
+        await uploader.upload('/tmp/data.bin', Bucket='bucket', Key='key')
+
+    Each part is checksummed by the client with ``checksum_algorithm``
+    (the trailing checksum of an aws-chunked body over https) and the
+    part checksums are sent with the completion.  A part failing with a
+    retryable error is retried up to ``max_part_attempts`` times, on top of
+    the client's own retries.  If the upload fails or is cancelled it is
+    aborted.
+
+    :param part_size: Size of the parts, from 5 MiB to 5 GiB.  For sources
+        of known size it is raised when needed to stay within S3's limit of
+        10000 parts.  For sources of unknown size it doubles every 1000
+        parts, up to 5 GiB.
+    :param max_memory: Bound on the part bodies held in memory, read ahead
+        or being uploaded.  Defaults to one part more than
+        ``max_concurrency``, parts which have grown counting as several.
+    :param checksum_algorithm: ``ChecksumAlgorithm`` of the upload, or None
+        to not send checksums.
+    """
+
+    def __init__(
+        self,
+        client,
+        *,
+        part_size=8 * MB,
+        max_concurrency=10,
+        max_memory=None,
+        checksum_algorithm='CRC32',
+        max_part_attempts=3,
+    ):
+        validate_part_size(part_size)
+        if max_concurrency < 1:
+            raise ParamValidationError(
+                report='max_concurrency must be at least 1'
+            )
+        self._client = client
+        self._part_size = part_size
+        self._max_concurrency = max_concurrency
+        self._max_memory = max_memory
+        self._checksum_algorithm = checksum_algorithm
+        self._max_part_attempts = max_part_attempts
+
+    async def upload(self, source, Bucket, Key, **extra_args):
+        """Uploads ``source`` to ``Bucket`` and ``Key``.
+
+        :param extra_args: ``create_multipart_upload`` parameters, e.g.
+            ``ContentType`` or ``Metadata``.  The ones ``upload_part`` and
+            ``complete_multipart_upload`` also accept, like
+            ``SSECustomerKey``, are passed to them as well.
+        :return: The ``complete_multipart_upload`` or ``put_object``
+            response.
+        """
+        unknown = set(extra_args) - set(
+            operation_args(self._client, 'CreateMultipartUpload', extra_args)
+        )
+        if unknown:
+            raise ParamValidationError(
+                report=f'Unsupported upload parameters: {sorted(unknown)}'
+            )
+        algorithm = extra_args.pop(
+            'ChecksumAlgorithm', self._checksum_algorithm
+        )
+
+        reader = _PartReader(source)
+        try:
+            part_size = self._part_size
+            if reader.size is not None:
+                part_size = part_size_for(reader.size, part_size)
+            first = await reader.read(part_size)
+            if len(first) < part_size:
+                return await self._put_object(
+                    first, Bucket, Key, algorithm, extra_args
+                )
+            return await self._upload_multipart(
+                reader, first, part_size, Bucket, Key, algorithm, extra_args
+            )
+        finally:
+            reader.close()
+
+    async def _put_object(self, body, bucket, key, algorithm, extra_args):
+        kwargs = dict(extra_args, Bucket=bucket, Key=key, Body=body)
+        if algorithm:
+            kwargs['ChecksumAlgorithm'] = algorithm
+        return await retry_part(
+            lambda: self._client.put_object(**kwargs),
+            self._max_part_attempts,
+            f'put of {bucket}/{key}',
+        )
+
+    async def _upload_multipart(
+        self, reader, first, part_size, bucket, key, algorithm, extra_args
+    ):
+        create_kwargs = dict(extra_args)
+        if algorithm:
+            create_kwargs['ChecksumAlgorithm'] = algorithm
+        response = await self._client.create_multipart_upload(
+            Bucket=bucket, Key=key, **create_kwargs
+        )
+        upload = dict(Bucket=bucket, Key=key, UploadId=response['UploadId'])
+
+        try:
+            parts = await self._upload_parts(
+                reader,
+                first,
+                part_size,
+                upload,
+                algorithm,
+                operation_args(self._client, 'UploadPart', extra_args),
+            )
+            return await self._client.complete_multipart_upload(
+                MultipartUpload={'Parts': parts},
+                **operation_args(
+                    self._client, 'CompleteMultipartUpload', extra_args
+                ),
+                **upload,
+            )
+        except BaseException:
+            await abort_multipart_upload(self._client, upload, extra_args)
+            raise
+
+    async def _upload_parts(
+        self, reader, first, part_size, upload, algorithm, part_args
+    ):
+        if self._max_memory is None:
+            memory_parts = self._max_concurrency + 1
+        else:
+            memory_parts = max(1, self._max_memory // part_size)
+        # a slot of `memory` is taken by each part from when it is read
+        # until its upload is done
+        memory = asyncio.Semaphore(memory_parts)
+        concurrency = asyncio.Semaphore(self._max_concurrency)
+        failed = False
+
+        async def upload_part(part_number, body, weight):
+            nonlocal failed
+            try:
+                async with concurrency:
+                    return await retry_part(
+                        lambda: self._upload_part(
+                            part_number, body, upload, algorithm, part_args
+                        ),
+                        self._max_part_attempts,
+                        f'part {part_number} of {upload["UploadId"]}',
+                    )
+            except BaseException:
+                failed = True
+                raise
+            finally:
+                for _ in range(weight):
+                    memory.release()
+
+        tasks = []
+        body = first
+        weight = 1
+        await memory.acquire()
+        try:
+            while True:
+                tasks.append(
+                    asyncio.ensure_future(
+                        upload_part(len(tasks) + 1, body, weight)
+                    )
+                )
+                size = part_size
+                if reader.size is None:
+                    size = _grown_part_size(part_size, len(tasks) + 1)
+                weight = min(memory_parts, -(-size // part_size))
+                for _ in range(weight):
+                    await memory.acquire()
+                if failed:
+                    break
+                body = await reader.read(size)
+                if not body:
+                    break
+                if len(tasks) == MAX_PARTS:
+                    raise ParamValidationError(
+                        report=f'The source is larger than the {MAX_PARTS} '
+                        'parts of the upload can hold, use a larger '
+                        'part_size'
+                    )
+            return await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _upload_part(
+        self, part_number, body, upload, algorithm, part_args
+    ):
+        kwargs = dict(part_args, PartNumber=part_number, Body=body, **upload)
+        if algorithm:
+            kwargs['ChecksumAlgorithm'] = algorithm
+        response = await self._client.upload_part(**kwargs)
+        part = {'ETag': response['ETag'], 'PartNumber': part_number}
+        if algorithm:
+            checksum_name = f'Checksum{algorithm.upper()}'
+            if checksum_name in response:
+                part[checksum_name] = response[checksum_name]
+        return part
+
+
+def _grown_part_size(part_size, part_number):
+    doublings = (part_number - 1) // _PART_SIZE_DOUBLING_INTERVAL
+    return min(part_size << doublings, MAX_PART_SIZE)
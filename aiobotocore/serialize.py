@@ -0,0 +1,74 @@
+import json
+
+from botocore import validate
+from botocore.serialize import SERIALIZERS as BOTO_SERIALIZERS
+from botocore.serialize import JSONSerializer, RestJSONSerializer
+
+
+class _JSONBackendSerializerMixin:
+    def __init__(self, json_backend=None):
+        super().__init__()
+        self._json_backend = json_backend
+
+    def _dumps(self, value):
+        if self._json_backend is not None:
+            try:
+                return self._json_backend.dumps(value)
+            except (TypeError, ValueError, OverflowError):
+                # values the codec can't represent, e.g. huge integers
+                pass
+        return json.dumps(value).encode(self.DEFAULT_ENCODING)
+
+
+class AioJSONSerializer(_JSONBackendSerializerMixin, JSONSerializer):
+    def serialize_to_request(self, parameters, operation_model):
+        target = '{}.{}'.format(
+            operation_model.metadata['targetPrefix'],
+            operation_model.name,
+        )
+        json_version = operation_model.metadata['jsonVersion']
+        serialized = self._create_default_request()
+        serialized['method'] = operation_model.http.get(
+            'method', self.DEFAULT_METHOD
+        )
+        serialized['headers'] = {
+            'X-Amz-Target': target,
+            'Content-Type': 'application/x-amz-json-%s' % json_version,
+        }
+        body = self.MAP_TYPE()
+        input_shape = operation_model.input_shape
+        if input_shape is not None:
+            self._serialize(body, parameters, input_shape)
+        serialized['body'] = self._dumps(body)
+
+        host_prefix = self._expand_host_prefix(parameters, operation_model)
+        if host_prefix is not None:
+            serialized['host_prefix'] = host_prefix
+
+        return serialized
+
+
+class AioRestJSONSerializer(_JSONBackendSerializerMixin, RestJSONSerializer):
+    def _serialize_body_params(self, params, shape):
+        serialized_body = self.MAP_TYPE()
+        self._serialize(serialized_body, params, shape)
+        return self._dumps(serialized_body)
+
+
+SERIALIZERS = {
+    'json': AioJSONSerializer,
+    'rest-json': AioRestJSONSerializer,
+}
+
+
+def create_serializer(
+    protocol_name, include_validation=True, json_backend=None
+):
+    if protocol_name in SERIALIZERS:
+        serializer = SERIALIZERS[protocol_name](json_backend)
+    else:
+        serializer = BOTO_SERIALIZERS[protocol_name]()
+    if include_validation:
+        validator = validate.ParamValidator()
+        serializer = validate.ParamValidationDecorator(validator, serializer)
+    return serializer
@@ -1,21 +1,64 @@
+import asyncio
+import functools
+
 from botocore import UNSIGNED, translate
-from botocore.exceptions import PartialCredentialsError
+from botocore.exceptions import DataNotFoundError, PartialCredentialsError
 from botocore.session import (
     EVENT_ALIASES,
     ServiceModel,
     Session,
     UnknownServiceError,
     copy,
+    create_loader,
 )
 
 from . import retryhandler
-from .client import AioBaseClient, AioClientCreator
+from .client import AioBaseClient, AioClientCreator, is_service_model_cached
 from .configprovider import AioSmartDefaultsConfigStoreFactory
-from .credentials import AioCredentials, create_credential_resolver
+from .credentials import (
+    AioCredentialRefresher,
+    AioCredentials,
+    AioRefreshableCredentials,
+    create_credential_resolver,
+)
 from .hooks import AioHierarchicalEmitter
+from .httpsession import SharedTransportRegistry
 from .parsers import AioResponseParserFactory
 from .utils import AioIMDSRegionProvider
 
+# data loaded by the loaders of the sessions caching service models, keyed
+# by the search paths and extras types of the loader and the loaded data
+_shared_loader_data = {}
+
+
+class _SharedLoaderCache:
+    """Cache of a session's own loader, backed by ``_shared_loader_data``.
+
+    The keys include the loader's current search paths and extras types,
+    so that changing them on one session doesn't affect the data loaded
+    by others.  As between the clients of a session, the loaded data is
+    shared rather than copied, and treated as read-only.
+    """
+
+    def __init__(self, loader):
+        self._loader = loader
+
+    def _key(self, key):
+        return (
+            tuple(self._loader.search_paths),
+            tuple(self._loader.extras_types),
+            key,
+        )
+
+    def __contains__(self, key):
+        return self._key(key) in _shared_loader_data
+
+    def __getitem__(self, key):
+        return _shared_loader_data[self._key(key)]
+
+    def __setitem__(self, key, value):
+        _shared_loader_data[self._key(key)] = value
+
 
 class ClientCreatorContext:
     def __init__(self, coro):
@@ -39,6 +82,10 @@ class AioSession(Session):
         event_hooks=None,
         include_builtin_handlers=True,
         profile=None,
+        shared_transports=False,
+        background_credential_refresh=False,
+        concurrent_credential_resolution=False,
+        cache_service_models=False,
     ):
         if event_hooks is None:
             event_hooks = AioHierarchicalEmitter()
@@ -47,9 +94,54 @@ class AioSession(Session):
             session_vars, event_hooks, include_builtin_handlers, profile
         )
 
+        # opt-in: clients created by this session share aiohttp connectors
+        # when their transport settings match
+        self._transport_registry = None
+        if shared_transports:
+            self._transport_registry = SharedTransportRegistry()
+
+        # opt-in: refreshable credentials loaded by this session are
+        # refreshed by a background task until the session is closed
+        self._background_credential_refresh = background_credential_refresh
+        self._credential_refresher = None
+
+        # opt-in: the network-bound credential providers are queried
+        # concurrently with the rest of the chain
+        self._concurrent_credential_resolution = (
+            concurrent_credential_resolution
+        )
+
+        # opt-in: data files, service models and generated client classes
+        # are cached for the whole process and shared with other sessions
+        self._cache_service_models = cache_service_models
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self):
+        if self._credential_refresher is not None:
+            await self._credential_refresher.close()
+            self._credential_refresher = None
+
+    def _register_data_loader(self):
+        def create_data_loader():
+            loader = create_loader(self.get_config_variable('data_path'))
+            if self._cache_service_models:
+                loader._cache = _SharedLoaderCache(loader)
+            return loader
+
+        self._components.lazy_register_component(
+            'data_loader', create_data_loader
+        )
+
     def _create_credential_resolver(self):
         return create_credential_resolver(
-            self, region_name=self._last_client_region_used
+            self,
+            region_name=self._last_client_region_used,
+            concurrent=self._concurrent_credential_resolution,
         )
 
     def _register_smart_defaults_factory(self):
@@ -72,15 +164,57 @@ class AioSession(Session):
         )
 
     def set_credentials(self, access_key, secret_key, token=None):
+        if self._credential_refresher is not None:
+            self._credential_refresher.stop()
+            self._credential_refresher = None
         self._credentials = AioCredentials(access_key, secret_key, token)
 
+    async def _load_config(self):
+        # reads the config and credentials files in the executor, after
+        # which ``full_config`` and ``get_scoped_config`` are served from
+        # memory
+        if self._config is None:
+            await self._load_data(lambda: self.full_config)
+
+    async def _load_data(self, func, *args, **kwargs):
+        return await asyncio.get_running_loop().run_in_executor(
+            None, functools.partial(func, *args, **kwargs)
+        )
+
+    def _preload_client_data(self, loader, service_name, api_version):
+        # runs in the executor so that creating the client only hits the
+        # loader's cache
+        if not (
+            self._cache_service_models
+            and is_service_model_cached(loader, service_name, api_version)
+        ):
+            try:
+                loader.load_service_model(
+                    service_name, 'service-2', api_version=api_version
+                )
+            except DataNotFoundError:
+                # reported when the client is created, service names can
+                # still be changed by choose-service-name handlers
+                pass
+        loader.load_data_with_path('endpoints')
+        loader.load_data('sdk-default-configuration')
+        loader.load_data('_retry')
+
     async def get_credentials(self):
         if self._credentials is None:
+            await self._load_config()
             self._credentials = await (
                 self._components.get_component(
                     'credential_provider'
                 ).load_credentials()
             )
+            if self._background_credential_refresh and isinstance(
+                self._credentials, AioRefreshableCredentials
+            ):
+                self._credential_refresher = AioCredentialRefresher(
+                    self._credentials
+                )
+                self._credential_refresher.start()
         return self._credentials
 
     async def get_service_model(self, service_name, api_version=None):
@@ -94,8 +228,11 @@ class AioSession(Session):
         Retrieve the fully merged data associated with a service.
         """
         data_path = service_name
-        service_data = self.get_component('data_loader').load_service_model(
-            data_path, type_name='service-2', api_version=api_version
+        service_data = await self._load_data(
+            self.get_component('data_loader').load_service_model,
+            data_path,
+            type_name='service-2',
+            api_version=api_version,
         )
         service_id = EVENT_ALIASES.get(service_name, service_name)
         await self._events.emit(
@@ -122,6 +259,7 @@ class AioSession(Session):
         aws_session_token=None,
         config=None,
     ):
+        await self._load_config()
 
         default_client_config = self.get_default_client_config()
         # If a config is provided and a default config is set, then
@@ -146,6 +284,9 @@ class AioSession(Session):
             )
 
         loader = self.get_component('data_loader')
+        await self._load_data(
+            self._preload_client_data, loader, service_name, api_version
+        )
         event_emitter = self.get_component('event_emitter')
         response_parser_factory = self.get_component('response_parser_factory')
         if config is not None and config.signature_version is UNSIGNED:
@@ -189,6 +330,8 @@ class AioSession(Session):
             response_parser_factory,
             exceptions_factory,
             config_store,
+            transport_registry=self._transport_registry,
+            cache_models=self._cache_service_models,
         )
         client = await client_creator.create_client(
             service_name=service_name,
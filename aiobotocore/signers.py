@@ -1,4 +1,10 @@
+import base64
 import datetime
+import functools
+import hashlib
+import hmac
+import uuid
+from urllib.parse import urlsplit
 
 import botocore
 import botocore.auth
@@ -12,6 +18,71 @@ from botocore.signers import (
     create_request_object,
     prepare_request_dict,
 )
+from botocore.utils import percent_encode
+
+from ._helpers import operation_event_names
+
+
+@functools.lru_cache(maxsize=64)
+def _signing_key(secret_key, datestamp, region_name, service_name):
+    # the SigV4 key only changes with the date or the credentials
+    key = f'AWS4{secret_key}'.encode()
+    for msg in (datestamp, region_name, service_name, 'aws4_request'):
+        key = hmac.new(key, msg.encode('utf-8'), hashlib.sha256).digest()
+    return key
+
+
+class _CachedSigningKeyMixin:
+    def signature(self, string_to_sign, request):
+        k_signing = _signing_key(
+            self.credentials.secret_key,
+            request.context["timestamp"][0:8],
+            self._region_name,
+            self._service_name,
+        )
+        return self._sign(k_signing, string_to_sign, hex=True)
+
+
+# botocore's SigV4 auth classes keep no per-request state, only their
+# constructor arguments, so their instances can be shared between requests.
+# Other auth classes, subclasses included, get a new instance per request.
+_SHAREABLE_AUTH_CLASSES = frozenset(
+    (
+        botocore.auth.SigV4Auth,
+        botocore.auth.S3SigV4Auth,
+        botocore.auth.SigV4QueryAuth,
+        botocore.auth.S3SigV4QueryAuth,
+        botocore.auth.S3SigV4PostAuth,
+    )
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_signing_key_class(cls):
+    return type(cls.__name__, (_CachedSigningKeyMixin, cls), {})
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_auth_instance(cls, kwargs):
+    return _cached_signing_key_class(cls)(**dict(kwargs))
+
+
+def _get_auth_instance(cls, kwargs):
+    """Returns an auth instance for ``kwargs``.
+
+    Instances of botocore's SigV4 auth classes are shared by all the
+    clients of the process for as long as their arguments, the frozen
+    credentials included, stay the same, and reuse their derived signing
+    key.  Anything else registered in ``AUTH_TYPE_MAPS`` is called as is.
+    """
+    if not isinstance(cls, type) or cls not in _SHAREABLE_AUTH_CLASSES:
+        return cls(**kwargs)
+    items = tuple(sorted(kwargs.items()))
+    try:
+        hash(items)
+    except TypeError:
+        return _cached_signing_key_class(cls)(**kwargs)
+    return _cached_auth_instance(cls, items)
 
 
 class AioRequestSigner(RequestSigner):
@@ -31,6 +102,27 @@ class AioRequestSigner(RequestSigner):
         expires_in=None,
         signing_name=None,
     ):
+        auth = await self._get_signing_auth(
+            operation_name,
+            request,
+            region_name,
+            signing_type,
+            expires_in,
+            signing_name,
+        )
+        if auth is not None:
+            auth.add_auth(request)
+
+    async def _get_signing_auth(
+        self,
+        operation_name,
+        request,
+        region_name=None,
+        signing_type='standard',
+        expires_in=None,
+        signing_name=None,
+    ):
+        # the part of sign() before add_auth, returns None when unsigned
         explicit_region_name = region_name
         if region_name is None:
             region_name = self._region_name
@@ -44,9 +136,9 @@ class AioRequestSigner(RequestSigner):
 
         # Allow mutating request before signing
         await self._event_emitter.emit(
-            'before-sign.{}.{}'.format(
-                self._service_id.hyphenize(), operation_name
-            ),
+            operation_event_names(self._service_id, operation_name)[
+                'before-sign'
+            ],
             request=request,
             signing_name=signing_name,
             region_name=self._region_name,
@@ -69,7 +161,7 @@ class AioRequestSigner(RequestSigner):
             if signing_context.get('signing_name'):
                 kwargs['signing_name'] = signing_context['signing_name']
             try:
-                auth = await self.get_auth_instance(**kwargs)
+                return await self.get_auth_instance(**kwargs)
             except UnknownSignatureVersionError as e:
                 if signing_type != 'standard':
                     raise UnsupportedSignatureVersionError(
@@ -77,8 +169,7 @@ class AioRequestSigner(RequestSigner):
                     )
                 else:
                     raise e
-
-            auth.add_auth(request)
+        return None
 
     async def _choose_signer(self, operation_name, signing_type, context):
         signing_type_suffix_map = {
@@ -95,9 +186,9 @@ class AioRequestSigner(RequestSigner):
             signature_version += suffix
 
         handler, response = await self._event_emitter.emit_until_response(
-            'choose-signer.{}.{}'.format(
-                self._service_id.hyphenize(), operation_name
-            ),
+            operation_event_names(self._service_id, operation_name)[
+                'choose-signer'
+            ],
             signing_name=self._signing_name,
             region_name=self._region_name,
             signature_version=signature_version,
@@ -139,7 +230,7 @@ class AioRequestSigner(RequestSigner):
                 raise botocore.exceptions.NoRegionError()
             kwargs['region_name'] = region_name
             kwargs['service_name'] = signing_name
-        auth = cls(**kwargs)
+        auth = _get_auth_instance(cls, kwargs)
         return auth
 
     # Alias get_auth for backwards compatibility.
@@ -269,6 +360,7 @@ class AioS3PostPresigner(S3PostPresigner):
 
 def add_generate_presigned_url(class_attributes, **kwargs):
     class_attributes['generate_presigned_url'] = generate_presigned_url
+    class_attributes['generate_presigned_urls'] = generate_presigned_urls
 
 
 async def generate_presigned_url(
@@ -336,6 +428,251 @@ async def generate_presigned_url(
     )
 
 
+async def generate_presigned_urls(
+    self, ClientMethod, Params, ExpiresIn=3600, HttpMethod=None
+):
+    """Generate presigned urls for many calls of the same client method
+
+    The result is the same as calling ``generate_presigned_url`` for each
+    item of ``Params``, with all the urls signed at the same time.
+
+    When the calls only differ by a greedy path parameter, such as the
+    ``Key`` of S3 objects, and are signed with SigV4 (e.g.
+    ``Config(signature_version='s3v4')`` for S3), the request is built and
+    the events are emitted once for a placeholder value.  Each url is then
+    rendered from that template and signed with the cached signing key.
+    Other calls go through ``generate_presigned_url``.
+
+    :type ClientMethod: string
+    :param ClientMethod: The client method to presign for
+
+    :type Params: list
+    :param Params: The parameters normally passed to ``ClientMethod``, one
+        dict per url.
+
+    :type ExpiresIn: int
+    :param ExpiresIn: The number of seconds the presigned urls are valid
+        for. By default they expire in an hour (3600 seconds)
+
+    :type HttpMethod: string
+    :param HttpMethod: The http method to use on the generated urls. By
+        default, the http method is whatever is used in the method's model.
+
+    :returns: The presigned urls, in the order of ``Params``
+    """
+    try:
+        operation_name = self._PY_TO_OP_NAME[ClientMethod]
+    except KeyError:
+        raise UnknownClientMethodError(method_name=ClientMethod)
+
+    presigner = _BulkPresigner(
+        self, ClientMethod, operation_name, ExpiresIn, HttpMethod
+    )
+    return [await presigner.generate(params or {}) for params in Params]
+
+
+class _PresignTemplate:
+    """A presigned url split around the value of a greedy path parameter
+    and around the signature."""
+
+    def __init__(self, url, value, signature):
+        head, *rest = url.split(value)
+        self._url_parts = [head]
+        if len(rest) == 1:
+            self._url_parts.extend(rest[0].split(signature))
+        self.valid = len(self._url_parts) == 3
+
+    def render(self, value):
+        encoded = percent_encode(value, safe='/~')
+        head, middle, tail = self._url_parts
+        return f'{head}{encoded}{middle}{self._sign(encoded)}{tail}'
+
+
+class _SigV4PresignTemplate(_PresignTemplate):
+    def __init__(self, url, value, signature, canonical_request, sts, key):
+        super().__init__(url, value, signature)
+        self._canonical_parts = canonical_request.split(value)
+        # the last line of the string to sign is the hash of the canonical
+        # request
+        self._string_to_sign_head = sts.rsplit('\n', 1)[0] + '\n'
+        self._key = key
+        # e.g. SigV4 outside of S3 encodes the path again in the canonical
+        # request
+        self.valid &= len(self._canonical_parts) == 2
+
+    def _sign(self, encoded):
+        canonical_request = encoded.join(self._canonical_parts)
+        string_to_sign = (
+            self._string_to_sign_head
+            + hashlib.sha256(canonical_request.encode('utf-8')).hexdigest()
+        )
+        return hmac.new(
+            self._key, string_to_sign.encode('utf-8'), hashlib.sha256
+        ).hexdigest()
+
+
+class _SigV2PresignTemplate(_PresignTemplate):
+    def __init__(self, url, value, signature, string_to_sign, secret_key):
+        super().__init__(url, value, signature)
+        self._string_to_sign_parts = string_to_sign.split(value)
+        self._key = secret_key.encode('utf-8')
+        self.valid &= len(self._string_to_sign_parts) == 2
+
+    def _sign(self, encoded):
+        string_to_sign = encoded.join(self._string_to_sign_parts)
+        digest = hmac.new(
+            self._key, string_to_sign.encode('utf-8'), hashlib.sha1
+        ).digest()
+        return percent_encode(base64.b64encode(digest).decode('utf-8'))
+
+
+class _BulkPresigner:
+    def __init__(
+        self, client, client_method, operation_name, expires_in, http_method
+    ):
+        self._client = client
+        self._client_method = client_method
+        self._operation_name = operation_name
+        self._operation_model = client.meta.service_model.operation_model(
+            operation_name
+        )
+        self._expires_in = expires_in
+        self._http_method = http_method
+        self._templates = {}
+
+        # the member rendered in a {Name+} label of the request uri
+        self._greedy_member = None
+        request_uri = self._operation_model.http.get('requestUri', '')
+        input_shape = self._operation_model.input_shape
+        members = input_shape.members if input_shape is not None else {}
+        for name, member in members.items():
+            serialization = member.serialization
+            label = serialization.get('name', name)
+            if (
+                serialization.get('location') == 'uri'
+                and f'{{{label}+}}' in request_uri
+            ):
+                self._greedy_member = name
+
+    async def generate(self, params):
+        value = params.get(self._greedy_member)
+        if not isinstance(value, str) or not value:
+            return await self._generate_one(params)
+
+        others = tuple(
+            sorted(
+                (name, param)
+                for name, param in params.items()
+                if name != self._greedy_member
+            )
+        )
+        try:
+            template = self._templates[others]
+        except KeyError:
+            template = self._templates[others] = await self._compile(params)
+        except TypeError:
+            # unhashable parameters
+            return await self._generate_one(params)
+        if template is None:
+            return await self._generate_one(params)
+        return template.render(value)
+
+    async def _generate_one(self, params):
+        return await generate_presigned_url(
+            self._client,
+            self._client_method,
+            Params=params,
+            ExpiresIn=self._expires_in,
+            HttpMethod=self._http_method,
+        )
+
+    async def _compile(self, params):
+        # the steps of generate_presigned_url and SigV4Auth.add_auth, for a
+        # placeholder value which must be percent encoded
+        placeholder = f'{uuid.uuid4().hex} {uuid.uuid4().hex}'
+        params = dict(params, **{self._greedy_member: placeholder})
+        client = self._client
+        context = {
+            'is_presign_request': True,
+            'use_global_endpoint': _should_use_global_endpoint(client),
+        }
+        params = await client._emit_api_params(
+            params, self._operation_model, context
+        )
+        request_dict = client._serializer.serialize_to_request(
+            params, self._operation_model
+        )
+        if self._http_method is not None:
+            request_dict['method'] = self._http_method
+        prepare_request_dict(
+            request_dict,
+            endpoint_url=client.meta.endpoint_url,
+            context=context,
+        )
+
+        request = create_request_object(request_dict)
+        auth = await client._request_signer._get_signing_auth(
+            self._operation_name,
+            request,
+            signing_type='presign-url',
+            expires_in=self._expires_in,
+        )
+        if auth is None or auth.credentials is None:
+            return None
+        value = percent_encode(placeholder, safe='/~')
+        signature = uuid.uuid4().hex
+
+        if isinstance(auth, botocore.auth.SigV4QueryAuth):
+            # the steps of SigV4QueryAuth.add_auth
+            request.context['timestamp'] = datetime.datetime.utcnow().strftime(
+                botocore.auth.SIGV4_TIMESTAMP
+            )
+            auth._modify_request_before_signing(request)
+            canonical_request = auth.canonical_request(request)
+            string_to_sign = auth.string_to_sign(request, canonical_request)
+            auth._inject_signature_to_request(request, signature)
+            request.prepare()
+            key = _signing_key(
+                auth.credentials.secret_key,
+                request.context['timestamp'][0:8],
+                auth._region_name,
+                auth._service_name,
+            )
+            template = _SigV4PresignTemplate(
+                request.url,
+                value,
+                signature,
+                canonical_request,
+                string_to_sign,
+                key,
+            )
+        elif isinstance(auth, botocore.auth.HmacV1QueryAuth):
+            # the steps of HmacV1QueryAuth.add_auth
+            if auth.credentials.token:
+                del request.headers['x-amz-security-token']
+                request.headers[
+                    'x-amz-security-token'
+                ] = auth.credentials.token
+            string_to_sign = auth.canonical_string(
+                request.method,
+                urlsplit(request.url),
+                request.headers,
+                auth_path=request.auth_path,
+            )
+            auth._inject_signature(request, signature)
+            request.prepare()
+            template = _SigV2PresignTemplate(
+                request.url,
+                value,
+                signature,
+                string_to_sign,
+                auth.credentials.secret_key,
+            )
+        else:
+            return None
+        return template if template.valid else None
+
+
 def add_generate_presigned_post(class_attributes, **kwargs):
     class_attributes['generate_presigned_post'] = generate_presigned_post
 
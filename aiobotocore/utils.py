@@ -2,6 +2,7 @@ import asyncio
 import inspect
 import json
 import logging
+import tempfile
 
 import botocore.awsrequest
 from botocore.exceptions import (
@@ -20,6 +21,7 @@ from botocore.utils import (
     IMDSRegionProvider,
     InstanceMetadataFetcher,
     InstanceMetadataRegionFetcher,
+    JSONFileCache,
     ReadTimeoutError,
     S3RegionRedirector,
     get_environ_proxies,
@@ -30,6 +32,11 @@ from botocore.utils import (
 import aiobotocore.httpsession
 from aiobotocore._helpers import asynccontextmanager
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -65,6 +72,92 @@ class _RefCountedSession(aiobotocore.httpsession.AIOHTTPSession):
                 self.__ref_count -= 1
 
 
+class AioJSONFileCache(JSONFileCache):
+    """JSONFileCache with async accessors, safe to share between processes.
+
+    ``load`` and ``store`` do their file I/O in the loop's default executor
+    and values are replaced atomically, so readers never see a partially
+    written file.  ``lock`` serializes the refresh of a key between the tasks
+    of this process and, where ``fcntl`` is available, between all processes
+    sharing the cache directory.
+    """
+
+    _LOCK_POLL_INTERVAL = 0.05
+
+    def __init__(self, working_dir=JSONFileCache.CACHE_DIR, dumps_func=None):
+        super().__init__(working_dir, dumps_func)
+        self._locks = {}
+
+    async def load(self, cache_key):
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(
+                None, self.__getitem__, cache_key
+            )
+        except KeyError:
+            return None
+
+    async def store(self, cache_key, value):
+        try:
+            file_content = self._dumps(value)
+        except (TypeError, ValueError):
+            raise ValueError(
+                f"Value cannot be cached, must be "
+                f"JSON serializable: {value}"
+            )
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            None, self._replace, cache_key, file_content
+        )
+
+    @asynccontextmanager
+    async def lock(self, cache_key):
+        lock = self._locks.get(cache_key)
+        if lock is None:
+            lock = self._locks[cache_key] = asyncio.Lock()
+
+        async with lock:
+            if fcntl is None:
+                yield
+                return
+
+            fd = await asyncio.get_running_loop().run_in_executor(
+                None, self._open_lock_file, cache_key
+            )
+            try:
+                # polled rather than blocking so that waiting on other
+                # processes never ties up the executor
+                while True:
+                    try:
+                        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                        break
+                    except BlockingIOError:
+                        await asyncio.sleep(self._LOCK_POLL_INTERVAL)
+                yield
+            finally:
+                # closing the file releases the lock
+                os.close(fd)
+
+    def _replace(self, cache_key, file_content):
+        os.makedirs(self._working_dir, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self._working_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(file_content)
+            os.replace(temp_path, self._convert_cache_key(cache_key))
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    def _open_lock_file(self, cache_key):
+        os.makedirs(self._working_dir, exist_ok=True)
+        return os.open(
+            os.path.join(self._working_dir, cache_key + '.lock'),
+            os.O_RDWR | os.O_CREAT,
+            0o600,
+        )
+
+
 class AioIMDSFetcher(IMDSFetcher):
     def __init__(
         self,
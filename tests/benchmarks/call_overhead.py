@@ -0,0 +1,71 @@
+"""Per-call CPU overhead of the client pipeline against a stubbed transport.
+
+Run with::
+
+    python -m tests.benchmarks.call_overhead [calls]
+
+The HTTP session's send is replaced by a stub which answers every request with a
+canned DynamoDB response, so only serialization, event emission, signing
+and parsing are measured.
+"""
+import asyncio
+import sys
+import time
+
+from aiobotocore.awsrequest import AioAWSResponse
+from aiobotocore.session import AioSession
+
+
+class _StubRaw:
+    raw_headers = (
+        (b'Content-Type', b'application/x-amz-json-1.0'),
+        (b'x-amzn-RequestId', b'stub'),
+    )
+
+    def __init__(self, body):
+        self._body = body
+
+    async def read(self):
+        return self._body
+
+
+def _stub_send(body):
+    async def send(request):
+        return AioAWSResponse(
+            request.url, 200, dict(_StubRaw.raw_headers), _StubRaw(body)
+        )
+
+    return send
+
+
+_GET_ITEM_RESPONSE = b'{"Item": {"pk": {"S": "key"}, "value": {"N": "42"}}}'
+
+
+async def main(calls=20000):
+    session = AioSession()
+    async with session.create_client(
+        'dynamodb',
+        region_name='us-east-1',
+        aws_secret_access_key='xxx',
+        aws_access_key_id='xxx',
+    ) as client:
+        client._endpoint.http_session.send = _stub_send(_GET_ITEM_RESPONSE)
+        params = dict(TableName='table', Key={'pk': {'S': 'key'}})
+
+        # warm up caches
+        for _ in range(100):
+            await client.get_item(**params)
+
+        start = time.perf_counter()
+        for _ in range(calls):
+            await client.get_item(**params)
+        elapsed = time.perf_counter() - start
+
+    print(
+        f'{calls} GetItem calls: {elapsed:.2f}s, '
+        f'{elapsed / calls * 1e6:.1f} us/call, {calls / elapsed:.0f} calls/s'
+    )
+
+
+if __name__ == '__main__':
+    asyncio.run(main(*map(int, sys.argv[1:])))
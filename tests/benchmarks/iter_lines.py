@@ -0,0 +1,93 @@
+"""``StreamingBody.iter_lines`` throughput on NDJSON and CSV objects.
+
+Run with::
+
+    python -m tests.benchmarks.iter_lines [size MiB]
+
+The body is served from memory in 16 KiB pieces, standing in for the
+chunks aiohttp receives from the socket, so the figures are the CPU cost
+of splitting lines.  ``previous`` is the splitter ``iter_lines`` used
+before, reading 1 KiB chunks.
+"""
+import asyncio
+import io
+import json
+import sys
+import time
+
+from aiobotocore.response import StreamingBody
+from aiobotocore.s3._helpers import MB
+
+_PIECE_SIZE = 16 * 1024
+
+
+class _Content:
+    def __init__(self, data):
+        self._data = io.BytesIO(data)
+
+    async def read(self, amt=-1):
+        if amt < 0:
+            amt = _PIECE_SIZE
+        return self._data.read(min(amt, _PIECE_SIZE))
+
+
+class _Raw:
+    def __init__(self, data):
+        self.content = _Content(data)
+
+
+async def _previous_iter_lines(body, chunk_size=1024, keepends=False):
+    pending = b''
+    async for chunk in body.iter_chunks(chunk_size):
+        lines = (pending + chunk).splitlines(True)
+        for line in lines[:-1]:
+            yield line.splitlines(keepends)[0]
+        pending = lines[-1]
+    if pending:
+        yield pending.splitlines(keepends)[0]
+
+
+def _ndjson(size):
+    record = {'id': 0, 'name': 'object', 'tags': ['a', 'b'], 'size': 1.5}
+    lines = []
+    total = 0
+    while total < size:
+        record['id'] += 1
+        lines.append(json.dumps(record).encode())
+        total += len(lines[-1]) + 1
+    return b'\n'.join(lines) + b'\n'
+
+
+def _csv(size):
+    line = b'2023-01-01T00:00:00Z,bucket,key/with/a/path.txt,1024,STANDARD\r\n'
+    return line * (size // len(line))
+
+
+async def _throughput(data, iter_lines):
+    body = StreamingBody(_Raw(data), len(data))
+    start = time.perf_counter()
+    count = 0
+    async for _ in iter_lines(body):
+        count += 1
+    elapsed = time.perf_counter() - start
+    assert count == len(data.splitlines())
+    return len(data) / elapsed / 1e6
+
+
+async def main(size=64):
+    for name, data in (
+        ('NDJSON', _ndjson(size * MB)),
+        ('CSV', _csv(size * MB)),
+    ):
+        print(f'{name}, {size} MiB')
+        for label, iter_lines in (
+            ('previous', _previous_iter_lines),
+            ('iter_lines()', StreamingBody.iter_lines),
+            ('iter_lines(1024)', lambda body: body.iter_lines(1024)),
+        ):
+            rate = await _throughput(data, iter_lines)
+            print(f'{label:>24}: {rate:8.1f} MB/s')
+
+
+if __name__ == '__main__':
+    asyncio.run(main(*map(int, sys.argv[1:])))
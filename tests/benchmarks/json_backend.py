@@ -0,0 +1,161 @@
+"""DynamoDB call cost with the different ``AioConfig(json_backend=...)`` codecs.
+
+Run with::
+
+    python -m tests.benchmarks.json_backend [calls] [items]
+
+A DynamoDB client whose transport is stubbed is used to issue ``Query`` and
+``BatchGetItem`` calls returning ``items`` items each, so serializing the
+request and parsing the response dominate.  Codecs which aren't installed
+are skipped.
+"""
+import asyncio
+import json
+import sys
+import time
+
+from aiobotocore._json import get_json_backend
+from aiobotocore.awsrequest import AioAWSResponse
+from aiobotocore.config import AioConfig
+from aiobotocore.session import AioSession
+
+
+def _item(i):
+    return {
+        'pk': {'S': f'customer#{i:06d}'},
+        'sk': {'S': f'order#2023-01-{i % 28 + 1:02d}#{i:08d}'},
+        'status': {'S': 'SHIPPED'},
+        'total': {'N': f'{i * 3.17:.2f}'},
+        'tags': {'SS': ['priority', 'gift', f'region-{i % 5}']},
+        'lines': {
+            'L': [
+                {
+                    'M': {
+                        'sku': {'S': f'SKU-{i + j:05d}'},
+                        'qty': {'N': str(j + 1)},
+                        'price': {'N': f'{(i + j) * 1.11:.2f}'},
+                    }
+                }
+                for j in range(3)
+            ]
+        },
+        'address': {
+            'M': {
+                'street': {'S': f'{i} Main Street'},
+                'city': {'S': 'Seattle'},
+                'zip': {'S': '98101'},
+            }
+        },
+    }
+
+
+def _query_body(items):
+    return json.dumps(
+        {
+            'Items': [_item(i) for i in range(items)],
+            'Count': items,
+            'ScannedCount': items,
+        }
+    ).encode()
+
+
+def _batch_get_body(items):
+    return json.dumps(
+        {
+            'Responses': {'orders': [_item(i) for i in range(items)]},
+            'UnprocessedKeys': {},
+        }
+    ).encode()
+
+
+class _StubRaw:
+    raw_headers = ((b'Content-Type', b'application/x-amz-json-1.0'),)
+
+    def __init__(self, body):
+        self._body = body
+
+    async def read(self):
+        return self._body
+
+
+def _stub_send(bodies):
+    async def send(request):
+        target = request.headers['X-Amz-Target'].decode().split('.')[-1]
+        body = bodies[target]
+        return AioAWSResponse(
+            request.url, 200, dict(_StubRaw.raw_headers), _StubRaw(body)
+        )
+
+    return send
+
+
+async def _run(json_backend, calls, items):
+    bodies = {
+        'Query': _query_body(items),
+        'BatchGetItem': _batch_get_body(items),
+    }
+    keys = [{'pk': _item(i)['pk'], 'sk': _item(i)['sk']} for i in range(items)]
+    session = AioSession()
+    async with session.create_client(
+        'dynamodb',
+        region_name='us-east-1',
+        config=AioConfig(json_backend=json_backend),
+        aws_secret_access_key='xxx',
+        aws_access_key_id='xxx',
+    ) as client:
+        client._endpoint.http_session.send = _stub_send(bodies)
+        results = {}
+        for name, call in (
+            (
+                'Query',
+                lambda: client.query(
+                    TableName='orders',
+                    KeyConditionExpression='pk = :pk',
+                    ExpressionAttributeValues={':pk': {'S': 'customer'}},
+                ),
+            ),
+            (
+                'BatchGetItem',
+                lambda: client.batch_get_item(
+                    RequestItems={'orders': {'Keys': keys}}
+                ),
+            ),
+        ):
+            await call()
+            start = time.perf_counter()
+            for _ in range(calls):
+                await call()
+            results[name] = (time.perf_counter() - start) / calls
+
+    return results
+
+
+def _codec_time(backend, body, calls):
+    loads = backend.loads if backend else json.loads
+    start = time.perf_counter()
+    for _ in range(calls):
+        loads(body)
+    return (time.perf_counter() - start) / calls
+
+
+async def main(calls=200, items=100):
+    print(f'{items} items per response, {calls} calls')
+    query_body = _query_body(items)
+    for json_backend in ('json', 'orjson', 'ujson'):
+        backend = get_json_backend(json_backend)
+        if json_backend != 'json' and backend is None:
+            print(f'{json_backend:>8}: not installed')
+            continue
+        results = await _run(json_backend, calls, items)
+        results['loads only'] = _codec_time(backend, query_body, calls)
+        print(
+            f'{json_backend:>8}: '
+            + ', '.join(
+                f'{name} {elapsed * 1e3:6.2f} ms/call'
+                for name, elapsed in results.items()
+            )
+        )
+
+
+if __name__ == '__main__':
+    asyncio.run(main(*map(int, sys.argv[1:])))
@@ -0,0 +1,63 @@
+"""``MultipartUploader`` against a single ``put_object``.
+
+Run with::
+
+    python -m tests.benchmarks.multipart_upload [size MiB] [conn MB/s]
+
+A file of ``size`` MiB is uploaded to the in-memory S3 of the tests, which
+limits each request to ``conn`` MB/s to stand in for the bandwidth of a
+single connection to S3.  The stand-in runs in the same process, so the
+CPU time it spends receiving the bodies is included.
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+from aiobotocore.s3.upload import MB, MultipartUploader
+from tests.s3_stub import StubS3, create_client
+
+
+async def _upload(path, bandwidth, **uploader_kwargs):
+    stub = StubS3(delay=lambda size: size / bandwidth)
+    async with create_client(stub) as client:
+        start = time.perf_counter()
+        if uploader_kwargs:
+            uploader = MultipartUploader(client, **uploader_kwargs)
+            await uploader.upload(path, Bucket='bucket', Key='key')
+        else:
+            with open(path, 'rb') as f:
+                await client.put_object(
+                    Bucket='bucket',
+                    Key='key',
+                    Body=f.read(),
+                    ChecksumAlgorithm='CRC32',
+                )
+        elapsed = time.perf_counter() - start
+    assert len(stub.objects['key']['Body']) == os.path.getsize(path)
+    return elapsed
+
+
+async def main(size=256, bandwidth=100):
+    with tempfile.NamedTemporaryFile() as f:
+        f.write(os.urandom(size * MB))
+        f.flush()
+        print(f'{size} MiB, {bandwidth} MB/s per request')
+        elapsed = await _upload(f.name, bandwidth * 1e6)
+        print(f'{"put_object":>24}: {elapsed:6.2f} s')
+        for max_concurrency in (4, 10, 32):
+            elapsed = await _upload(
+                f.name,
+                bandwidth * 1e6,
+                part_size=8 * MB,
+                max_concurrency=max_concurrency,
+            )
+            print(
+                f'{f"MultipartUploader({max_concurrency})":>24}: '
+                f'{elapsed:6.2f} s'
+            )
+
+
+if __name__ == '__main__':
+    asyncio.run(main(*map(int, sys.argv[1:])))
@@ -0,0 +1,111 @@
+"""Event loop lag while parsing large responses, with and without offloading.
+
+Run with::
+
+    python -m tests.benchmarks.parse_offload [keys] [calls]
+
+An S3 client whose transport is stubbed to return a ``ListObjectsV2`` page
+of ``keys`` objects is called ``calls`` times while a ticker task measures
+how late it wakes up from 1ms sleeps.  The worst and mean lag are reported
+for inline parsing and for ``AioConfig(parse_offload_threshold=...)``.
+"""
+import asyncio
+import statistics
+import sys
+import time
+
+from aiobotocore.awsrequest import AioAWSResponse
+from aiobotocore.config import AioConfig
+from aiobotocore.session import AioSession
+
+_CONTENTS = (
+    '<Contents><Key>prefix/key-{0:08d}</Key>'
+    '<LastModified>2023-01-01T00:00:00.000Z</LastModified>'
+    '<ETag>&quot;d41d8cd98f00b204e9800998ecf8427e&quot;</ETag>'
+    '<Size>{0}</Size><StorageClass>STANDARD</StorageClass></Contents>'
+)
+
+
+def _list_objects_body(keys):
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<ListBucketResult xmlns="http://s3.amazonaws.com/doc/2006-03-01/">'
+        '<Name>bucket</Name><Prefix>prefix/</Prefix>'
+        f'<KeyCount>{keys}</KeyCount><MaxKeys>{keys}</MaxKeys>'
+        '<IsTruncated>false</IsTruncated>'
+        + ''.join(_CONTENTS.format(i) for i in range(keys))
+        + '</ListBucketResult>'
+    ).encode()
+
+
+class _StubRaw:
+    raw_headers = ((b'Content-Type', b'application/xml'),)
+
+    def __init__(self, body):
+        self._body = body
+
+    async def read(self):
+        return self._body
+
+
+def _stub_send(body):
+    async def send(request):
+        # yield like a real network round trip would
+        await asyncio.sleep(0)
+        return AioAWSResponse(
+            request.url, 200, dict(_StubRaw.raw_headers), _StubRaw(body)
+        )
+
+    return send
+
+
+async def _ticker(lags, stop):
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(0.001)
+        lags.append(time.perf_counter() - start - 0.001)
+
+
+async def _run(config, body, calls):
+    session = AioSession()
+    async with session.create_client(
+        's3',
+        region_name='us-east-1',
+        config=config,
+        aws_secret_access_key='xxx',
+        aws_access_key_id='xxx',
+    ) as client:
+        client._endpoint.http_session.send = _stub_send(body)
+        await client.list_objects_v2(Bucket='bucket')
+
+        lags = []
+        stop = asyncio.Event()
+        ticker = asyncio.create_task(_ticker(lags, stop))
+        start = time.perf_counter()
+        for _ in range(calls):
+            await client.list_objects_v2(Bucket='bucket')
+        elapsed = time.perf_counter() - start
+        stop.set()
+        await ticker
+
+    return elapsed, lags
+
+
+async def main(keys=1000, calls=50):
+    body = _list_objects_body(keys)
+    configurations = {
+        'inline': AioConfig(),
+        'offloaded': AioConfig(parse_offload_threshold=64 * 1024),
+    }
+    print(f'ListObjectsV2 page: {keys} keys, {len(body) / 1024:.0f} KiB')
+    for name, config in configurations.items():
+        elapsed, lags = await _run(config, body, calls)
+        print(
+            f'{name:>10}: {elapsed / calls * 1e3:6.2f} ms/call, loop lag '
+            f'max {max(lags) * 1e3:6.2f} ms, '
+            f'mean {statistics.mean(lags) * 1e3:5.2f} ms'
+        )
+
+
+if __name__ == '__main__':
+    asyncio.run(main(*map(int, sys.argv[1:])))
@@ -0,0 +1,50 @@
+"""``generate_presigned_urls`` against ``generate_presigned_url`` per key.
+
+Run with::
+
+    python -m tests.benchmarks.presign [urls]
+
+Presigned S3 GET urls for distinct keys of one bucket, with the default
+presign signature (SigV2) and with ``s3v4``.
+"""
+import asyncio
+import sys
+import time
+
+from aiobotocore.config import AioConfig
+from aiobotocore.session import AioSession
+
+
+async def main(urls=20000):
+    session = AioSession()
+    params = [
+        {'Bucket': 'bucket', 'Key': f'prefix/object-{i}.bin'}
+        for i in range(urls)
+    ]
+    print(f'{urls} urls')
+    for signature_version in (None, 's3v4'):
+        async with session.create_client(
+            's3',
+            region_name='us-west-2',
+            aws_access_key_id='akid',
+            aws_secret_access_key='secret',
+            config=AioConfig(signature_version=signature_version),
+        ) as client:
+            start = time.perf_counter()
+            for p in params:
+                await client.generate_presigned_url('get_object', Params=p)
+            single = time.perf_counter() - start
+
+            start = time.perf_counter()
+            await client.generate_presigned_urls('get_object', params)
+            bulk = time.perf_counter() - start
+
+        name = signature_version or 'default'
+        print(
+            f'{name:>8}: {urls / single:8.0f} urls/s one by one, '
+            f'{urls / bulk:8.0f} urls/s in bulk ({single / bulk:.0f}x)'
+        )
+
+
+if __name__ == '__main__':
+    asyncio.run(main(*map(int, sys.argv[1:])))
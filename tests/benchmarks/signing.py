@@ -0,0 +1,63 @@
+"""SigV4 signing throughput with and without the auth instance cache.
+
+Run with::
+
+    python -m tests.benchmarks.signing [requests]
+
+Each request is a small S3 PUT signed with ``s3v4``.  ``uncached`` builds a
+botocore auth object and derives the signing key for every request, as
+``get_auth_instance`` used to.
+"""
+import asyncio
+import sys
+import time
+
+import botocore.auth
+from botocore.awsrequest import AWSRequest
+from botocore.model import ServiceId
+
+from aiobotocore.credentials import AioCredentials
+from aiobotocore.hooks import AioHierarchicalEmitter
+from aiobotocore.signers import AioRequestSigner
+
+
+def _request():
+    return AWSRequest(
+        'PUT',
+        'https://bucket.s3.us-east-1.amazonaws.com/some/key',
+        headers={'Content-Type': 'application/octet-stream'},
+        data=b'data',
+    )
+
+
+async def main(requests=20000):
+    credentials = AioCredentials('akid', 'secret', 'token')
+    signer = AioRequestSigner(
+        ServiceId('s3'),
+        'us-east-1',
+        's3',
+        's3v4',
+        credentials,
+        AioHierarchicalEmitter(),
+    )
+    frozen = await credentials.get_frozen_credentials()
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        auth = botocore.auth.S3SigV4Auth(frozen, 's3', 'us-east-1')
+        auth.add_auth(_request())
+    uncached = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        auth = await signer.get_auth_instance('s3', 'us-east-1')
+        auth.add_auth(_request())
+    cached = time.perf_counter() - start
+
+    print(f'{requests} requests')
+    for label, elapsed in (('uncached', uncached), ('cached', cached)):
+        print(f'{label:>12}: {requests / elapsed:10.0f} signatures/s')
+
+
+if __name__ == '__main__':
+    asyncio.run(main(*map(int, sys.argv[1:])))
@@ -0,0 +1,71 @@
+"""Throughput of large response bodies with different socket options.
+
+Run with::
+
+    python -m tests.benchmarks.socket_options [size_mb] [rounds]
+
+Each configuration downloads ``size_mb`` from the local mock server
+``rounds`` times through an ``AIOHTTPSession`` and reports MB/s.
+"""
+import asyncio
+import socket
+import sys
+import time
+
+from botocore.awsrequest import AWSRequest
+
+from aiobotocore.httpsession import AIOHTTPSession
+from tests.mock_server import AIOServer
+
+_NODELAY = (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+CONFIGURATIONS = {
+    'default': [_NODELAY],
+    'keepalive': [_NODELAY, (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)],
+    'small buffers (64KiB)': [
+        _NODELAY,
+        (socket.SOL_SOCKET, socket.SO_RCVBUF, 64 * 1024),
+        (socket.SOL_SOCKET, socket.SO_SNDBUF, 64 * 1024),
+    ],
+    'large buffers (4MiB)': [
+        _NODELAY,
+        (socket.SOL_SOCKET, socket.SO_RCVBUF, 4 * 1024 * 1024),
+        (socket.SOL_SOCKET, socket.SO_SNDBUF, 4 * 1024 * 1024),
+    ],
+}
+
+
+async def _download(http_session, url):
+    request = AWSRequest(method='GET', url=url).prepare()
+    request.stream_output = True
+    response = await http_session.send(request)
+    total = 0
+    while True:
+        chunk = await response.raw.content.read(1024 * 1024)
+        if not chunk:
+            break
+        total += len(chunk)
+    return total
+
+
+async def main(size_mb=256, rounds=3):
+    size = size_mb * 1024 * 1024
+    async with AIOServer() as server:
+        url = f'{server.endpoint_url}/bytes/{size}'
+        for name, socket_options in CONFIGURATIONS.items():
+            async with AIOHTTPSession(
+                socket_options=socket_options
+            ) as http_session:
+                # warm up the connection so connect time isn't measured
+                await _download(http_session, f'{server.endpoint_url}/ok')
+
+                start = time.perf_counter()
+                for _ in range(rounds):
+                    assert await _download(http_session, url) == size
+                elapsed = time.perf_counter() - start
+
+            print(f'{name:>24}: {size_mb * rounds / elapsed:8.1f} MB/s')
+
+
+if __name__ == '__main__':
+    asyncio.run(main(*map(int, sys.argv[1:])))
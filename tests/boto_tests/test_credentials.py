@@ -3,6 +3,7 @@ These tests have been taken from
 https://github.com/boto/botocore/blob/develop/tests/unit/test_credentials.py
 and adapted to work with asyncio and pytest
 """
+import asyncio
 import binascii
 import os
 import sys
@@ -43,6 +44,7 @@ from aiobotocore.credentials import (
     AioSSOProvider,
 )
 from aiobotocore.session import AioSession
+from aiobotocore.utils import AioJSONFileCache
 
 from .helpers import StubbedSession
 
@@ -214,6 +216,40 @@ async def test_assumerolefetcher_cache_in_cache_but_expired():
     assert response == expected
 
 
+@pytest.mark.moto
+@pytest.mark.asyncio
+async def test_assumerolefetcher_shared_file_cache(tmp_path):
+    response = {
+        'Credentials': {
+            'AccessKeyId': 'foo',
+            'SecretAccessKey': 'bar',
+            'SessionToken': 'baz',
+            'Expiration': some_future_time().isoformat(),
+        },
+    }
+    client_creator = assume_role_client_creator(response)
+    # each cache stands in for a separate process sharing the directory
+    refreshers = [
+        credentials.AioAssumeRoleCredentialFetcher(
+            client_creator,
+            credentials.AioCredentials('a', 'b', 'c'),
+            'myrole',
+            cache=AioJSONFileCache(str(tmp_path)),
+        )
+        for _ in range(8)
+    ]
+
+    expected = get_expected_creds_from_response(response)
+    results = await asyncio.gather(
+        *[refresher.fetch_credentials() for refresher in refreshers]
+    )
+
+    assert results == [expected] * 8
+    assert client_creator.return_value._call_count == 1
+    cached = JSONFileCache(str(tmp_path))[refreshers[0]._cache_key]
+    assert cached['Credentials']['AccessKeyId'] == 'foo'
+
+
 @pytest.mark.moto
 @pytest.mark.asyncio
 async def test_assumerolefetcher_mfa():
@@ -356,6 +392,75 @@ async def test_credresolver_no_providers(credential_provider):
     assert creds is None
 
 
+class _SlowProviderMixin:
+    def __init__(self, delay, creds, events):
+        self._delay = delay
+        self._creds = creds
+        self._events = events
+
+    async def load(self):
+        self._events.append(('start', self.METHOD))
+        try:
+            await asyncio.sleep(self._delay)
+        except asyncio.CancelledError:
+            self._events.append(('cancelled', self.METHOD))
+            raise
+        return self._creds
+
+
+class _SlowEnvProvider(_SlowProviderMixin, credentials.AioEnvProvider):
+    pass
+
+
+class _SlowContainerProvider(
+    _SlowProviderMixin, credentials.AioContainerProvider
+):
+    pass
+
+
+class _SlowInstanceMetadataProvider(
+    _SlowProviderMixin, credentials.AioInstanceMetadataProvider
+):
+    pass
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+async def test_credresolver_concurrent():
+    events = []
+    container_creds = credentials.AioCredentials('a', 'b', 'c')
+    resolver = credentials.AioCredentialResolver(
+        providers=[
+            _SlowEnvProvider(0, None, events),
+            _SlowContainerProvider(0.05, container_creds, events),
+            _SlowInstanceMetadataProvider(0.02, mock.Mock(), events),
+        ],
+        concurrent=True,
+    )
+
+    # the container provider keeps its precedence over the faster IMDS one
+    assert await resolver.load_credentials() is container_creds
+    assert events == [
+        ('start', 'env'),
+        ('start', 'container-role'),
+        ('start', 'iam-role'),
+    ]
+
+    events.clear()
+    env_creds = credentials.AioCredentials('d', 'e', 'f')
+    resolver.providers[0] = _SlowEnvProvider(0.01, env_creds, events)
+
+    # the network-bound providers are cancelled once a provider wins
+    assert await resolver.load_credentials() is env_creds
+    assert sorted(events) == [
+        ('cancelled', 'container-role'),
+        ('cancelled', 'iam-role'),
+        ('start', 'container-role'),
+        ('start', 'env'),
+        ('start', 'iam-role'),
+    ]
+
+
 # From class TestCanonicalNameSourceProvider(BaseEnvVar):
 @pytest.mark.moto
 @pytest.mark.asyncio
@@ -2,9 +2,15 @@ import datetime
 from datetime import timezone
 from unittest import mock
 
+import botocore.auth
 import pytest
+from botocore.awsrequest import AWSRequest
+from botocore.exceptions import ParamValidationError
+from botocore.model import ServiceId
 
+import aiobotocore.config
 import aiobotocore.credentials
+import aiobotocore.hooks
 import aiobotocore.session
 import aiobotocore.signers
 
@@ -35,3 +41,123 @@ async def test_signers_generate_db_auth_token(rds_client):
     assert result2.startswith(
         'prod-instance.us-east-1.rds.amazonaws.com:3306/?AWSAccessKeyId=xxx&'
     )
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+async def test_signers_reuse_auth_instances():
+    credentials = aiobotocore.credentials.AioCredentials('akid', 'secret')
+
+    def create_signer(credentials):
+        return aiobotocore.signers.AioRequestSigner(
+            ServiceId('s3'),
+            'us-east-1',
+            's3',
+            's3v4',
+            credentials,
+            aiobotocore.hooks.AioHierarchicalEmitter(),
+        )
+
+    signer = create_signer(credentials)
+    auth = await signer.get_auth_instance('s3', 'us-east-1')
+    # shared with the other signers (i.e. clients) using the same credentials
+    other = create_signer(
+        aiobotocore.credentials.AioCredentials('akid', 'secret')
+    )
+    assert await other.get_auth_instance('s3', 'us-east-1') is auth
+    assert await signer.get_auth_instance('s3', 'us-west-2') is not auth
+    presign = await signer.get_auth_instance(
+        's3', 'us-east-1', 's3v4-query', expires=60
+    )
+    assert presign is not auth
+    assert presign is await signer.get_auth_instance(
+        's3', 'us-east-1', 's3v4-query', expires=60
+    )
+
+    credentials.secret_key = 'rotated'
+    rotated = await signer.get_auth_instance('s3', 'us-east-1')
+    assert rotated is not auth
+    assert rotated.credentials.secret_key == 'rotated'
+
+    # the cached signing key gives the same signatures as botocore
+    request = AWSRequest('GET', 'https://bucket.s3.amazonaws.com/key')
+    request.context['timestamp'] = '20230101T000000Z'
+    expected = botocore.auth.S3SigV4Auth(
+        rotated.credentials, 's3', 'us-east-1'
+    ).signature('string to sign', request)
+    assert rotated.signature('string to sign', request) == expected
+    assert isinstance(rotated, botocore.auth.S3SigV4Auth)
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+@pytest.mark.parametrize('signature_version', ['s3v4', None])
+async def test_signers_generate_presigned_urls(signature_version):
+    session = aiobotocore.session.get_session()
+    params = [
+        {'Bucket': 'bucket', 'Key': key}
+        for key in ('key', 'a b/c d', 'ü/~!*()\'', 'a+b=c&d', 'k' * 300)
+    ] + [
+        {'Bucket': 'other', 'Key': 'key', 'ResponseContentType': 'text/csv'},
+        {'Bucket': 'other', 'Key': 'key', 'ResponseContentType': 'text/csv'},
+    ]
+    clock = datetime.datetime(2016, 11, 7, 17, 39, 33)
+    async with session.create_client(
+        's3',
+        region_name='us-west-2',
+        aws_access_key_id='akid',
+        aws_secret_access_key='secret',
+        aws_session_token='token',
+        config=aiobotocore.config.AioConfig(
+            signature_version=signature_version
+        ),
+    ) as client:
+        with mock.patch('datetime.datetime') as dt, mock.patch(
+            'time.time', return_value=1478540373
+        ):
+            dt.utcnow.return_value = clock
+            urls = await client.generate_presigned_urls(
+                'get_object', params, ExpiresIn=60
+            )
+            expected = [
+                await client.generate_presigned_url(
+                    'get_object', Params=p, ExpiresIn=60
+                )
+                for p in params
+            ]
+        with pytest.raises(ParamValidationError):
+            await client.generate_presigned_urls(
+                'get_object', [{'Bucket': 'bucket', 'Key': ''}]
+            )
+    assert urls == expected
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+async def test_signers_custom_auth_not_shared():
+    class CustomAuth(botocore.auth.SigV4Auth):
+        pass
+
+    auth_factory = mock.Mock(side_effect=lambda **kwargs: object())
+    signer = aiobotocore.signers.AioRequestSigner(
+        ServiceId('s3'),
+        'us-east-1',
+        's3',
+        'v4',
+        aiobotocore.credentials.AioCredentials('akid', 'secret'),
+        aiobotocore.hooks.AioHierarchicalEmitter(),
+    )
+    with mock.patch.dict(
+        botocore.auth.AUTH_TYPE_MAPS,
+        {'custom': CustomAuth, 'factory': auth_factory},
+    ):
+        auth = await signer.get_auth_instance('s3', 'us-east-1', 'custom')
+        assert type(auth) is CustomAuth
+        assert auth is not await signer.get_auth_instance(
+            's3', 'us-east-1', 'custom'
+        )
+        auth = await signer.get_auth_instance('s3', 'us-east-1', 'factory')
+        assert auth is not await signer.get_auth_instance(
+            's3', 'us-east-1', 'factory'
+        )
+        assert auth_factory.call_count == 2
@@ -37,6 +37,7 @@ class AIOServer(multiprocessing.Process):
         asyncio.set_event_loop(asyncio.new_event_loop())
         app = aiohttp.web.Application()
         app.router.add_route('*', '/ok', self.ok)
+        app.router.add_route('GET', r'/bytes/{size:\d+}', self.bytes_handler)
         app.router.add_route('*', '/{anything:.*}', self.stream_handler)
 
         try:
@@ -63,6 +64,23 @@ class AIOServer(multiprocessing.Process):
     async def ok(request):
         return aiohttp.web.Response()
 
+    @staticmethod
+    async def bytes_handler(request):
+        # streams `size` bytes back, used by the benchmarks
+        size = int(request.match_info['size'])
+        chunk = b'x' * min(size, 1 << 20)
+        resp = StreamResponse(
+            headers={
+                'Content-Type': 'application/octet-stream',
+                'Content-Length': str(size),
+            }
+        )
+        await resp.prepare(request)
+        while size > 0:
+            await resp.write(chunk[:size])
+            size -= len(chunk)
+        return resp
+
     async def stream_handler(self, request):
         # Without the Content-Type, most (all?) browsers will not render
         # partially downloaded content. Note, the response type is
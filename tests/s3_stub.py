@@ -0,0 +1,398 @@
+"""An in-memory S3 to exercise the transfer helpers without a server.
+
+``StubS3.send`` replaces a client's ``http_session.send``.  It holds the
+objects of a single bucket named ``bucket``.
+"""
+import asyncio
+import base64
+import io
+import re
+import zlib
+from urllib.parse import parse_qs, unquote, urlsplit
+from xml.etree import ElementTree
+
+from aiobotocore.awsrequest import AioAWSResponse
+from aiobotocore.config import AioConfig
+from aiobotocore.session import AioSession
+
+_NS = '{http://s3.amazonaws.com/doc/2006-03-01/}'
+
+
+def create_client(stub, **config_kwargs):
+    config_kwargs.setdefault('retries', {'max_attempts': 0})
+    client = AioSession().create_client(
+        's3',
+        region_name='us-east-1',
+        endpoint_url='https://s3.example.com',
+        config=AioConfig(s3={'addressing_style': 'path'}, **config_kwargs),
+        aws_secret_access_key='xxx',
+        aws_access_key_id='xxx',
+    )
+    return _StubbedClient(client, stub)
+
+
+class _StubbedClient:
+    def __init__(self, context, stub):
+        self._context = context
+        self._stub = stub
+
+    async def __aenter__(self):
+        client = await self._context.__aenter__()
+        client._endpoint.http_session.send = self._stub.send
+        return client
+
+    async def __aexit__(self, *exc_info):
+        await self._context.__aexit__(*exc_info)
+
+
+class _Content:
+    def __init__(self, body):
+        self._body = io.BytesIO(body)
+
+    async def read(self, n=-1):
+        return self._body.read(n)
+
+
+class _Raw:
+    def __init__(self, url, body, headers):
+        self.url = url
+        self.content = _Content(body)
+        self.raw_headers = tuple(
+            (k.encode(), str(v).encode()) for k, v in headers.items()
+        )
+
+    async def read(self):
+        return await self.content.read()
+
+    def close(self):
+        pass
+
+
+def _crc32(data):
+    return base64.b64encode(
+        zlib.crc32(data).to_bytes(4, byteorder='big')
+    ).decode()
+
+
+async def _read_body(request, headers):
+    """Returns the request body and trailing checksum headers."""
+    body = request.body
+    if body is None:
+        return b'', {}
+    if isinstance(body, (bytes, bytearray)):
+        return bytes(body), {}
+    if hasattr(body, '__aiter__'):
+        encoded = b''.join([chunk async for chunk in body])
+    else:
+        encoded = body.read()
+    if headers.get('content-encoding') != 'aws-chunked':
+        return encoded, {}
+
+    data = bytearray()
+    trailers = {}
+    offset = 0
+    while True:
+        end = encoded.index(b'\r\n', offset)
+        size = int(encoded[offset:end], 16)
+        offset = end + 2
+        if size == 0:
+            for line in encoded[offset:].split(b'\r\n'):
+                if line:
+                    name, value = line.decode().split(':', 1)
+                    trailers[name] = value
+            return bytes(data), trailers
+        data += encoded[offset : offset + size]
+        offset += size + 2
+
+
+def _xml(root, **values):
+    children = ''.join(f'<{k}>{v}</{k}>' for k, v in values.items())
+    return (
+        f'<?xml version="1.0" encoding="UTF-8"?>'
+        f'<{root} xmlns="http://s3.amazonaws.com/doc/2006-03-01/">'
+        f'{children}</{root}>'
+    ).encode()
+
+
+def _error(status, code):
+    body = (
+        f'<?xml version="1.0" encoding="UTF-8"?>'
+        f'<Error><Code>{code}</Code><Message>{code}</Message></Error>'
+    )
+    return status, {}, body.encode()
+
+
+class StubS3:
+    """Stores objects and multipart uploads in memory.
+
+    :param fail: Maps ``(operation, part number)`` to the number of times
+        the request fails with a 500 before succeeding.
+    :param delay: Seconds to sleep per request, or a function of the
+        request's byte count returning them.
+    """
+
+    def __init__(self, fail=None, delay=0):
+        self.objects = {}
+        self.uploads = {}
+        self.completed = []
+        self.aborted = []
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._fail = dict(fail or {})
+        self._delay = delay
+        self._upload_ids = 0
+        self._etags = 0
+
+    def _etag(self):
+        # not an MD5 to keep the stub cheap for large bodies
+        self._etags += 1
+        return f'"etag-{self._etags}"'
+
+    async def send(self, request):
+        url = urlsplit(request.url)
+        key = unquote(url.path)[1:]
+        if key.startswith('bucket/'):
+            key = key[len('bucket/') :]
+        query = parse_qs(url.query, keep_blank_values=True)
+        query = {k: v[0] for k, v in query.items()}
+        headers = {
+            k.lower(): v.decode() if isinstance(v, bytes) else v
+            for k, v in request.headers.items()
+        }
+        body, trailers = await _read_body(request, headers)
+        headers.update(trailers)
+
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            status, response_headers, response_body = self._handle(
+                request.method, key, query, headers, body
+            )
+            delay = self._delay
+            if callable(delay):
+                delay = delay(max(len(body), len(response_body)))
+            await asyncio.sleep(delay)
+        finally:
+            self.in_flight -= 1
+        if request.method == 'HEAD':
+            response_body = b''
+        return AioAWSResponse(
+            request.url,
+            status,
+            response_headers,
+            _Raw(request.url, response_body, response_headers),
+        )
+
+    def put(self, key, body, headers=None):
+        """Stores an object, as if it was uploaded with ``headers``."""
+        etag = self._etag()
+        self.objects[key] = {
+            'Body': body,
+            'Headers': dict(headers or {}),
+            'ETag': etag,
+        }
+        return etag
+
+    def _should_fail(self, operation, part_number=None):
+        remaining = self._fail.get((operation, part_number), 0)
+        if remaining:
+            self._fail[(operation, part_number)] = remaining - 1
+            return True
+        return False
+
+    def _handle(self, method, key, query, headers, body):
+        if method == 'POST' and 'uploads' in query:
+            return self._create_multipart_upload(key, headers)
+        if method == 'PUT' and 'x-amz-copy-source' in headers:
+            return self._copy(key, query, headers)
+        if method == 'GET' and 'tagging' in query:
+            return self._get_object_tagging(key)
+        if method == 'PUT' and 'partNumber' in query:
+            return self._upload_part(
+                query['uploadId'], int(query['partNumber']), headers, body
+            )
+        if method == 'POST' and 'uploadId' in query:
+            return self._complete(query['uploadId'], body)
+        if method == 'DELETE' and 'uploadId' in query:
+            self.requests.append(('AbortMultipartUpload', None))
+            self.aborted.append(query['uploadId'])
+            self.uploads.pop(query['uploadId'], None)
+            return 204, {}, b''
+        if method == 'PUT':
+            return self._put_object(key, headers, body)
+        if method in ('GET', 'HEAD'):
+            return self._get_object(method, key, headers)
+        return _error(400, 'NotImplemented')
+
+    def _check_checksum(self, headers, body):
+        checksum = headers.get('x-amz-checksum-crc32')
+        if checksum is not None and checksum != _crc32(body):
+            return _error(400, 'BadDigest')
+        return None
+
+    def _put_object(self, key, headers, body):
+        self.requests.append(('PutObject', None))
+        if self._should_fail('PutObject'):
+            return _error(500, 'InternalError')
+        error = self._check_checksum(headers, body)
+        if error:
+            return error
+        etag = self._etag()
+        self.objects[key] = {'Body': body, 'Headers': headers, 'ETag': etag}
+        response_headers = {'ETag': etag}
+        if 'x-amz-checksum-crc32' in headers:
+            response_headers['x-amz-checksum-crc32'] = _crc32(body)
+        return 200, response_headers, b''
+
+    def _create_multipart_upload(self, key, headers):
+        self.requests.append(('CreateMultipartUpload', None))
+        self._upload_ids += 1
+        upload_id = f'upload-{self._upload_ids}'
+        self.uploads[upload_id] = {'Key': key, 'Headers': headers, 'Parts': {}}
+        return (
+            200,
+            {},
+            _xml(
+                'InitiateMultipartUploadResult',
+                Bucket='bucket',
+                Key=key,
+                UploadId=upload_id,
+            ),
+        )
+
+    def _upload_part(self, upload_id, part_number, headers, body):
+        self.requests.append(('UploadPart', part_number))
+        if self._should_fail('UploadPart', part_number):
+            return _error(500, 'InternalError')
+        if upload_id not in self.uploads:
+            return _error(404, 'NoSuchUpload')
+        error = self._check_checksum(headers, body)
+        if error:
+            return error
+        etag = self._etag()
+        self.uploads[upload_id]['Parts'][part_number] = (body, etag)
+        response_headers = {'ETag': etag}
+        if 'x-amz-checksum-crc32' in headers:
+            response_headers['x-amz-checksum-crc32'] = _crc32(body)
+        return 200, response_headers, b''
+
+    def _complete(self, upload_id, body):
+        self.requests.append(('CompleteMultipartUpload', None))
+        upload = self.uploads.pop(upload_id, None)
+        if upload is None:
+            return _error(404, 'NoSuchUpload')
+        parts = []
+        for part in ElementTree.fromstring(body).iter(f'{_NS}Part'):
+            number = int(part.find(f'{_NS}PartNumber').text)
+            data, etag = upload['Parts'][number]
+            if part.find(f'{_NS}ETag').text != etag:
+                return _error(400, 'InvalidPart')
+            checksum = part.find(f'{_NS}ChecksumCRC32')
+            if checksum is not None and checksum.text != _crc32(data):
+                return _error(400, 'InvalidPart')
+            parts.append((number, checksum is not None, data))
+        if [number for number, _, _ in parts] != sorted(upload['Parts']):
+            return _error(400, 'InvalidPartOrder')
+        self.completed.append(
+            {
+                'Key': upload['Key'],
+                'Checksums': [has_checksum for _, has_checksum, _ in parts],
+            }
+        )
+        etag = f'"{len(parts)}"'
+        self.objects[upload['Key']] = {
+            'Body': b''.join(data for _, _, data in parts),
+            'Headers': upload['Headers'],
+            'ETag': etag,
+        }
+        return (
+            200,
+            {},
+            _xml(
+                'CompleteMultipartUploadResult',
+                Bucket='bucket',
+                Key=upload['Key'],
+                ETag=etag,
+            ),
+        )
+
+    def _get_object(self, method, key, headers):
+        obj = self.objects.get(key)
+        if obj is None:
+            return _error(404, 'NoSuchKey')
+        body = obj['Body']
+        response_headers = {'ETag': obj['ETag']}
+        if 'if-match' in headers and headers['if-match'] != obj['ETag']:
+            return _error(412, 'PreconditionFailed')
+        if method == 'HEAD':
+            self.requests.append(('HeadObject', None))
+            response_headers['Content-Length'] = len(body)
+            for name, value in obj['Headers'].items():
+                if name in _METADATA_HEADERS or name.startswith('x-amz-meta-'):
+                    response_headers[name] = value
+            return 200, response_headers, body
+
+        match = _RANGE.fullmatch(headers.get('range', ''))
+        start = int(match.group(1)) if match else None
+        self.requests.append(('GetObject', start))
+        if self._should_fail('GetObject', start):
+            return _error(500, 'InternalError')
+        if match is None:
+            response_headers['Content-Length'] = len(body)
+            checksum = obj['Headers'].get('x-amz-checksum-crc32')
+            if headers.get('x-amz-checksum-mode') == 'ENABLED' and checksum:
+                response_headers['x-amz-checksum-crc32'] = checksum
+            return 200, response_headers, body
+        end = min(int(match.group(2)), len(body) - 1)
+        response_headers['Content-Range'] = f'bytes {start}-{end}/{len(body)}'
+        response_headers['Content-Length'] = end - start + 1
+        return 206, response_headers, body[start : end + 1]
+
+    def _copy(self, key, query, headers):
+        source = unquote(headers['x-amz-copy-source']).lstrip('/')
+        source = source.partition('?')[0]
+        if source.startswith('bucket/'):
+            source = source[len('bucket/') :]
+        obj = self.objects.get(source)
+        if obj is None:
+            return _error(404, 'NoSuchKey')
+        if_match = headers.get('x-amz-copy-source-if-match')
+        if if_match is not None and if_match != obj['ETag']:
+            return _error(412, 'PreconditionFailed')
+
+        if 'partNumber' in query:
+            part_number = int(query['partNumber'])
+            self.requests.append(('UploadPartCopy', part_number))
+            if self._should_fail('UploadPartCopy', part_number):
+                return _error(500, 'InternalError')
+            upload = self.uploads.get(query['uploadId'])
+            if upload is None:
+                return _error(404, 'NoSuchUpload')
+            match = _RANGE.fullmatch(headers['x-amz-copy-source-range'])
+            start, end = int(match.group(1)), int(match.group(2))
+            etag = self._etag()
+            upload['Parts'][part_number] = (obj['Body'][start : end + 1], etag)
+            return 200, {}, _xml('CopyPartResult', ETag=etag)
+
+        self.requests.append(('CopyObject', None))
+        copied = dict(obj, ETag=self._etag())
+        if headers.get('x-amz-metadata-directive') == 'REPLACE':
+            copied['Headers'] = headers
+        self.objects[key] = copied
+        return 200, {}, _xml('CopyObjectResult', ETag=copied['ETag'])
+
+    def _get_object_tagging(self, key):
+        obj = self.objects.get(key)
+        if obj is None:
+            return _error(404, 'NoSuchKey')
+        tags = parse_qs(obj['Headers'].get('x-amz-tagging', ''))
+        tag_set = ''.join(
+            f'<Tag><Key>{k}</Key><Value>{v[0]}</Value></Tag>'
+            for k, v in tags.items()
+        )
+        return 200, {}, _xml('Tagging', TagSet=tag_set)
+
+
+_RANGE = re.compile(r'bytes=(\d+)-(\d+)')
+_METADATA_HEADERS = {'cache-control', 'content-type', 'content-language'}
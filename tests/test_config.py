@@ -1,11 +1,15 @@
 import asyncio
+import socket
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 import aiohttp.resolver
 import pytest
+from botocore.awsrequest import AWSRequest
 from botocore.config import Config
 from botocore.exceptions import ParamValidationError, ReadTimeoutError
 
 from aiobotocore.config import AioConfig
+from aiobotocore.httpsession import AIOHTTPSession
 from aiobotocore.session import AioSession, get_session
 from tests.mock_server import AIOServer
 
@@ -61,6 +65,173 @@ def test_connector_args():
     assert aio_cfg.connector_args['keepalive_timeout'] == 75
 
 
+# NOTE: this doesn't require moto but needs to be marked to run with coverage
+@pytest.mark.moto
+def test_socket_options_config():
+    with pytest.raises(ParamValidationError):
+        AioConfig(socket_options=(socket.SOL_SOCKET, socket.SO_RCVBUF, 1))
+
+    with pytest.raises(ParamValidationError):
+        AioConfig(socket_options=[(socket.SOL_SOCKET, socket.SO_RCVBUF)])
+
+    with pytest.raises(ParamValidationError):
+        AioConfig(socket_options=[(socket.SOL_SOCKET, 'SO_RCVBUF', 1)])
+
+    rcvbuf = (socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
+    aio_cfg = AioConfig(socket_options=[rcvbuf])
+    assert aio_cfg.socket_options == [rcvbuf]
+
+    # merge keeps our socket options unless the other config overrides them
+    assert aio_cfg.merge(Config(read_timeout=75)).socket_options == [rcvbuf]
+    assert aio_cfg.merge(AioConfig(socket_options=[])).socket_options == []
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+async def test_socket_options_client_args():
+    session = AioSession()
+    rcvbuf = (socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
+    config = AioConfig(socket_options=[rcvbuf], tcp_keepalive=True)
+    async with session.create_client(
+        's3',
+        region_name='us-east-1',
+        config=config,
+        aws_secret_access_key='xxx',
+        aws_access_key_id='xxx',
+    ) as s3_client:
+        assert s3_client.meta.config.socket_options == [rcvbuf]
+        assert s3_client._endpoint.http_session._socket_options == [
+            (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+            rcvbuf,
+        ]
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+async def test_socket_options_applied():
+    socket_options = [
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+    async with AIOServer() as server, AIOHTTPSession(
+        socket_options=socket_options
+    ) as http_session:
+        request = AWSRequest(method='GET', url=server.endpoint_url + '/ok')
+        response = await http_session.send(request.prepare())
+        assert response.status_code == 200
+
+        # the connection went back to the pool, check its socket
+        (protocols,) = http_session._connector._conns.values()
+        sock = protocols[0][0].transport.get_extra_info('socket')
+        for level, optname, value in socket_options:
+            assert sock.getsockopt(level, optname) == value
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+async def test_socket_options_applied_before_connect(monkeypatch):
+    # options like SO_RCVBUF only affect the handshake if set before it
+    keepalive = (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    connecting = []
+    loop = asyncio.get_running_loop()
+    sock_connect = loop.sock_connect
+
+    async def recording_sock_connect(sock, address):
+        connecting.append(sock.getsockopt(*keepalive[:2]))
+        return await sock_connect(sock, address)
+
+    async with AIOServer() as server, AIOHTTPSession(
+        socket_options=[keepalive]
+    ) as http_session:
+        monkeypatch.setattr(loop, 'sock_connect', recording_sock_connect)
+        request = AWSRequest(method='GET', url=server.endpoint_url + '/ok')
+        response = await http_session.send(request.prepare())
+        assert response.status_code == 200
+    assert connecting == [1]
+
+
+# NOTE: this doesn't require moto but needs to be marked to run with coverage
+@pytest.mark.moto
+def test_parse_offload_config():
+    with pytest.raises(ParamValidationError):
+        AioConfig(parse_offload_threshold=-1)
+
+    with pytest.raises(ParamValidationError):
+        AioConfig(parse_offload_threshold='1MB')
+
+    with pytest.raises(ParamValidationError):
+        AioConfig(parse_executor=object())
+
+    with ProcessPoolExecutor(1) as executor:
+        with pytest.raises(ParamValidationError):
+            AioConfig(parse_executor=executor)
+
+    assert AioConfig().parse_offload_threshold is None
+
+    with ThreadPoolExecutor(1) as executor:
+        aio_cfg = AioConfig(
+            parse_offload_threshold=1024, parse_executor=executor
+        )
+        merged = aio_cfg.merge(Config(read_timeout=75))
+        assert merged.parse_offload_threshold == 1024
+        assert merged.parse_executor is executor
+
+
+# NOTE: this doesn't require moto but needs to be marked to run with coverage
+@pytest.mark.moto
+def test_checksum_offload_config():
+    with pytest.raises(ParamValidationError):
+        AioConfig(checksum_offload_threshold=-1)
+
+    assert AioConfig().checksum_offload_threshold is None
+    merged = AioConfig(checksum_offload_threshold=1024).merge(
+        Config(read_timeout=75)
+    )
+    assert merged.checksum_offload_threshold == 1024
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+async def test_parse_offload():
+    class _CountingExecutor(ThreadPoolExecutor):
+        submitted = 0
+
+        def submit(self, *args, **kwargs):
+            self.submitted += 1
+            return super().submit(*args, **kwargs)
+
+    session = AioSession()
+    with _CountingExecutor(1) as executor:
+        for threshold, offloaded in ((0, 1), (1 << 20, 0)):
+            executor.submitted = 0
+            config = AioConfig(
+                parse_offload_threshold=threshold, parse_executor=executor
+            )
+            async with AIOServer() as server, session.create_client(
+                'dynamodb',
+                region_name='us-east-1',
+                config=config,
+                endpoint_url=server.endpoint_url + '/ok',
+                aws_secret_access_key='xxx',
+                aws_access_key_id='xxx',
+            ) as client:
+                response = await client.list_tables()
+                assert response['ResponseMetadata']['HTTPStatusCode'] == 200
+            assert executor.submitted == offloaded
+
+
+# NOTE: this doesn't require moto but needs to be marked to run with coverage
+@pytest.mark.moto
+def test_json_backend_config():
+    with pytest.raises(ParamValidationError):
+        AioConfig(json_backend='simplejson')
+
+    assert AioConfig().json_backend is None
+    aio_cfg = AioConfig(json_backend='auto')
+    assert aio_cfg.merge(Config(read_timeout=75)).json_backend == 'auto'
+
+
 @pytest.mark.moto
 @pytest.mark.asyncio
 async def test_connector_timeout():
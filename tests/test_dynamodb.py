@@ -37,6 +37,32 @@ async def test_get_item(dynamodb_client, table_name, dynamodb_put_item):
     assert response['Item']['testKey'] == {'S': test_value}
 
 
+@pytest.mark.moto
+@pytest.mark.parametrize('signature_version', ['v4'])
+@pytest.mark.config_kwargs(dict(json_backend='auto'))
+@pytest.mark.asyncio
+async def test_get_item_json_backend(
+    dynamodb_client, table_name, dynamodb_put_item
+):
+    json_backend = dynamodb_client._endpoint._json_backend
+    if json_backend is None:
+        pytest.skip('neither orjson nor ujson is installed')
+
+    test_value = 'testValue \u2603'
+    await dynamodb_put_item(test_value)
+    response = await dynamodb_client.get_item(
+        TableName=table_name, Key={'testKey': {'S': test_value}}
+    )
+    pytest.aio.assert_status_code(response, 200)
+    assert response['Item']['testKey'] == {'S': test_value}
+
+    # errors are still parsed into exceptions
+    with pytest.raises(dynamodb_client.exceptions.ResourceNotFoundException):
+        await dynamodb_client.get_item(
+            TableName='missing', Key={'testKey': {'S': test_value}}
+        )
+
+
 @pytest.mark.moto
 @pytest.mark.parametrize('signature_version', ['v4'])
 @pytest.mark.asyncio
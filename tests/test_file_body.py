@@ -0,0 +1,96 @@
+import os
+import threading
+
+import pytest
+from aiohttp import web
+from botocore.httpchecksum import AwsChunkedWrapper, Crc32Checksum
+
+from aiobotocore.config import AioConfig
+from aiobotocore.httpchecksum import AioAwsChunkedWrapper
+from aiobotocore.session import AioSession
+
+_DATA = os.urandom(3 * 1024 * 1024 + 7)
+
+
+@pytest.fixture
+async def put_server():
+    requests = []
+
+    async def put(request):
+        requests.append((request.headers, await request.read()))
+        return web.Response(headers={'ETag': '"etag"'})
+
+    app = web.Application(client_max_size=2 * len(_DATA))
+    app.router.add_put('/{tail:.*}', put)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f'http://127.0.0.1:{port}', requests
+    await runner.cleanup()
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+@pytest.mark.parametrize('sendfile', [True, False])
+async def test_put_file_body(put_server, tmp_path, monkeypatch, sendfile):
+    endpoint_url, requests = put_server
+    if not sendfile:
+        monkeypatch.setattr(
+            'asyncio.BaseEventLoop.sendfile', _no_sendfile, raising=True
+        )
+    reads = []
+    pread = os.pread
+
+    def recording_pread(*args):
+        reads.append(threading.current_thread())
+        return pread(*args)
+
+    monkeypatch.setattr(os, 'pread', recording_pread)
+
+    path = tmp_path / 'data'
+    path.write_bytes(_DATA)
+    session = AioSession()
+    async with session.create_client(
+        's3',
+        region_name='us-east-1',
+        endpoint_url=endpoint_url,
+        config=AioConfig(
+            s3={'addressing_style': 'path'}, retries={'max_attempts': 0}
+        ),
+        aws_secret_access_key='xxx',
+        aws_access_key_id='xxx',
+    ) as client:
+        with open(path, 'rb') as f:
+            f.seek(10)
+            await client.put_object(Bucket='bucket', Key='key', Body=f)
+
+    headers, body = requests[-1]
+    assert body == _DATA[10:]
+    assert int(headers['Content-Length']) == len(_DATA) - 10
+    assert 'Content-Disposition' not in headers
+    # the file is never read on the event loop
+    assert threading.main_thread() not in reads
+    assert bool(reads) != sendfile
+
+
+async def _no_sendfile(*args, **kwargs):
+    raise NotImplementedError
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+async def test_aws_chunked_file_body(tmp_path):
+    path = tmp_path / 'data'
+    path.write_bytes(_DATA)
+
+    expected = b''.join(
+        AwsChunkedWrapper(open(path, 'rb'), checksum_cls=Crc32Checksum)
+    )
+    with open(path, 'rb') as f:
+        wrapper = AioAwsChunkedWrapper(f, checksum_cls=Crc32Checksum)
+        assert b''.join([chunk async for chunk in wrapper]) == expected
+        # a retry seeks back to the start
+        wrapper.seek(0)
+        assert b''.join([chunk async for chunk in wrapper]) == expected
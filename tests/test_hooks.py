@@ -0,0 +1,50 @@
+import functools
+
+import pytest
+
+from aiobotocore.hooks import AioHierarchicalEmitter
+
+
+def _sync_handler(**kwargs):
+    return 'sync'
+
+
+async def _async_handler(**kwargs):
+    return 'async'
+
+
+async def _partial_target(value, **kwargs):
+    return value
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+async def test_emit_sync_and_async_handlers():
+    emitter = AioHierarchicalEmitter()
+    emitter.register('foo.bar', _sync_handler)
+    emitter.register('foo', _async_handler)
+    emitter.register('foo', functools.partial(_partial_target, 'partial'))
+
+    responses = await emitter.emit('foo.bar')
+    assert [response for _, response in responses] == [
+        'sync',
+        'async',
+        'partial',
+    ]
+
+    handler, response = await emitter.emit_until_response('foo.bar')
+    assert handler is _sync_handler
+    assert response == 'sync'
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+async def test_emit_cache_invalidated_on_register():
+    emitter = AioHierarchicalEmitter()
+    assert await emitter.emit('foo.bar') == []
+
+    emitter.register('foo', _async_handler)
+    assert await emitter.emit('foo.bar') == [(_async_handler, 'async')]
+
+    emitter.unregister('foo', _async_handler)
+    assert await emitter.emit('foo.bar') == []
@@ -0,0 +1,72 @@
+import asyncio
+import os
+
+import pytest
+from botocore.exceptions import FlexibleChecksumError
+
+from aiobotocore.httpchecksum import AioStreamingChecksumBody
+from tests.s3_stub import StubS3, _crc32, create_client
+
+_DATA = os.urandom(100 * 1024 + 7)
+
+
+async def _read_all(body, method):
+    if method == 'read':
+        return await body.read()
+    if method == 'iter_chunks':
+        return b''.join([chunk async for chunk in body.iter_chunks(1000)])
+    buffer = bytearray(len(_DATA) + 1)
+    filled = await body.readinto(buffer)
+    assert await body.readinto(buffer[filled:]) == 0
+    return bytes(buffer[:filled])
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+@pytest.mark.parametrize('method', ['read', 'iter_chunks', 'readinto'])
+@pytest.mark.parametrize('offload_threshold', [None, 0])
+async def test_streaming_checksum(method, offload_threshold):
+    stub = StubS3()
+    stub.put('key', _DATA, {'x-amz-checksum-crc32': _crc32(_DATA)})
+    stub.put('bad', _DATA, {'x-amz-checksum-crc32': _crc32(b'other')})
+    async with create_client(
+        stub, checksum_offload_threshold=offload_threshold
+    ) as client:
+        response = await client.get_object(
+            Bucket='bucket', Key='key', ChecksumMode='ENABLED'
+        )
+        assert isinstance(response['Body'], AioStreamingChecksumBody)
+        assert response['ChecksumCRC32'] == _crc32(_DATA)
+        assert await _read_all(response['Body'], method) == _DATA
+
+        response = await client.get_object(
+            Bucket='bucket', Key='bad', ChecksumMode='ENABLED'
+        )
+        with pytest.raises(FlexibleChecksumError):
+            await _read_all(response['Body'], method)
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+async def test_streaming_checksum_offload(monkeypatch):
+    offloaded = []
+    run_in_executor = asyncio.BaseEventLoop.run_in_executor
+
+    def recording_run_in_executor(self, executor, func, *args):
+        offloaded.append(len(args[0]))
+        return run_in_executor(self, executor, func, *args)
+
+    stub = StubS3()
+    stub.put('key', _DATA, {'x-amz-checksum-crc32': _crc32(_DATA)})
+    async with create_client(stub, checksum_offload_threshold=1024) as client:
+        response = await client.get_object(
+            Bucket='bucket', Key='key', ChecksumMode='ENABLED'
+        )
+        monkeypatch.setattr(
+            asyncio.BaseEventLoop, 'run_in_executor', recording_run_in_executor
+        )
+        await response['Body'].read(100)
+        async for _ in response['Body'].iter_chunks(4096):
+            pass
+
+    assert offloaded and all(size >= 1024 for size in offloaded)
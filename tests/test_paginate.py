@@ -0,0 +1,109 @@
+import asyncio
+
+import botocore.session
+import pytest
+from botocore.exceptions import PaginationError
+
+from aiobotocore.paginate import AioPaginator
+
+
+def _create_paginator(pages, events, delay=0.01):
+    session = botocore.session.get_session()
+    model = session.get_service_model('s3').operation_model('ListObjectsV2')
+    pagination_config = session.get_paginator_model('s3').get_paginator(
+        'ListObjectsV2'
+    )
+
+    async def list_objects_v2(**kwargs):
+        index = int(kwargs.get('ContinuationToken', 0))
+        events.append(('request', index))
+        await asyncio.sleep(delay)
+        page = {
+            'Contents': [{'Key': f'key-{index}'}],
+            'IsTruncated': index + 1 < pages,
+        }
+        if page['IsTruncated']:
+            page['NextContinuationToken'] = str(index + 1)
+        return page
+
+    return AioPaginator(list_objects_v2, pagination_config, model)
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+@pytest.mark.parametrize('prefetch', [None, 0, 1, 3])
+async def test_paginate_prefetch(prefetch):
+    events = []
+    paginator = _create_paginator(5, events)
+    config = {} if prefetch is None else {'Prefetch': prefetch}
+
+    keys = []
+    async for page in paginator.paginate(
+        Bucket='bucket', PaginationConfig=config
+    ):
+        events.append(('page', len(keys)))
+        keys.extend(obj['Key'] for obj in page['Contents'])
+        # simulate work on the page
+        await asyncio.sleep(0.03)
+
+    assert keys == [f'key-{i}' for i in range(5)]
+    assert [index for kind, index in events if kind == 'request'] == list(
+        range(5)
+    )
+
+    # pages requested ahead of the one being processed never exceed prefetch
+    for position, (kind, index) in enumerate(events):
+        if kind == 'page':
+            requested = sum(
+                1 for kind, _ in events[:position] if kind == 'request'
+            )
+            assert requested - index - 1 <= (prefetch or 0)
+
+    if prefetch:
+        # the next page was requested while the first one was processed
+        assert events.index(('request', 1)) < events.index(('page', 1))
+    else:
+        assert events[:4] == [
+            ('request', 0),
+            ('page', 0),
+            ('request', 1),
+            ('page', 1),
+        ]
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+async def test_paginate_prefetch_early_exit():
+    events = []
+    paginator = _create_paginator(100, events)
+    async for _ in paginator.paginate(
+        Bucket='bucket', PaginationConfig={'Prefetch': 2}
+    ):
+        break
+
+    # the background requests stop once the consumer is done
+    await asyncio.sleep(0.1)
+    assert len(events) <= 3
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+async def test_paginate_prefetch_build_full_result():
+    paginator = _create_paginator(4, [], delay=0)
+    result = await paginator.paginate(
+        Bucket='bucket', PaginationConfig={'Prefetch': 2, 'MaxItems': 3}
+    ).build_full_result()
+    assert [obj['Key'] for obj in result['Contents']] == [
+        'key-0',
+        'key-1',
+        'key-2',
+    ]
+    assert 'NextToken' in result
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+async def test_paginate_prefetch_error():
+    paginator = _create_paginator(3, [])
+    with pytest.raises(PaginationError):
+        paginator.paginate(Bucket='bucket', PaginationConfig={'Prefetch': -1})
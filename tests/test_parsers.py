@@ -0,0 +1,266 @@
+import tracemalloc
+
+import botocore.session
+import pytest
+from aiohttp import web
+
+from aiobotocore.awsrequest import AioAWSResponse
+from aiobotocore.config import AioConfig
+from aiobotocore.parsers import AioRestXMLParser
+from aiobotocore.session import AioSession
+
+_LIST_OBJECTS_V2 = (
+    b'<?xml version="1.0" encoding="UTF-8"?>'
+    b'<ListBucketResult xmlns="http://s3.amazonaws.com/doc/2006-03-01/">'
+    b'<Name>bucket</Name><Prefix></Prefix><KeyCount>3</KeyCount>'
+    b'<MaxKeys>1000</MaxKeys><Delimiter>/</Delimiter>'
+    b'<IsTruncated>false</IsTruncated>'
+    b'<Contents><Key>a</Key>'
+    b'<LastModified>2023-01-01T00:00:00.000Z</LastModified>'
+    b'<ETag>&quot;etag&quot;</ETag><Size>1</Size>'
+    b'<StorageClass>STANDARD</StorageClass></Contents>'
+    b'<Contents><Key>b \xe2\x98\x83</Key>'
+    b'<LastModified>2023-01-02T00:00:00.000Z</LastModified>'
+    b'<ETag>&quot;etag&quot;</ETag><Size>2</Size>'
+    b'<StorageClass>STANDARD</StorageClass></Contents>'
+    b'<CommonPrefixes><Prefix>dir/</Prefix></CommonPrefixes>'
+    b'</ListBucketResult>'
+)
+
+_LIST_OBJECT_VERSIONS = (
+    b'<?xml version="1.0" encoding="UTF-8"?>'
+    b'<ListVersionsResult xmlns="http://s3.amazonaws.com/doc/2006-03-01/">'
+    b'<Name>bucket</Name><IsTruncated>false</IsTruncated>'
+    b'<Version><Key>a</Key><VersionId>2</VersionId>'
+    b'<IsLatest>true</IsLatest><Size>1</Size></Version>'
+    b'<DeleteMarker><Key>b</Key><VersionId>3</VersionId>'
+    b'<IsLatest>true</IsLatest></DeleteMarker>'
+    b'<Version><Key>a</Key><VersionId>1</VersionId>'
+    b'<IsLatest>false</IsLatest><Size>1</Size></Version>'
+    b'</ListVersionsResult>'
+)
+
+
+def _response_dict(body):
+    return {
+        'status_code': 200,
+        'headers': {'x-amz-request-id': 'request-id'},
+        'body': body,
+        'context': {},
+    }
+
+
+@pytest.mark.moto
+@pytest.mark.parametrize(
+    'operation_name,body',
+    [
+        ('ListObjectsV2', _LIST_OBJECTS_V2),
+        ('ListObjectVersions', _LIST_OBJECT_VERSIONS),
+    ],
+)
+@pytest.mark.parametrize('chunk_size', [1, 7, 1 << 20])
+def test_xml_payload_stream(operation_name, body, chunk_size):
+    service_model = botocore.session.get_session().get_service_model('s3')
+    shape = service_model.operation_model(operation_name).output_shape
+    parser = AioRestXMLParser()
+
+    payload = parser.stream_payload(shape)
+    for i in range(0, len(body), chunk_size):
+        payload.feed(body[i : i + chunk_size])
+    payload.close()
+
+    assert parser.parse(_response_dict(payload), shape) == parser.parse(
+        _response_dict(body), shape
+    )
+
+
+@pytest.mark.moto
+def test_xml_payload_stream_unsupported_shape():
+    service_model = botocore.session.get_session().get_service_model('s3')
+    operation_model = service_model.operation_model('GetBucketLocation')
+    assert (
+        AioRestXMLParser().stream_payload(operation_model.output_shape) is None
+    )
+
+
+class _StreamingContent:
+    def __init__(self, body, chunk_size):
+        self._chunks = [
+            body[i : i + chunk_size] for i in range(0, len(body), chunk_size)
+        ]
+
+    async def iter_any(self):
+        for chunk in self._chunks:
+            yield chunk
+
+    async def read(self):
+        return b''.join(self._chunks)
+
+
+class _StreamingRaw:
+    raw_headers = ((b'Content-Type', b'application/xml'),)
+
+    def __init__(self, body, chunk_size):
+        self.content = _StreamingContent(body, chunk_size)
+
+    async def read(self):
+        return await self.content.read()
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+async def test_streaming_xml_parse_client():
+    stream_outputs = []
+
+    async def send(request):
+        stream_outputs.append(request.stream_output)
+        return AioAWSResponse(
+            request.url,
+            200,
+            dict(_StreamingRaw.raw_headers),
+            _StreamingRaw(_LIST_OBJECTS_V2, 16),
+        )
+
+    results = []
+    received_bodies = []
+    session = AioSession()
+    session.register(
+        'response-received.s3.ListObjectsV2',
+        lambda response_dict, **kwargs: received_bodies.append(
+            response_dict['body']
+        ),
+    )
+    for streaming_xml_parse in (False, True):
+        async with session.create_client(
+            's3',
+            region_name='us-east-1',
+            config=AioConfig(streaming_xml_parse=streaming_xml_parse),
+            aws_secret_access_key='xxx',
+            aws_access_key_id='xxx',
+        ) as client:
+            client._endpoint.http_session.send = send
+            results.append(await client.list_objects_v2(Bucket='bucket'))
+
+    assert stream_outputs == [False, True]
+    # handlers see the raw body whether or not it was parsed as received
+    assert received_bodies == [_LIST_OBJECTS_V2, _LIST_OBJECTS_V2]
+    buffered, streamed = results
+    assert streamed['Contents'] == buffered['Contents']
+    assert [obj['Key'] for obj in streamed['Contents']] == ['a', 'b ☃']
+    assert streamed['CommonPrefixes'] == [{'Prefix': 'dir/'}]
+
+
+def _list_objects_v2_body(count):
+    item = (
+        b'<Contents><Key>%06d/key.txt</Key>'
+        b'<LastModified>2023-01-01T00:00:00.000Z</LastModified>'
+        b'<ETag>&quot;0123456789abcdef0123456789abcdef&quot;</ETag>'
+        b'<Size>1</Size><StorageClass>STANDARD</StorageClass></Contents>'
+    )
+    return (
+        b'<?xml version="1.0" encoding="UTF-8"?>'
+        b'<ListBucketResult xmlns="http://s3.amazonaws.com/doc/2006-03-01/">'
+        b'<Name>bucket</Name><IsTruncated>false</IsTruncated>'
+        + b''.join(item % i for i in range(count))
+        + b'</ListBucketResult>'
+    )
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+async def test_streaming_xml_parse_peak_memory():
+    body = _list_objects_v2_body(1000)
+    responses = []
+
+    async def send(request):
+        responses.append(
+            AioAWSResponse(
+                request.url,
+                200,
+                dict(_StreamingRaw.raw_headers),
+                _StreamingRaw(body, 16384),
+            )
+        )
+        return responses[-1]
+
+    peaks = []
+    session = AioSession()
+    for streaming_xml_parse in (False, True):
+        async with session.create_client(
+            's3',
+            region_name='us-east-1',
+            config=AioConfig(streaming_xml_parse=streaming_xml_parse),
+            aws_secret_access_key='xxx',
+            aws_access_key_id='xxx',
+        ) as client:
+            client._endpoint.http_session.send = send
+            # the first call loads the models and warms the caches
+            await client.list_objects_v2(Bucket='bucket')
+            tracemalloc.start()
+            try:
+                response = await client.list_objects_v2(Bucket='bucket')
+                peaks.append(tracemalloc.get_traced_memory()[1])
+            finally:
+                tracemalloc.stop()
+            assert len(response['Contents']) == 1000
+
+    # neither the raw body nor the element tree is held next to the result
+    assert responses[-1]._content == b''
+    buffered, streamed = peaks
+    assert streamed < 0.8 * buffered
+
+
+@pytest.fixture
+async def truncating_server():
+    # the first response is cut after half of its body
+    attempts = []
+
+    async def list_objects(request):
+        attempts.append(request.path)
+        response = web.StreamResponse(
+            headers={
+                'Content-Type': 'application/xml',
+                'Content-Length': str(len(_LIST_OBJECTS_V2)),
+            }
+        )
+        await response.prepare(request)
+        if len(attempts) == 1:
+            await response.write(_LIST_OBJECTS_V2[:100])
+            request.transport.close()
+        else:
+            await response.write(_LIST_OBJECTS_V2)
+        return response
+
+    app = web.Application()
+    app.router.add_get('/{tail:.*}', list_objects)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f'http://127.0.0.1:{port}', attempts
+    await runner.cleanup()
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+async def test_streaming_xml_parse_retries_dropped_body(truncating_server):
+    endpoint_url, attempts = truncating_server
+    session = AioSession()
+    async with session.create_client(
+        's3',
+        region_name='us-east-1',
+        endpoint_url=endpoint_url,
+        config=AioConfig(
+            streaming_xml_parse=True,
+            s3={'addressing_style': 'path'},
+            retries={'mode': 'standard', 'max_attempts': 2},
+        ),
+        aws_secret_access_key='xxx',
+        aws_access_key_id='xxx',
+    ) as client:
+        response = await client.list_objects_v2(Bucket='bucket')
+
+    assert len(attempts) == 2
+    assert [obj['Key'] for obj in response['Contents']] == ['a', 'b ☃']
+    assert response['ResponseMetadata']['RetryAttempts'] == 1
@@ -7,6 +7,7 @@ import pytest
 from aiohttp.client import ClientResponse
 from botocore import retryhandler
 from botocore.args import ClientArgsCreator
+from botocore.auth import SigV4Auth
 from botocore.awsrequest import AWSResponse
 from botocore.client import BaseClient, ClientCreator, Config
 from botocore.configprovider import SmartDefaultsConfigStoreFactory
@@ -55,13 +56,15 @@ from botocore.handlers import (
 from botocore.hooks import EventAliaser, HierarchicalEmitter
 from botocore.httpchecksum import (
     AwsChunkedWrapper,
+    StreamingChecksumBody,
     _apply_request_trailer_checksum,
     _handle_bytes_response,
+    _handle_streaming_response,
     apply_request_checksum,
     handle_checksum_body,
 )
 from botocore.httpsession import URLLib3Session
-from botocore.paginate import PageIterator, ResultKeyIterator
+from botocore.paginate import PageIterator, Paginator, ResultKeyIterator
 from botocore.parsers import (
     PROTOCOL_PARSERS,
     EC2QueryParser,
@@ -75,6 +78,11 @@ from botocore.parsers import (
 from botocore.response import StreamingBody, get_response
 from botocore.retries import adaptive, special, standard
 from botocore.retries.bucket import TokenBucket
+from botocore.serialize import (
+    JSONSerializer,
+    RestJSONSerializer,
+    create_serializer,
+)
 from botocore.session import Session, get_session
 from botocore.signers import (
     RequestSigner,
@@ -142,11 +150,17 @@ _API_DIGESTS = {
     ClientArgsCreator.get_client_args: {
         '5e5b18cb0b466d3acb2e0ecacbc8dc78de4022fc'
     },
+    ClientArgsCreator._compute_socket_options: {
+        '256e55d384198189d578eb979c7af343cb62c6d1'
+    },
     # client.py
     ClientCreator.create_client: {'3af567fcde81899a3b722d9cafd6a5c78e8ea08c'},
     ClientCreator._create_client_class: {
         'fcecaf8d4f2c1ac3c5d0eb50c573233ef86d641d'
     },
+    ClientCreator._load_service_model: {
+        '4e2569e43d9a3dfd9964b227ef95abcd3a6f4128'
+    },
     ClientCreator._register_endpoint_discovery: {
         '483c6c8e035810d1b76110fc1956de76943c2f18'
     },
@@ -357,6 +371,7 @@ _API_DIGESTS = {
     },
     # paginate.py
     PageIterator.__iter__: {'a7e83728338e61ff2ca0a26c6f03c67cbabffc32'},
+    Paginator.paginate: {'fd3fda2c4a38a5be8a1f70bfaa62ada072aa190b'},
     PageIterator.result_key_iters: {
         'e8cd36fdc4960e08c9aa50196c4e5d1ee4e39756'
     },
@@ -390,9 +405,20 @@ _API_DIGESTS = {
         '0564ba55383a71cc1ba3e5be7110549d7e9992f5'
     },
     create_parser: {'37e9f1c3b60de17f477a9b79eae8e1acaa7c89d7'},
+    JSONParser._parse_body_as_json: {
+        '31a38b90187b535021ffd1b163807672314549c0'
+    },
     # response.py
     StreamingBody: {'73cb1276dfb509331b964d3d5ed69e5efa008de5'},
     get_response: {'6515f43730b546419695c26d4bc0d198fde54b10'},
+    # serialize.py
+    JSONSerializer.serialize_to_request: {
+        'b077c5eb8f6abf2c9f74606ec08b29001597811f'
+    },
+    RestJSONSerializer._serialize_body_params: {
+        'd15911dc08f7eebf4da341939d818f26424fe385'
+    },
+    create_serializer: {'4523fa46af8c8cf1596511e606630f23988540b3'},
     # session.py
     Session.__init__: {'d0d3b11d6feb4783d2a7399246ce02c58e2c34e7'},
     Session._register_response_parser_factory: {
@@ -412,6 +438,11 @@ _API_DIGESTS = {
     Session._register_smart_defaults_factory: {
         'af5fc9cf6837ed119284603ca1086e4113febec0'
     },
+    # run in the executor by AioSession._load_config
+    Session.full_config: {'7f7f6c89c64c40bad0fe2709223241b5aafa2332'},
+    Session._register_data_loader: {
+        'b466359481456f8c8e5cc7b82adef604a1e44651'
+    },
     # signers.py
     RequestSigner.handler: {'371909df136a0964ef7469a63d25149176c2b442'},
     RequestSigner.sign: {'d90346d5e066e89cd902c5c936f59b644ecde275'},
@@ -420,6 +451,8 @@ _API_DIGESTS = {
         'c2c34a0f44cac8819c7e9b74ca52dc82a28a1a08'
     },
     RequestSigner._choose_signer: {'eb82bd279d8c6cb7c93f7330a45544f0dda73170'},
+    # the signing key derivation of SigV4Auth.signature is cached
+    SigV4Auth.signature: {'542b6beab215a6d0f3485231394e0bd05da50a85'},
     RequestSigner.generate_presigned_url: {
         '417682868eacc10bf4c65f3dfbdba7d20d9250db'
     },
@@ -563,9 +596,15 @@ _API_DIGESTS = {
     # httpchecksum.py
     handle_checksum_body: {'4b9aeef18d816563624c66c57126d1ffa6fe1993'},
     _handle_bytes_response: {'0761c4590c6addbe8c674e40fca9f7dd375a184b'},
+    _handle_streaming_response: {'7ce971e012f9d4b04889f0af83f67281ed6a9e6e'},
+    StreamingChecksumBody.read: {'8cb8c1fa37c392644376e691e7940f93738a9f13'},
+    StreamingChecksumBody._validate_checksum: {
+        '04aed9dd3ed02e4c716075d48a5324965278ae7d'
+    },
     AwsChunkedWrapper._make_chunk: {
         '097361692f0fd6c863a17dd695739629982ef7e4'
     },
+    AwsChunkedWrapper._reset: {'584c99c1f8051179880445b5132f53c83b43e725'},
     AwsChunkedWrapper.__iter__: {'261e26d1061655555fe3dcb2689d963e43f80fb0'},
     apply_request_checksum: {'bcc044f0655f30769994efab72b29e76d73f7e39'},
     _apply_request_trailer_checksum: {
@@ -1,7 +1,10 @@
+import array
+import gzip
 import io
+import zlib
 
 import pytest
-from botocore.exceptions import IncompleteReadError
+from botocore.exceptions import IncompleteReadError, ResponseStreamingError
 
 from aiobotocore import response
 
@@ -187,3 +190,140 @@ async def test_streaming_line_empty_body():
         content_length=0,
     )
     await assert_lines(stream.iter_lines(), [])
+
+
+class AsyncTrickleIO(AsyncBytesIO):
+    # returns at most 3 bytes per read, like a stream of small packets
+    async def read(self, amt=-1):
+        return await super().read(3 if amt < 0 else min(amt, 3))
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+async def test_streaming_body_readinto():
+    body = AsyncTrickleIO(b'1234567890')
+    stream = response.StreamingBody(body, content_length=10)
+    buffer = bytearray(4)
+    assert await stream.readinto(buffer) == 4
+    assert buffer == b'1234'
+    assert stream.tell() == 4
+    assert await stream.readinto(memoryview(buffer)[:2]) == 2
+    assert buffer == b'5634'
+    assert await stream.readinto(buffer) == 4
+    assert await stream.readinto(buffer) == 0
+    assert stream.tell() == 10
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+async def test_streaming_body_readinto_validates_content_length():
+    body = AsyncTrickleIO(b'123456789')
+    stream = response.StreamingBody(body, content_length=10)
+    buffer = bytearray(16)
+    with pytest.raises(IncompleteReadError):
+        await stream.readinto(buffer)
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+async def test_iter_chunks_into():
+    body = AsyncTrickleIO(b'abcdefghij')
+    stream = response.StreamingBody(body, content_length=10)
+    buffer = array.array('H', [0] * 2)
+    chunks = [bytes(chunk) async for chunk in stream.iter_chunks_into(buffer)]
+    assert chunks == [b'abcd', b'efgh', b'ij']
+    assert buffer.tobytes() == b'ijgh'
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+@pytest.mark.parametrize('keepends', [False, True])
+async def test_streaming_line_iterator_matches_splitlines(keepends):
+    data = b'a\rb\r\r\n\n' + b'x' * 5000 + b'\r\nyz\rc'
+    for chunk_size in (1, 2, 3, 7, 1024, 65536):
+        stream = response.StreamingBody(
+            AsyncBytesIO(data), content_length=len(data)
+        )
+        lines = await _tolist(stream.iter_lines(chunk_size, keepends))
+        assert lines == data.splitlines(keepends)
+
+
+_LINES = b''.join(b'%d,line of text\n' % i for i in range(2000))
+
+
+def _deflate(data, wbits):
+    compressor = zlib.compressobj(wbits=wbits)
+    return compressor.compress(data) + compressor.flush()
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    'encoding, data',
+    [
+        ('gzip', gzip.compress(_LINES)),
+        # concatenated gzip members
+        ('gzip', gzip.compress(_LINES[:1000]) + gzip.compress(_LINES[1000:])),
+        ('deflate', _deflate(_LINES, zlib.MAX_WBITS)),
+        ('deflate', _deflate(_LINES, -zlib.MAX_WBITS)),
+        ('identity', _LINES),
+    ],
+)
+async def test_streaming_body_decompressed(encoding, data):
+    stream = response.StreamingBody(
+        AsyncTrickleIO(data), content_length=len(data)
+    )
+    body = stream.decompressed(encoding, chunk_size=100)
+    chunk = await body.read(10)
+    assert 0 < len(chunk) <= 10
+    assert body.tell() < len(data)
+    chunks = [chunk]
+    async for chunk in body.iter_chunks(500):
+        assert len(chunk) <= 500
+        chunks.append(chunk)
+    assert b''.join(chunks) == _LINES
+    assert body.tell() == len(data)
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+async def test_streaming_body_decompressed_lines():
+    data = gzip.compress(_LINES)
+    stream = response.StreamingBody(
+        AsyncBytesIO(data), content_length=len(data)
+    )
+    lines = await _tolist(stream.decompressed('gzip').iter_lines())
+    assert lines == _LINES.splitlines()
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+async def test_streaming_body_decompressed_errors():
+    data = gzip.compress(_LINES)
+    stream = response.StreamingBody(
+        AsyncBytesIO(data[:-10]), content_length=len(data) - 10
+    )
+    with pytest.raises(ResponseStreamingError):
+        await stream.decompressed('gzip').read()
+
+    # the content length is still validated on the compressed bytes
+    stream = response.StreamingBody(
+        AsyncBytesIO(data), content_length=len(data) + 1
+    )
+    with pytest.raises(IncompleteReadError):
+        await stream.decompressed('gzip').read()
+
+    stream = response.StreamingBody(AsyncBytesIO(data), len(data))
+    with pytest.raises(response.UnsupportedContentEncodingError):
+        stream.decompressed('br')
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+async def test_streaming_body_decompressed_zstd():
+    zstandard = pytest.importorskip('zstandard')
+    data = zstandard.ZstdCompressor().compress(_LINES)
+    stream = response.StreamingBody(
+        AsyncTrickleIO(data), content_length=len(data)
+    )
+    assert await stream.decompressed('zstd').read() == _LINES
@@ -0,0 +1,163 @@
+import os
+
+import pytest
+from botocore.exceptions import ClientError, ParamValidationError
+
+from aiobotocore.s3.copy import MultipartCopier
+from tests.s3_stub import StubS3, create_client
+
+_DATA = os.urandom(10 * 1024 + 7)
+_HEADERS = {
+    'content-type': 'text/csv',
+    'cache-control': 'no-cache',
+    'x-amz-meta-owner': 'team',
+    'x-amz-tagging': 'env=prod&tier=gold',
+}
+
+
+@pytest.fixture(autouse=True)
+def small_parts(monkeypatch):
+    # the stub doesn't hold the parts to S3's 5 MiB minimum, keep them small
+    monkeypatch.setattr('aiobotocore.s3._helpers.MIN_PART_SIZE', 1024)
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    'copy_source', [{'Bucket': 'bucket', 'Key': 'source'}, 'bucket/source']
+)
+async def test_multipart_copy(copy_source):
+    stub = StubS3(delay=0.01)
+    stub.put('source', _DATA, _HEADERS)
+    async with create_client(stub) as client:
+        copier = MultipartCopier(client, part_size=1024, max_concurrency=4)
+        response = await copier.copy(
+            copy_source, Bucket='bucket', Key='target', StorageClass='GLACIER'
+        )
+
+    assert response['ETag'] == '"11"'
+    target = stub.objects['target']
+    assert target['Body'] == _DATA
+    assert target['Headers']['content-type'] == 'text/csv'
+    assert target['Headers']['cache-control'] == 'no-cache'
+    assert target['Headers']['x-amz-meta-owner'] == 'team'
+    assert target['Headers']['x-amz-tagging'] == 'env=prod&tier=gold'
+    assert target['Headers']['x-amz-storage-class'] == 'GLACIER'
+    assert stub.requests.count(('UploadPartCopy', 11)) == 1
+    assert 1 < stub.max_in_flight <= 4
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+async def test_multipart_copy_replace_metadata():
+    stub = StubS3()
+    stub.put('source', _DATA, _HEADERS)
+    async with create_client(stub) as client:
+        copier = MultipartCopier(client, part_size=1024)
+        await copier.copy(
+            'bucket/source',
+            Bucket='bucket',
+            Key='target',
+            MetadataDirective='REPLACE',
+            Metadata={'owner': 'other'},
+            TaggingDirective='REPLACE',
+            Tagging='env=dev',
+        )
+
+    headers = stub.objects['target']['Headers']
+    assert 'content-type' not in headers
+    assert headers['x-amz-meta-owner'] == 'other'
+    assert headers['x-amz-tagging'] == 'env=dev'
+    assert ('GetObjectTagging', None) not in stub.requests
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+async def test_multipart_copy_small_object():
+    stub = StubS3()
+    stub.put('source', _DATA, _HEADERS)
+    async with create_client(stub) as client:
+        copier = MultipartCopier(client, part_size=len(_DATA))
+        await copier.copy('bucket/source', Bucket='bucket', Key='target')
+
+    assert stub.requests == [('HeadObject', None), ('CopyObject', None)]
+    assert stub.objects['target']['Body'] == _DATA
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+async def test_multipart_copy_retries_and_aborts(monkeypatch):
+    # no backoff, so part 2 is retried before part 5 fails the copy
+    monkeypatch.setattr('aiobotocore.s3._helpers.random.uniform', min)
+    stub = StubS3(fail={('UploadPartCopy', 2): 1, ('UploadPartCopy', 5): 5})
+    stub.put('source', _DATA)
+    async with create_client(stub) as client:
+        copier = MultipartCopier(client, part_size=1024, max_part_attempts=3)
+        with pytest.raises(ClientError):
+            await copier.copy('bucket/source', Bucket='bucket', Key='target')
+
+    assert stub.requests.count(('UploadPartCopy', 2)) == 2
+    assert stub.requests.count(('UploadPartCopy', 5)) == 3
+    assert stub.aborted == ['upload-1']
+    assert 'target' not in stub.objects
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+async def test_multipart_copy_source_changed():
+    stub = StubS3()
+    stub.put('source', _DATA)
+    copy = stub._copy
+
+    def overwrite_source(key, query, headers):
+        # the source is overwritten once the copy has started
+        stub.put('source', _DATA[::-1])
+        return copy(key, query, headers)
+
+    stub._copy = overwrite_source
+    async with create_client(stub) as client:
+        copier = MultipartCopier(client, part_size=1024)
+        with pytest.raises(ClientError) as e:
+            await copier.copy('bucket/source', Bucket='bucket', Key='target')
+    assert e.value.response['Error']['Code'] == 'PreconditionFailed'
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+async def test_multipart_copy_invalid_args():
+    async with create_client(StubS3()) as client:
+        copier = MultipartCopier(client)
+        with pytest.raises(ParamValidationError):
+            await copier.copy('bucket', Bucket='bucket', Key='target')
+        with pytest.raises(ParamValidationError):
+            await copier.copy(
+                'bucket/source', Bucket='bucket', Key='target', Body=b''
+            )
+    with pytest.raises(ParamValidationError):
+        MultipartCopier(None, part_size=5 * 1024**3 + 1)
+    with pytest.raises(ParamValidationError):
+        MultipartCopier(None, part_size=1023)
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+async def test_multipart_copy_source_too_large(monkeypatch):
+    monkeypatch.setattr('aiobotocore.s3._helpers.MAX_PARTS', 2)
+    stub = StubS3()
+    stub.put('source', _DATA)
+    async with create_client(stub) as client:
+        copier = MultipartCopier(client, part_size=1024)
+        monkeypatch.setattr('aiobotocore.s3._helpers.MAX_PART_SIZE', 1024)
+        with pytest.raises(ParamValidationError):
+            await copier.copy('bucket/source', Bucket='bucket', Key='target')
+    assert stub.requests == [('HeadObject', None)]
+
+
+# NOTE: this doesn't require moto but needs to be marked to run with coverage
+@pytest.mark.moto
+def test_multipart_copy_min_part_size(monkeypatch):
+    # S3's own minimum rather than the small_parts one
+    monkeypatch.undo()
+    with pytest.raises(ParamValidationError):
+        MultipartCopier(None, part_size=5 * 1024**2 - 1)
+    MultipartCopier(None, part_size=5 * 1024**2)
@@ -0,0 +1,134 @@
+import asyncio
+import os
+
+import pytest
+from botocore.exceptions import ClientError, ParamValidationError
+
+from aiobotocore.s3.download import ObjectChangedError, RangedDownloader
+from tests.s3_stub import StubS3, create_client
+
+_DATA = os.urandom(10 * 1024 + 7)
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+@pytest.mark.parametrize('size', [0, 100, 1024, len(_DATA)])
+async def test_download_file(tmp_path, size):
+    stub = StubS3(delay=0.01)
+    etag = stub.put('key', _DATA[:size])
+    path = tmp_path / 'data'
+    async with create_client(stub) as client:
+        downloader = RangedDownloader(
+            client, part_size=1024, max_concurrency=4
+        )
+        head = await downloader.download_file('bucket', 'key', str(path))
+
+    assert head['ETag'] == etag
+    assert path.read_bytes() == _DATA[:size]
+    assert os.listdir(tmp_path) == ['data']
+    gets = [start for op, start in stub.requests if op == 'GetObject']
+    if size > 1024:
+        assert sorted(gets) == list(range(0, size, 1024))
+        assert 1 < stub.max_in_flight <= 4
+    elif size:
+        # a single part is fetched without a Range
+        assert gets == [None]
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+@pytest.mark.parametrize('max_concurrency', [1, 3])
+async def test_download_iter_chunks(max_concurrency):
+    stub = StubS3(delay=lambda size: size / 1e6)
+    stub.put('key', _DATA)
+    async with create_client(stub) as client:
+        downloader = RangedDownloader(
+            client, part_size=1024, max_concurrency=max_concurrency
+        )
+        chunks = []
+        async for chunk in downloader.iter_chunks('bucket', 'key'):
+            # the ranges fetched ahead never exceed the window
+            assert stub.in_flight <= max_concurrency
+            chunks.append(chunk)
+            await asyncio.sleep(0.001)
+
+    assert b''.join(chunks) == _DATA
+    assert stub.max_in_flight == max_concurrency
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+async def test_download_retries_ranges(tmp_path):
+    stub = StubS3(fail={('GetObject', 2048): 2})
+    stub.put('key', _DATA)
+    path = tmp_path / 'data'
+    async with create_client(stub) as client:
+        downloader = RangedDownloader(client, part_size=1024)
+        await downloader.download_file('bucket', 'key', str(path))
+
+    assert path.read_bytes() == _DATA
+    assert stub.requests.count(('GetObject', 2048)) == 3
+    assert stub.requests.count(('GetObject', 3072)) == 1
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+async def test_download_failure_removes_file(tmp_path):
+    stub = StubS3(fail={('GetObject', 2048): 5})
+    stub.put('key', _DATA)
+    async with create_client(stub) as client:
+        downloader = RangedDownloader(
+            client, part_size=1024, max_part_attempts=2
+        )
+        with pytest.raises(ClientError):
+            await downloader.download_file(
+                'bucket', 'key', str(tmp_path / 'data')
+            )
+    assert os.listdir(tmp_path) == []
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+async def test_download_object_changed():
+    stub = StubS3(delay=0.01)
+    stub.put('key', _DATA)
+    async with create_client(stub) as client:
+        downloader = RangedDownloader(client, part_size=1024)
+        chunks = downloader.iter_chunks('bucket', 'key', max_concurrency=1)
+        with pytest.raises(ParamValidationError):
+            await chunks.__anext__()
+
+        downloader = RangedDownloader(
+            client, part_size=1024, max_concurrency=1
+        )
+        chunks = downloader.iter_chunks('bucket', 'key')
+        await chunks.__anext__()
+        stub.put('key', _DATA[::-1])
+        with pytest.raises(ClientError) as e:
+            async for _ in chunks:
+                pass
+        assert e.value.response['Error']['Code'] == 'PreconditionFailed'
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+async def test_download_etag_mismatch():
+    stub = StubS3()
+    stub.put('key', _DATA)
+
+    # a stand-in ignoring If-Match still has the change detected
+    get_object = stub._get_object
+
+    def ignore_if_match(method, key, headers):
+        headers.pop('if-match', None)
+        response = get_object(method, key, headers)
+        if method == 'GET':
+            response[1]['ETag'] = '"other"'
+        return response
+
+    stub._get_object = ignore_if_match
+    async with create_client(stub) as client:
+        downloader = RangedDownloader(client, part_size=1024)
+        with pytest.raises(ObjectChangedError):
+            async for _ in downloader.iter_chunks('bucket', 'key'):
+                pass
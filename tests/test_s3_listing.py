@@ -0,0 +1,191 @@
+import asyncio
+
+import botocore.session
+import pytest
+from botocore.exceptions import ClientError, ParamValidationError
+
+from aiobotocore.paginate import AioPaginator
+from aiobotocore.s3.listing import PartitionedObjectLister
+
+_KEYS = [
+    'a.txt',
+    'b/1',
+    'b/2',
+    'b/c/3',
+    'b0',
+    'c/1',
+    'c/2',
+    'd/e/f/4',
+    'z',
+]
+
+
+class _FakeS3Client:
+    """Serves ``list_objects_v2`` for ``_KEYS`` from memory."""
+
+    def __init__(self, keys=_KEYS, delay=0.001, max_keys=1000):
+        session = botocore.session.get_session()
+        self._model = session.get_service_model('s3').operation_model(
+            'ListObjectsV2'
+        )
+        self._pagination_config = session.get_paginator_model(
+            's3'
+        ).get_paginator('ListObjectsV2')
+        self._keys = sorted(keys)
+        self._delay = delay
+        self._max_keys = max_keys
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def get_paginator(self, operation_name):
+        assert operation_name == 'list_objects_v2'
+        return AioPaginator(
+            self.list_objects_v2, self._pagination_config, self._model
+        )
+
+    async def list_objects_v2(
+        self,
+        Bucket,
+        Prefix='',
+        Delimiter=None,
+        StartAfter='',
+        MaxKeys=1000,
+        ContinuationToken=None,
+    ):
+        if Bucket != 'bucket':
+            raise ClientError(
+                {'Error': {'Code': 'NoSuchBucket'}}, 'ListObjectsV2'
+            )
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self._delay)
+        self.in_flight -= 1
+        after = ContinuationToken or StartAfter
+        contents = []
+        prefixes = []
+        truncated = False
+        for key in self._keys:
+            if not key.startswith(Prefix) or key <= after:
+                continue
+            if len(contents) + len(prefixes) == min(MaxKeys, self._max_keys):
+                truncated = True
+                break
+            index = key.find(Delimiter, len(Prefix)) if Delimiter else -1
+            if index == -1:
+                contents.append({'Key': key})
+                after = key
+            else:
+                prefix = key[: index + len(Delimiter)]
+                prefixes.append({'Prefix': prefix})
+                # skip the rest of the common prefix
+                after = prefix + '\uffff'
+        page = {'IsTruncated': truncated, 'KeyCount': len(contents)}
+        if contents:
+            page['Contents'] = contents
+        if prefixes:
+            page['CommonPrefixes'] = prefixes
+        if truncated:
+            page['NextContinuationToken'] = after
+        return page
+
+
+async def _list_keys(lister):
+    return [obj['Key'] async for obj in lister]
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+@pytest.mark.parametrize('ordered', [False, True])
+@pytest.mark.parametrize('split_depth', [1, 2])
+@pytest.mark.parametrize('max_concurrency', [1, 3])
+async def test_partitioned_listing(ordered, split_depth, max_concurrency):
+    client = _FakeS3Client()
+    lister = PartitionedObjectLister(
+        client,
+        Bucket='bucket',
+        split_depth=split_depth,
+        max_concurrency=max_concurrency,
+        ordered=ordered,
+        page_size=1,
+        buffer_pages=1,
+    )
+    keys = await _list_keys(lister)
+    if ordered:
+        assert keys == _KEYS
+    else:
+        assert sorted(keys) == _KEYS
+    assert client.max_in_flight <= max_concurrency
+    if max_concurrency > 1:
+        assert client.max_in_flight > 1
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+@pytest.mark.parametrize('ordered', [False, True])
+async def test_partitioned_listing_streams_levels(ordered):
+    # a flat key space, the objects are yielded while the level is listed
+    client = _FakeS3Client(
+        keys=['%02d' % i for i in range(20)] + ['x/1'], max_keys=1
+    )
+    lister = PartitionedObjectLister(client, Bucket='bucket', ordered=ordered)
+    objects = lister.__aiter__()
+    assert (await objects.__anext__())['Key'] == '00'
+    assert client.calls <= 2
+    await objects.aclose()
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+@pytest.mark.parametrize('ordered', [False, True])
+async def test_partitioned_listing_split_points(ordered):
+    client = _FakeS3Client()
+    lister = PartitionedObjectLister(
+        client,
+        Bucket='bucket',
+        split_points=['b/', 'b/2', 'c', 'y'],
+        ordered=ordered,
+        page_size=2,
+    )
+    keys = await _list_keys(lister)
+    if ordered:
+        assert keys == _KEYS
+    else:
+        assert sorted(keys) == _KEYS
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+@pytest.mark.parametrize('split_points', [None, ['b/2', 'c/']])
+async def test_partitioned_listing_prefix_start_after(split_points):
+    client = _FakeS3Client()
+    lister = PartitionedObjectLister(
+        client,
+        Bucket='bucket',
+        Prefix='b',
+        StartAfter='b/1',
+        split_points=split_points,
+        ordered=True,
+    )
+    assert await _list_keys(lister) == ['b/2', 'b/c/3', 'b0']
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+async def test_partitioned_listing_error():
+    lister = PartitionedObjectLister(
+        _FakeS3Client(), Bucket='missing-bucket', split_points=['m']
+    )
+    with pytest.raises(ClientError):
+        await _list_keys(lister)
+
+
+@pytest.mark.moto
+def test_partitioned_listing_invalid_params():
+    with pytest.raises(ParamValidationError):
+        PartitionedObjectLister(None, Bucket='bucket', Delimiter='/')
+    with pytest.raises(ParamValidationError):
+        PartitionedObjectLister(None, Bucket='bucket', split_points=['b', 'a'])
+    with pytest.raises(ParamValidationError):
+        PartitionedObjectLister(None, Bucket='bucket', max_concurrency=0)
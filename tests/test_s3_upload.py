@@ -0,0 +1,212 @@
+import asyncio
+import io
+import os
+
+import pytest
+from botocore.exceptions import ClientError, ParamValidationError
+
+from aiobotocore.s3.upload import MultipartUploader
+from tests.s3_stub import StubS3, create_client
+
+_DATA = os.urandom(10 * 1024 + 7)
+
+
+@pytest.fixture(autouse=True)
+def small_parts(monkeypatch):
+    # the stub doesn't hold the parts to S3's 5 MiB minimum, keep them small
+    monkeypatch.setattr('aiobotocore.s3._helpers.MIN_PART_SIZE', 1024)
+
+
+async def _async_chunks(data, size=1000):
+    for i in range(0, len(data), size):
+        yield data[i : i + size]
+
+
+class _AsyncFile:
+    def __init__(self, data):
+        self._file = io.BytesIO(data)
+
+    async def read(self, size=-1):
+        # short reads, like a socket
+        return self._file.read(min(size, 999))
+
+
+@pytest.fixture(params=['bytes', 'path', 'file', 'async_file', 'async_iter'])
+def source(request, tmp_path):
+    if request.param == 'bytes':
+        return _DATA
+    if request.param == 'path':
+        path = tmp_path / 'data'
+        path.write_bytes(_DATA)
+        return str(path)
+    if request.param == 'file':
+        return io.BytesIO(_DATA)
+    if request.param == 'async_file':
+        return _AsyncFile(_DATA)
+    return _async_chunks(_DATA)
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+@pytest.mark.parametrize('checksum_algorithm', ['CRC32', None])
+async def test_multipart_upload(source, checksum_algorithm):
+    stub = StubS3(delay=0.01)
+    async with create_client(stub) as client:
+        uploader = MultipartUploader(
+            client,
+            part_size=1024,
+            max_concurrency=4,
+            checksum_algorithm=checksum_algorithm,
+        )
+        response = await uploader.upload(
+            source,
+            Bucket='bucket',
+            Key='key',
+            ContentType='text/plain',
+            Metadata={'a': 'b'},
+        )
+
+    assert response['ETag'] == '"11"'
+    assert stub.objects['key']['Body'] == _DATA
+    headers = stub.objects['key']['Headers']
+    assert headers['content-type'] == 'text/plain'
+    assert headers['x-amz-meta-a'] == 'b'
+    assert stub.completed[0]['Checksums'] == [bool(checksum_algorithm)] * 11
+    assert 1 < stub.max_in_flight <= 4
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+async def test_multipart_upload_memory_budget():
+    stub = StubS3(delay=0.01)
+    async with create_client(stub) as client:
+        uploader = MultipartUploader(
+            client, part_size=1024, max_concurrency=8, max_memory=2048
+        )
+        await uploader.upload(_DATA, Bucket='bucket', Key='key')
+    assert stub.objects['key']['Body'] == _DATA
+    assert stub.max_in_flight == 2
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+async def test_multipart_upload_small_source():
+    stub = StubS3()
+    async with create_client(stub) as client:
+        uploader = MultipartUploader(client, part_size=len(_DATA) + 1)
+        await uploader.upload(_DATA, Bucket='bucket', Key='key')
+    assert stub.requests == [('PutObject', None)]
+    assert stub.objects['key']['Body'] == _DATA
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+async def test_multipart_upload_retries_parts():
+    stub = StubS3(fail={('UploadPart', 3): 2})
+    async with create_client(stub) as client:
+        uploader = MultipartUploader(client, part_size=1024)
+        await uploader.upload(_DATA, Bucket='bucket', Key='key')
+    assert stub.objects['key']['Body'] == _DATA
+    assert stub.requests.count(('UploadPart', 3)) == 3
+    assert stub.requests.count(('UploadPart', 4)) == 1
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+async def test_multipart_upload_aborts():
+    stub = StubS3(fail={('UploadPart', 3): 5})
+    async with create_client(stub) as client:
+        uploader = MultipartUploader(
+            client, part_size=1024, max_part_attempts=2
+        )
+        with pytest.raises(ClientError):
+            await uploader.upload(_DATA, Bucket='bucket', Key='key')
+    assert stub.aborted == ['upload-1']
+    assert 'key' not in stub.objects
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+async def test_multipart_upload_cancelled():
+    stub = StubS3(delay=0.05)
+    async with create_client(stub) as client:
+        uploader = MultipartUploader(client, part_size=1024)
+        task = asyncio.ensure_future(
+            uploader.upload(_DATA, Bucket='bucket', Key='key')
+        )
+        await asyncio.sleep(0.07)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+    assert stub.aborted == ['upload-1']
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+async def test_multipart_upload_unknown_size_grows_parts(monkeypatch):
+    monkeypatch.setattr(
+        'aiobotocore.s3.upload._PART_SIZE_DOUBLING_INTERVAL', 2
+    )
+    stub = StubS3()
+    async with create_client(stub) as client:
+        uploader = MultipartUploader(client, part_size=1024)
+        await uploader.upload(_async_chunks(_DATA), Bucket='bucket', Key='key')
+    assert stub.objects['key']['Body'] == _DATA
+    # 1024, 1024, 2048, 2048, 4096 and the remaining 7 bytes
+    assert stub.requests.count(('UploadPart', 6)) == 1
+    assert ('UploadPart', 7) not in stub.requests
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+async def test_multipart_upload_too_many_parts(monkeypatch):
+    monkeypatch.setattr('aiobotocore.s3.upload.MAX_PARTS', 3)
+    stub = StubS3()
+    async with create_client(stub) as client:
+        uploader = MultipartUploader(client, part_size=1024)
+        with pytest.raises(ParamValidationError):
+            await uploader.upload(
+                _async_chunks(_DATA), Bucket='bucket', Key='key'
+            )
+    assert ('UploadPart', 4) not in stub.requests
+    assert stub.aborted == ['upload-1']
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+async def test_multipart_upload_invalid_args():
+    async with create_client(StubS3()) as client:
+        uploader = MultipartUploader(client)
+        with pytest.raises(ParamValidationError):
+            await uploader.upload(
+                _DATA, Bucket='bucket', Key='key', ContentMD5='x'
+            )
+        with pytest.raises(ParamValidationError):
+            await uploader.upload(object(), Bucket='bucket', Key='key')
+    with pytest.raises(ParamValidationError):
+        MultipartUploader(None, part_size=6 * 1024**3)
+    with pytest.raises(ParamValidationError):
+        MultipartUploader(None, part_size=1023)
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+async def test_multipart_upload_source_too_large(monkeypatch):
+    monkeypatch.setattr('aiobotocore.s3._helpers.MAX_PARTS', 3)
+    monkeypatch.setattr('aiobotocore.s3._helpers.MAX_PART_SIZE', 2048)
+    stub = StubS3()
+    async with create_client(stub) as client:
+        uploader = MultipartUploader(client, part_size=1024)
+        with pytest.raises(ParamValidationError):
+            await uploader.upload(_DATA, Bucket='bucket', Key='key')
+    assert stub.requests == []
+
+
+# NOTE: this doesn't require moto but needs to be marked to run with coverage
+@pytest.mark.moto
+def test_multipart_upload_min_part_size(monkeypatch):
+    # S3's own minimum rather than the small_parts one
+    monkeypatch.undo()
+    with pytest.raises(ParamValidationError):
+        MultipartUploader(None, part_size=5 * 1024**2 - 1)
+    MultipartUploader(None, part_size=5 * 1024**2)
@@ -1,11 +1,28 @@
+import asyncio
+import builtins
+import datetime
+import gc
 import logging
+import os
+import threading
+import time
 
+import botocore
 import pytest
 from _pytest.logging import LogCaptureFixture
+from botocore.configloader import raw_config_parse
+from botocore.exceptions import DataNotFoundError
+from dateutil.tz import tzutc
 
 from aiobotocore import httpsession
 from aiobotocore.config import AioConfig
+from aiobotocore.configloader import parse_config_file
+from aiobotocore.credentials import (
+    AioCredentialResolver,
+    AioRefreshableCredentials,
+)
 from aiobotocore.session import AioSession
+from tests.mock_server import AIOServer
 
 
 @pytest.mark.moto
@@ -53,3 +70,296 @@ async def test_retry(
             await client.get_object(Bucket='foo', Key='bar')
 
         assert 'sleeping for' in caplog.text
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+async def test_shared_transports():
+    session = AioSession(shared_transports=True)
+    kwargs = dict(aws_secret_access_key="xxx", aws_access_key_id="xxx")
+
+    async with session.create_client(
+        's3', region_name='us-east-1', **kwargs
+    ) as s3, session.create_client(
+        'sqs', region_name='eu-west-1', **kwargs
+    ) as sqs, session.create_client(
+        's3', region_name='us-east-1', verify=False, **kwargs
+    ) as s3_no_verify:
+        s3_http = s3._endpoint.http_session
+        sqs_http = sqs._endpoint.http_session
+        assert s3_http._session is sqs_http._session
+        assert s3_http._connector is sqs_http._connector
+        assert (
+            s3_no_verify._endpoint.http_session._session
+            is not s3_http._session
+        )
+        assert len(session._transport_registry) == 2
+
+        shared_session = s3_http._session
+
+    assert shared_session.closed
+    assert len(session._transport_registry) == 0
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+async def test_shared_transports_pool_limit():
+    session = AioSession(shared_transports=True)
+    config = AioConfig(max_pool_connections=2)
+
+    async with session.create_client(
+        's3',
+        region_name='us-east-1',
+        config=config,
+        aws_secret_access_key="xxx",
+        aws_access_key_id="xxx",
+    ) as s3:
+        http_session = s3._endpoint.http_session
+        # the shared connector is only limited by each client's sub-limit
+        assert http_session._connector.limit == 0
+        assert http_session._pool_slots._value == 2
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+async def test_request_timing():
+    session = AioSession()
+    config = AioConfig(request_timing=True)
+    timings = []
+
+    def handler(timing, context, **kwargs):
+        timings.append(timing)
+
+    session.register('request-timing.dynamodb.ListTables', handler)
+
+    async with AIOServer() as server, session.create_client(
+        'dynamodb',
+        region_name='us-east-1',
+        config=config,
+        # the mock server answers POST /ok with an empty 200
+        endpoint_url=server.endpoint_url + '/ok',
+        aws_secret_access_key="xxx",
+        aws_access_key_id="xxx",
+    ) as client:
+        for _ in range(2):
+            response = await client.list_tables()
+
+    assert len(timings) == 2
+    first, second = timings
+    assert response['ResponseMetadata']['Timing'] is second
+    for timing in timings:
+        assert timing['total'] >= timing['time_to_first_byte'] > 0
+        assert 'body' in timing
+    assert not first['connection_reused'] and first['connect'] > 0
+    assert second['connection_reused'] and second['connect'] == 0
+
+
+class _RefreshingProvider:
+    METHOD = 'refreshing'
+
+    def __init__(self, lifetimes):
+        self.lifetimes = lifetimes
+        self.calls = 0
+
+    async def load(self):
+        return AioRefreshableCredentials.create_from_metadata(
+            await self.fetch(), self.fetch, self.METHOD
+        )
+
+    async def fetch(self):
+        self.calls += 1
+        expiry_time = datetime.datetime.now(tzutc()) + datetime.timedelta(
+            seconds=self.lifetimes.pop(0)
+        )
+        return {
+            'access_key': 'key%s' % self.calls,
+            'secret_key': 'secret',
+            'token': 'token',
+            'expiry_time': expiry_time.isoformat(),
+        }
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+async def test_background_credential_refresh(monkeypatch):
+    # the credentials expire within the largest refresh jitter
+    monkeypatch.setattr('aiobotocore.credentials.random.uniform', max)
+    provider = _RefreshingProvider([950, 3600])
+
+    async with AioSession(background_credential_refresh=True) as session:
+        session._components.register_component(
+            'credential_provider', AioCredentialResolver([provider])
+        )
+        credentials = await session.get_credentials()
+        # in the advisory window, requests leave the refresh to the refresher
+        frozen = await credentials.get_frozen_credentials()
+        assert frozen.access_key == 'key1'
+        assert provider.calls == 1
+
+        for _ in range(10):
+            await asyncio.sleep(0)
+        assert provider.calls == 2
+        frozen = await credentials.get_frozen_credentials()
+        assert frozen.access_key == 'key2'
+
+        task = session._credential_refresher._task
+        assert not task.done()
+
+    assert task.cancelled()
+    assert credentials._background_refresher is None
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+async def test_create_client_does_not_block_loop(tmp_path, monkeypatch):
+    config_file = tmp_path / 'config'
+    config_file.write_text('[profile tenant]\nregion = eu-west-1\n')
+    credentials_file = tmp_path / 'credentials'
+    credentials_file.write_text(
+        '[tenant]\naws_access_key_id = foo\naws_secret_access_key = bar\n'
+    )
+    monkeypatch.setenv('AWS_CONFIG_FILE', str(config_file))
+    monkeypatch.setenv('AWS_SHARED_CREDENTIALS_FILE', str(credentials_file))
+
+    loop_reads = []
+    data_paths = (str(tmp_path), botocore.BOTOCORE_ROOT)
+    open_ = builtins.open
+
+    def recording_open(file, *args, **kwargs):
+        if threading.current_thread() is threading.main_thread() and str(
+            file
+        ).startswith(data_paths):
+            loop_reads.append(file)
+        return open_(file, *args, **kwargs)
+
+    stalls = []
+
+    async def ticker():
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(0)
+            stalls.append(time.perf_counter() - start)
+
+    monkeypatch.setattr(builtins, 'open', recording_open)
+    # collecting the garbage of earlier tests would stall the loop as well
+    gc.collect()
+    gc.disable()
+    try:
+        ticker_task = asyncio.get_running_loop().create_task(ticker())
+        await asyncio.sleep(0)
+        start = time.perf_counter()
+        session = AioSession(profile='tenant')
+        async with session.create_client('dynamodb') as client:
+            elapsed = time.perf_counter() - start
+            signer = client._request_signer
+            credentials = await signer._credentials.get_frozen_credentials()
+        ticker_task.cancel()
+    finally:
+        gc.enable()
+
+    assert client.meta.region_name == 'eu-west-1'
+    assert credentials.access_key == 'foo'
+    assert loop_reads == []
+    # parsing in the executor still holds the GIL, but the loop is no longer
+    # blocked for the whole creation of the client
+    assert max(stalls) < elapsed / 2
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+async def test_parse_config_file_same_size_rewrite(tmp_path):
+    config_file = tmp_path / 'config'
+    config_file.write_text('[default]\nregion = us-east-1\n')
+    stat = os.stat(config_file)
+    config = await parse_config_file(raw_config_parse, str(config_file))
+    assert config['default']['region'] == 'us-east-1'
+
+    # a rewrite of the same size within one tick of the modification time
+    config_file.write_text('[default]\nregion = eu-west-1\n')
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    config = await parse_config_file(raw_config_parse, str(config_file))
+    assert config['default']['region'] == 'eu-west-1'
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+async def test_cache_service_models():
+    async def create_client(session):
+        async with session.create_client(
+            'dynamodb',
+            region_name='us-east-1',
+            aws_access_key_id='xxx',
+            aws_secret_access_key='xxx',
+        ) as client:
+            return client
+
+    client1 = await create_client(AioSession(cache_service_models=True))
+    client2 = await create_client(AioSession(cache_service_models=True))
+    assert type(client1) is type(client2)
+    assert client1.meta.service_model is client2.meta.service_model
+
+    uncached = await create_client(AioSession())
+    assert type(uncached) is not type(client1)
+    assert uncached.meta.service_model is not client1.meta.service_model
+
+    # sessions customizing the class get a class of their own
+    class Mixin:
+        pass
+
+    def add_mixin(base_classes, **kwargs):
+        base_classes.insert(0, Mixin)
+
+    session = AioSession(cache_service_models=True)
+    session.register('creating-client-class.dynamodb', add_mixin)
+    customized = await create_client(session)
+    assert isinstance(customized, Mixin)
+    assert not isinstance(client1, Mixin)
+    assert customized.meta.service_model is client1.meta.service_model
+    assert type(await create_client(session)) is type(customized)
+
+
+@pytest.mark.moto
+@pytest.mark.asyncio
+async def test_cache_service_models_session_isolation(tmp_path):
+    async def create_client(session):
+        async with session.create_client(
+            'dynamodb',
+            region_name='us-east-1',
+            aws_access_key_id='xxx',
+            aws_secret_access_key='xxx',
+        ) as client:
+            return client
+
+    session1 = AioSession(cache_service_models=True)
+    session2 = AioSession(cache_service_models=True)
+    loader1 = session1.get_component('data_loader')
+    loader2 = session2.get_component('data_loader')
+    assert loader1 is not loader2
+    defaults = loader2.load_data('sdk-default-configuration')
+    assert loader1.load_data('sdk-default-configuration') is defaults
+
+    # data paths added to one session are not searched by the others
+    (tmp_path / 'custom.json').write_text('{"a": 1}')
+    loader1.search_paths.append(str(tmp_path))
+    assert str(tmp_path) not in loader2.search_paths
+    assert loader1.load_data('custom') == {'a': 1}
+    with pytest.raises(DataNotFoundError):
+        loader2.load_data('custom')
+    assert loader1.load_data('sdk-default-configuration') == defaults
+    client1 = await create_client(session1)
+    client2 = await create_client(session2)
+    assert client1.meta.service_model is not client2.meta.service_model
+
+    # classes customized by a session are not handed to other sessions
+    class Mixin:
+        pass
+
+    def add_mixin(base_classes, **kwargs):
+        base_classes.insert(0, Mixin)
+
+    session3 = AioSession(cache_service_models=True)
+    session3.register('creating-client-class.dynamodb', add_mixin)
+    assert isinstance(await create_client(session3), Mixin)
+    client = await create_client(AioSession(cache_service_models=True))
+    assert type(client) is type(client2)
+    assert not isinstance(client, Mixin)